@@ -0,0 +1,9 @@
+"""Offline endpoint benchmarks.
+
+Seeds a database with synthetic salaries at several sizes and drives the
+API in-process through its ASGI interface, reporting latency percentiles,
+throughput and SQL statements per request as JSON:
+
+    python -m benchmarks --sizes 10000,100000,1000000 --out results.json
+    python -m benchmarks.compare before.json after.json
+"""
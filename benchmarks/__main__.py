@@ -0,0 +1,98 @@
+"""Run the endpoint benchmarks at several database sizes.
+
+Each size gets its own SQLite file under --workdir (kept between runs, so
+only the first run pays for seeding) and its own child process, because
+the app binds its engine and warms its caches at import time. Pass
+--database-url to benchmark an existing database (e.g. a local Postgres)
+instead; it is topped up to each size in turn.
+
+--columnar serves the stats endpoints from the in-memory column store;
+diff a run with and without it using `python -m benchmarks.compare`.
+
+Endpoints behind a result cache are reported twice: `<name>` with the
+caches dropped before each request and `<name>_cached` with them warm.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+from benchmarks.runner import DEFAULT_REQUESTS, DEFAULT_WARMUP
+
+DEFAULT_SIZES = "10000,100000,1000000"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the API endpoints")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated salary counts")
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS,
+                        help="Timed requests per scenario")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--only", help="Comma-separated scenario names")
+    parser.add_argument("--workdir", default=os.path.join(ROOT, ".benchmarks"))
+    parser.add_argument("--database-url", help="Benchmark this database instead of SQLite files")
+    parser.add_argument("--async-db", action="store_true", help="Run with USE_ASYNC_DB=true")
+    parser.add_argument("--columnar", action="store_true", help="Run with COLUMNAR_STATS=true")
+    parser.add_argument("--out", default="-", help="JSON output file (default stdout)")
+    args = parser.parse_args()
+
+    os.makedirs(args.workdir, exist_ok=True)
+    results = {
+        "meta": {
+            "started": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "async_db": args.async_db,
+            "columnar": args.columnar,
+            "database": "custom" if args.database_url else "sqlite",
+        },
+        "sizes": {},
+    }
+
+    for size in (int(s) for s in args.sizes.split(",")):
+        url = args.database_url or f"sqlite:///{os.path.join(args.workdir, f'salaries_{size}.db')}"
+        env = dict(os.environ, DATABASE_URL=url, USE_ASYNC_DB=str(args.async_db).lower(),
+                   COLUMNAR_STATS=str(args.columnar).lower())
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as out:
+            out_path = out.name
+        command = [
+            sys.executable, "-m", "benchmarks.runner", "--size", str(size),
+            "--requests", str(args.requests), "--warmup", str(args.warmup), "--out", out_path,
+        ]
+        if args.only:
+            command += ["--only", args.only]
+        print(f"⏱️  Benchmarking {size} salaries...", file=sys.stderr)
+        # Child output (seeding progress) goes to stderr, keeping stdout for JSON
+        subprocess.run(command, cwd=ROOT, env=env, check=True, stdout=sys.stderr)
+        with open(out_path) as f:
+            results["sizes"][str(size)] = json.load(f)
+        os.unlink(out_path)
+
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.out == "-":
+        print(output)
+    else:
+        with open(args.out, "w") as f:
+            f.write(output + "\n")
+        print(f"✅ Results written to {args.out}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
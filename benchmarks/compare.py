@@ -0,0 +1,40 @@
+"""Compare two benchmark result files.
+
+    python -m benchmarks.compare before.json after.json [--metric p95_ms]
+
+Prints, per size and scenario, the metric in both runs and the relative
+change, plus any change in statements per request.
+"""
+import argparse
+import json
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff two benchmark result files")
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--metric", default="p50_ms")
+    args = parser.parse_args()
+
+    with open(args.before) as f:
+        before = json.load(f)["sizes"]
+    with open(args.after) as f:
+        after = json.load(f)["sizes"]
+
+    for size in sorted(set(before) & set(after), key=int):
+        print(f"\n📊 {size} salaries ({args.metric})")
+        old_endpoints = before[size]["endpoints"]
+        new_endpoints = after[size]["endpoints"]
+        for name in sorted(set(old_endpoints) & set(new_endpoints)):
+            old, new = old_endpoints[name], new_endpoints[name]
+            change = (new[args.metric] - old[args.metric]) / old[args.metric] * 100 \
+                if old[args.metric] else 0.0
+            line = f"  {name:30} {old[args.metric]:10.2f} → {new[args.metric]:10.2f}  {change:+7.1f}%"
+            if old["statements_per_request"] != new["statements_per_request"]:
+                line += (f"  (SQL {old['statements_per_request']:g} → "
+                         f"{new['statements_per_request']:g})")
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
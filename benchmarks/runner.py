@@ -0,0 +1,265 @@
+"""Benchmark one database size in this process.
+
+Run by `python -m benchmarks` once per size, with DATABASE_URL already
+pointing at that size's database (the app binds its engine at import).
+Seeds the database up to `--size` salaries, runs every scenario through
+the ASGI app and writes the result as JSON to `--out`.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import re
+import time
+from collections import Counter
+
+import httpx
+from fastapi.routing import APIRoute
+from sqlalchemy import event, select, func
+
+from benchmarks.scenarios import SCENARIOS
+
+DEFAULT_REQUESTS = 200
+DEFAULT_WARMUP = 5
+SEED = 42
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    return sorted_values[max(0, math.ceil(q * len(sorted_values)) - 1)]
+
+
+def seed_database(size):
+    """Create the schema and top the salaries table up to `size` rows"""
+    from src.database.database import Base, engine, SessionLocal
+    from src.database.search_index import ensure_search_indexes
+    from src.models import (  # noqa: F401
+        company, location, role, salary, salary_rollup, salary_experience_rollup
+    )
+    from src.models.company import Company
+    from src.models.salary import Salary
+    from src.scrapers.data_generator import SalaryDataGenerator
+    from src.scrapers.vectorized_generator import VectorizedSalaryGenerator
+
+    Base.metadata.create_all(bind=engine)
+    ensure_search_indexes(engine)
+
+    db = SessionLocal()
+    try:
+        if not db.execute(select(func.count(Company.id))).scalar():
+            dimensions = SalaryDataGenerator()
+            dimensions.add_companies()
+            dimensions.add_locations()
+            dimensions.add_roles()
+            dimensions.close()
+        existing = db.execute(select(func.count(Salary.id))).scalar()
+        if existing >= size:
+            return 0.0
+        start = time.perf_counter()
+        VectorizedSalaryGenerator(db, seed=SEED + existing).generate(size - existing)
+        return time.perf_counter() - start
+    finally:
+        db.close()
+
+
+def fixture_values():
+    """Placeholder values for the scenarios, taken from the busiest groups"""
+    from src.database.database import SessionLocal
+    from src.models.company import Company
+    from src.models.location import Location
+    from src.models.role import Role
+    from src.models.salary import Salary
+
+    db = SessionLocal()
+    try:
+        def busiest(model, column, foreign_key, limit=1):
+            return db.execute(
+                select(model.id, column)
+                .join(Salary, foreign_key == model.id)
+                .group_by(model.id, column)
+                .order_by(func.count(Salary.id).desc())
+                .limit(limit)
+            ).all()
+
+        top_companies = busiest(Company, Company.name, Salary.company_id, limit=3)
+        company_id, company = top_companies[0]
+        (role_id, role), = busiest(Role, Role.title, Salary.role_id)
+        (location_id, city), = busiest(Location, Location.city, Salary.location_id)
+        salary_id = db.execute(select(func.max(Salary.id))).scalar() // 2 or 1
+    finally:
+        db.close()
+    return {
+        "company": company, "company_id": company_id, "company_prefix": company[:3],
+        "companies": ",".join(name for _, name in top_companies),
+        "role": role, "role_id": role_id,
+        "city": city, "location_id": location_id,
+        "salary_id": salary_id,
+    }
+
+
+def fill(value, values):
+    """Substitute {placeholders}; a lone "{name}" keeps the value's type"""
+    if isinstance(value, dict):
+        return {k: fill(v, values) for k, v in value.items()}
+    if isinstance(value, list):
+        return [fill(v, values) for v in value]
+    if isinstance(value, str):
+        if value.startswith("{") and value.endswith("}") and value[1:-1] in values:
+            return values[value[1:-1]]
+        return value.format(**values)
+    return value
+
+
+class StatementCounter:
+    """Counts SQL statements executed on the app's engines"""
+
+    def __init__(self, engines):
+        self.count = 0
+        for engine in engines:
+            event.listen(engine, "before_cursor_execute", self._count)
+
+    def _count(self, *args):
+        self.count += 1
+
+
+async def run_scenario(client, counter, scenario, values, requests, warmup, before_request=None):
+    """Latency, throughput and statement counts for one scenario.
+
+    `before_request()` runs, untimed, before every request.
+    """
+    requests = min(requests, scenario.get("max_requests", requests))
+    n = 0
+
+    def build():
+        nonlocal n
+        n += 1
+        filled = dict(values, n=f"{os.getpid()}-{n}")
+        return {
+            "method": scenario["method"],
+            "url": fill(scenario["path"], filled),
+            "params": fill(scenario.get("params"), filled),
+            "json": fill(scenario.get("json"), filled),
+        }
+
+    for _ in range(min(warmup, requests)):
+        if before_request:
+            before_request()
+        await client.request(**build())
+
+    latencies = []
+    statements = []
+    statuses = Counter()
+    started = time.perf_counter()
+    for _ in range(requests):
+        request = build()
+        if before_request:
+            before_request()
+        before = counter.count
+        start = time.perf_counter()
+        response = await client.request(**request)
+        latencies.append((time.perf_counter() - start) * 1000)
+        statements.append(counter.count - before)
+        statuses[str(response.status_code)] += 1
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "method": scenario["method"],
+        "path": scenario["path"],
+        "requests": requests,
+        "status": dict(statuses),
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p95_ms": round(percentile(latencies, 0.95), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+        "mean_ms": round(sum(latencies) / len(latencies), 3),
+        "max_ms": round(latencies[-1], 3),
+        "throughput_rps": round(requests / elapsed, 1),
+        "statements_per_request": round(sum(statements) / len(statements), 2),
+        "max_statements": max(statements),
+    }
+
+
+def expand_cached(scenarios):
+    """Split "cached" scenarios into a cold run and a `<name>_cached` run"""
+    expanded = []
+    for scenario in scenarios:
+        if scenario.get("cached"):
+            expanded.append(dict(scenario, cache="cold"))
+            expanded.append(dict(scenario, name=scenario["name"] + "_cached", cache="warm"))
+        else:
+            expanded.append(scenario)
+    return expanded
+
+
+def _route_shape(path):
+    return re.sub(r"\{[^}]*\}", "{}", path)
+
+
+def uncovered_routes(app):
+    """App routes that no scenario exercises"""
+    covered = {(s["method"], _route_shape(s["path"])) for s in SCENARIOS}
+    missing = []
+    for route in app.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        for method in route.methods:
+            if (method, _route_shape(route.path)) not in covered:
+                missing.append(f"{method} {route.path}")
+    return sorted(missing)
+
+
+async def run_benchmarks(requests, warmup, only=None):
+    from src.api.main import app
+    from src.cache.data_version import bump_data_version
+    from src.database.database import engine, async_engine
+
+    engines = [engine] + ([async_engine.sync_engine] if async_engine is not None else [])
+    counter = StatementCounter(engines)
+    values = fixture_values()
+
+    scenarios = [s for s in expand_cached(SCENARIOS) if not only or s["name"] in only]
+    # Reads first: writes invalidate the caches the reads warm
+    scenarios.sort(key=lambda s: s.get("writes", False))
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            for scenario in scenarios:
+                # A version bump empties the result caches and the summary
+                cold = scenario.get("cache") == "cold"
+                results[scenario["name"]] = await run_scenario(
+                    client, counter, scenario, values, requests, warmup,
+                    before_request=bump_data_version if cold else None
+                )
+                if "cache" in scenario:
+                    results[scenario["name"]]["cache"] = scenario["cache"]
+    return results, uncovered_routes(app)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, required=True)
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--only", help="Comma-separated scenario names")
+    parser.add_argument("--out", required=True)
+    args = parser.parse_args()
+
+    seed_seconds = seed_database(args.size)
+    only = set(args.only.split(",")) if args.only else None
+    endpoints, uncovered = asyncio.run(run_benchmarks(args.requests, args.warmup, only))
+    with open(args.out, "w") as f:
+        json.dump({
+            "size": args.size,
+            "seed_seconds": round(seed_seconds, 2),
+            "endpoints": endpoints,
+            "uncovered_routes": uncovered,
+        }, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Requests the benchmark sends, one scenario per endpoint use.
+
+Strings may contain `{placeholders}` filled from the seeded database
+(`company`, `companies`, `city`, `role`, `salary_id`, `company_id`, `role_id`,
+`location_id`) and `{n}`, a per-request counter for unique names.
+Scenarios that write run after all reads.
+
+Endpoints behind a result cache (search, stats, summary) are marked
+`"cached": True`. They run twice: under their own name with the caches
+dropped before every request, so each request runs its SQL, and as
+`<name>_cached` with the caches left warm.
+"""
+
+SALARY_BODY = {
+    "company_id": "{company_id}",
+    "role_id": "{role_id}",
+    "location_id": "{location_id}",
+    "base_salary": 1800000,
+    "bonus": 200000,
+    "stock_options": 0,
+    "total_compensation": 2000000,
+    "years_of_experience": 4
+}
+
+SCENARIOS = [
+    # Pages
+    {"name": "home_page", "method": "GET", "path": "/"},
+    {"name": "submit_page", "method": "GET", "path": "/submit"},
+
+    # Listings
+    {"name": "health", "method": "GET", "path": "/api/health"},
+    {"name": "companies", "method": "GET", "path": "/api/companies"},
+    {"name": "locations", "method": "GET", "path": "/api/locations"},
+    {"name": "roles", "method": "GET", "path": "/api/roles"},
+    {"name": "salaries", "method": "GET", "path": "/api/salaries", "params": {"limit": 100}},
+    {"name": "salary_detail", "method": "GET", "path": "/api/salaries/{salary_id}"},
+    {"name": "salaries_by_company", "method": "GET",
+     "path": "/api/salaries/by-company/{company}", "params": {"limit": 50}},
+    {"name": "salaries_by_location", "method": "GET",
+     "path": "/api/salaries/by-location/{city}", "params": {"limit": 50}},
+    # Streams the whole table: a few requests are enough
+    {"name": "salaries_stream", "method": "GET", "path": "/api/salaries/stream",
+     "params": {"format": "ndjson"}, "max_requests": 3},
+
+    # Search
+    {"name": "search_company", "method": "GET", "path": "/api/search/salaries",
+     "params": {"company": "{company}", "limit": 50}, "cached": True},
+    {"name": "search_role_city", "method": "GET", "path": "/api/search/salaries",
+     "params": {"role": "{role}", "city": "{city}", "min_salary": 1000000, "limit": 50},
+     "cached": True},
+    {"name": "search_sorted_total", "method": "GET", "path": "/api/search/salaries",
+     "params": {"min_experience": 3, "sort": "total_compensation", "order": "desc",
+                "total": "estimate", "limit": 50}, "cached": True},
+    {"name": "search_facets", "method": "GET", "path": "/api/search/salaries",
+     "params": {"city": "{city}", "min_experience": 3, "facets": "true", "limit": 50},
+     "cached": True},
+    {"name": "suggest", "method": "GET", "path": "/api/suggest",
+     "params": {"kind": "company", "q": "{company_prefix}"}},
+
+    # Statistics
+    {"name": "stats_salary_range", "method": "GET", "path": "/api/stats/salary-range",
+     "params": {"role": "{role}"}},
+    {"name": "stats_salary_range_grouped", "method": "GET", "path": "/api/stats/salary-range",
+     "params": {"group_by": "company"}},
+    {"name": "stats_histogram", "method": "GET", "path": "/api/stats/histogram",
+     "params": {"city": "{city}", "bins": 30}},
+    {"name": "stats_experience_curve", "method": "GET", "path": "/api/stats/experience-curve",
+     "params": {"role": "{role}"}, "cached": True},
+    {"name": "compare_companies", "method": "GET", "path": "/api/compare",
+     "params": {"companies": "{companies}"}, "cached": True},
+    {"name": "stats_summary", "method": "GET", "path": "/api/stats/summary", "cached": True},
+    {"name": "stats_aggregates", "method": "GET", "path": "/api/stats/aggregates",
+     "params": {"group_by": "city"}},
+
+    # Internal
+    {"name": "internal_cache", "method": "GET", "path": "/api/internal/cache"},
+    {"name": "internal_pool", "method": "GET", "path": "/api/internal/pool"},
+
+    # Writes
+    {"name": "submit_salary", "method": "POST", "path": "/api/salaries/submit",
+     "json": SALARY_BODY, "writes": True},
+    {"name": "submit_salary_batch", "method": "POST", "path": "/api/salaries/submit/batch",
+     "json": [SALARY_BODY] * 100, "writes": True, "max_requests": 20},
+    {"name": "add_company", "method": "POST", "path": "/api/companies/add",
+     "params": {"name": "Benchmark Company {n}"}, "writes": True},
+    {"name": "add_location", "method": "POST", "path": "/api/locations/add",
+     "params": {"city": "Benchmark City {n}", "state": "Karnataka"}, "writes": True},
+    {"name": "add_role", "method": "POST", "path": "/api/roles/add",
+     "params": {"title": "Benchmark Role {n}", "level": "Mid"}, "writes": True},
+]
@@ -4,7 +4,6 @@ from src.database.database import SessionLocal
 from src.models.salary import Salary
 from src.models.company import Company
 from src.models.role import Role
-from src.models.location import Location
 
 db = SessionLocal()
 
@@ -23,13 +22,15 @@ print()
 print('📋 SAMPLE ENTRIES:')
 print('=' * 70)
 
-salaries = db.query(Salary).limit(10).all()
+samples = (
+    db.query(Salary, Company.name, Role.title, Role.level)
+    .join(Company, Salary.company_id == Company.id)
+    .join(Role, Salary.role_id == Role.id)
+    .limit(10)
+    .all()
+)
 
-for s in salaries:
-    company = db.query(Company).filter(Company.id == s.company_id).first()
-    role = db.query(Role).filter(Role.id == s.role_id).first()
-    location = db.query(Location).filter(Location.id == s.location_id).first()
-    
-    print(f'{company.name:25} | {role.title:30} | {role.level:8} | {s.years_of_experience} yrs | ₹{s.total_compensation/100000:5.1f}L')
+for s, company_name, role_title, role_level in samples:
+    print(f'{company_name:25} | {role_title:30} | {role_level:8} | {s.years_of_experience} yrs | ₹{s.total_compensation/100000:5.1f}L')
 
 db.close()
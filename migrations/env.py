@@ -0,0 +1,60 @@
+"""Alembic environment: runs migrations against DATABASE_URL"""
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from src.database.database import Base, DATABASE_URL
+from src.models import (  # noqa: F401
+    company, location, role, salary, salary_rollup, salary_experience_rollup
+)
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    """Leave the text search tables and indexes to ensure_search_indexes"""
+    if reflected and compare_to is None and name:
+        return not ("_fts" in name or name.endswith(("_trgm", "_lower")))
+    return True
+
+
+def database_url():
+    return config.attributes.get("url") or DATABASE_URL
+
+
+def run_migrations_offline():
+    """Emit the SQL instead of running it (alembic upgrade --sql)"""
+    context.configure(
+        url=database_url(),
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    connectable = create_engine(database_url(), poolclass=pool.NullPool)
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
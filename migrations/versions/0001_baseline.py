@@ -0,0 +1,110 @@
+"""Baseline schema, as previously created by create_all
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+
+Existing tables and indexes are left alone, so a database created with
+`Base.metadata.create_all` can be upgraded as is.
+"""
+from alembic import op
+import sqlalchemy as sa
+from src.database.migrations import create_index
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "companies",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(200), nullable=False),
+        sa.Column("industry", sa.String(100)),
+        sa.Column("size", sa.String(50)),
+        sa.Column("headquarters", sa.String(100)),
+        sa.Column("website", sa.String(200)),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+        if_not_exists=True,
+    )
+    create_index("ix_companies_id", "companies", ["id"])
+    create_index("ix_companies_name", "companies", ["name"], unique=True)
+
+    op.create_table(
+        "locations",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("city", sa.String(100), nullable=False),
+        sa.Column("state", sa.String(100), nullable=False),
+        sa.Column("country", sa.String(100)),
+        sa.Column("cost_of_living_index", sa.Float()),
+        if_not_exists=True,
+    )
+    create_index("ix_locations_id", "locations", ["id"])
+    create_index("ix_locations_city", "locations", ["city"])
+
+    op.create_table(
+        "roles",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(200), nullable=False),
+        sa.Column("category", sa.String(100)),
+        sa.Column("level", sa.String(50)),
+        if_not_exists=True,
+    )
+    create_index("ix_roles_id", "roles", ["id"])
+    create_index("ix_roles_title", "roles", ["title"], unique=True)
+
+    op.create_table(
+        "salaries",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("company_id", sa.Integer(), sa.ForeignKey("companies.id"), nullable=False),
+        sa.Column("role_id", sa.Integer(), sa.ForeignKey("roles.id"), nullable=False),
+        sa.Column("location_id", sa.Integer(), sa.ForeignKey("locations.id"), nullable=False),
+        sa.Column("base_salary", sa.Float(), nullable=False),
+        sa.Column("bonus", sa.Float()),
+        sa.Column("stock_options", sa.Float()),
+        sa.Column("total_compensation", sa.Float(), nullable=False),
+        sa.Column("years_of_experience", sa.Integer(), nullable=False),
+        sa.Column("years_at_company", sa.Integer()),
+        sa.Column("employment_type", sa.String(50)),
+        sa.Column("is_remote", sa.Boolean()),
+        sa.Column("currency", sa.String(10)),
+        sa.Column("submission_date", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("is_verified", sa.Boolean()),
+        sa.Column("source", sa.String(100)),
+        if_not_exists=True,
+    )
+    create_index("ix_salaries_id", "salaries", ["id"])
+    create_index("ix_salaries_company_id", "salaries", ["company_id"])
+    create_index("ix_salaries_role_id", "salaries", ["role_id"])
+    create_index("ix_salaries_location_id", "salaries", ["location_id"])
+
+    op.create_table(
+        "salary_rollups",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("company_id", sa.Integer(), sa.ForeignKey("companies.id"), nullable=False),
+        sa.Column("role_id", sa.Integer(), sa.ForeignKey("roles.id"), nullable=False),
+        sa.Column("location_id", sa.Integer(), sa.ForeignKey("locations.id"), nullable=False),
+        sa.Column("level", sa.String(50)),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("sum_compensation", sa.Float(), nullable=False),
+        sa.Column("sum_squares", sa.Float(), nullable=False),
+        sa.Column("min_compensation", sa.Float()),
+        sa.Column("max_compensation", sa.Float()),
+        sa.Column("sketch", sa.Text(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("company_id", "role_id", "location_id", name="uq_salary_rollups_group"),
+        if_not_exists=True,
+    )
+    create_index("ix_salary_rollups_id", "salary_rollups", ["id"])
+    create_index("ix_salary_rollups_company_id", "salary_rollups", ["company_id"])
+    create_index("ix_salary_rollups_role_id", "salary_rollups", ["role_id"])
+    create_index("ix_salary_rollups_location_id", "salary_rollups", ["location_id"])
+    create_index("ix_salary_rollups_level", "salary_rollups", ["level"])
+
+
+def downgrade():
+    for table in ("salary_rollups", "salaries", "roles", "locations", "companies"):
+        op.drop_table(table)
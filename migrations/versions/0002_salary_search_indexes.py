@@ -0,0 +1,59 @@
+"""Composite indexes for the salary search filters and sorts
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+
+search_salaries filters on role / city / company (resolved to id IN
+lists), a total_compensation or years_of_experience range, and pages by
+keyset on (sort column, id). The single-column foreign key indexes
+could only serve the first filter; these serve the filter and the range
+or sort together. Each foreign key leads one composite index, so the
+single-column ones are dropped to save the write cost.
+
+employment_type is nearly always "Full-time" and submission_date is never
+filtered on, so neither gets an index. Remote rows are a minority, hence
+the partial index.
+
+On a live Postgres database run `alembic -x concurrently=true upgrade head`.
+"""
+from alembic import op
+import sqlalchemy as sa
+from src.database.migrations import create_index, drop_index
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_index("ix_salaries_role_location_compensation", "salaries",
+                 ["role_id", "location_id", "total_compensation"])
+    create_index("ix_salaries_company_experience", "salaries",
+                 ["company_id", "years_of_experience"],
+                 postgresql_include=["total_compensation"])
+    create_index("ix_salaries_location_compensation", "salaries",
+                 ["location_id", "total_compensation"])
+    create_index("ix_salaries_compensation_id", "salaries", ["total_compensation", "id"])
+    create_index("ix_salaries_experience_id", "salaries", ["years_of_experience", "id"])
+    create_index("ix_salaries_remote_compensation", "salaries", ["total_compensation", "id"],
+                 postgresql_where=sa.text("is_remote"), sqlite_where=sa.text("is_remote = 1"))
+
+    for column in ("company_id", "role_id", "location_id"):
+        drop_index(f"ix_salaries_{column}", "salaries")
+
+
+def downgrade():
+    for column in ("company_id", "role_id", "location_id"):
+        create_index(f"ix_salaries_{column}", "salaries", [column])
+
+    for name in (
+        "ix_salaries_remote_compensation",
+        "ix_salaries_experience_id",
+        "ix_salaries_compensation_id",
+        "ix_salaries_location_compensation",
+        "ix_salaries_company_experience",
+        "ix_salaries_role_location_compensation",
+    ):
+        drop_index(name, "salaries")
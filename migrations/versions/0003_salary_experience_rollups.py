@@ -0,0 +1,46 @@
+"""Per-year-of-experience salary rollups for the experience curve
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+
+The table starts empty; run scripts/rebuild_rollups.py (or any bulk
+import, which rebuilds the rollups) once after upgrading.
+"""
+from alembic import op
+import sqlalchemy as sa
+from src.database.migrations import create_index
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "salary_experience_rollups",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("company_id", sa.Integer(), sa.ForeignKey("companies.id"), nullable=False),
+        sa.Column("role_id", sa.Integer(), sa.ForeignKey("roles.id"), nullable=False),
+        sa.Column("location_id", sa.Integer(), sa.ForeignKey("locations.id"), nullable=False),
+        sa.Column("years_of_experience", sa.Integer(), nullable=False),
+        sa.Column("level", sa.String(50)),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("sum_compensation", sa.Float(), nullable=False),
+        sa.Column("sketch", sa.Text(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("company_id", "role_id", "location_id", "years_of_experience",
+                            name="uq_salary_experience_rollups_group"),
+        if_not_exists=True,
+    )
+    create_index("ix_salary_experience_rollups_id", "salary_experience_rollups", ["id"])
+    create_index("ix_salary_experience_rollups_level", "salary_experience_rollups", ["level"])
+    create_index("ix_salary_experience_rollups_role_location", "salary_experience_rollups",
+                 ["role_id", "location_id"])
+    create_index("ix_salary_experience_rollups_location", "salary_experience_rollups",
+                 ["location_id"])
+
+
+def downgrade():
+    op.drop_table("salary_experience_rollups")
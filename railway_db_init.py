@@ -22,17 +22,21 @@ try:
     engine = create_engine(DATABASE_URL)
     
     # Import all models
-    from src.database.database import Base
+    from src.database.migrations import upgrade_database
     from src.models.company import Company
     from src.models.location import Location
     from src.models.role import Role
     from src.models.salary import Salary
+    from src.models.salary_rollup import SalaryRollup
+    from src.models.salary_experience_rollup import SalaryExperienceRollup
+    from src.database.rollups import rebuild_rollups
     
     print("✅ Models imported successfully")
     
-    # Create all tables
-    print("Creating tables...")
-    Base.metadata.create_all(bind=engine)
+    # Create or upgrade tables. Concurrent index builds keep a live
+    # database writable while new indexes are added.
+    print("Applying migrations...")
+    upgrade_database(DATABASE_URL, concurrently=True)
     print("✅ All tables created successfully!")
     
     # Create session
@@ -97,6 +101,9 @@ try:
     session.commit()
     print(f"✅ Added {len(salaries_data)} salary entries")
     
+    rebuild_rollups(session)
+    print("✅ Salary rollups built")
+    
     session.close()
     
     print("=" * 50)
@@ -6,6 +6,8 @@ from src.models.company import Company
 from src.models.location import Location
 from src.models.role import Role
 from src.models.salary import Salary
+from src.database.bulk_load import bulk_load
+from src.scrapers.salary_ranges import get_salary_range, component_ranges
 
 print("=" * 80)
 print("💯 ADDING CORRECT INDIAN SALARY DATA (VERIFIED RANGES 2024-25)")
@@ -13,175 +15,11 @@ print("=" * 80)
 
 db = SessionLocal()
 
-# CORRECT SALARY RANGES (Based on AmbitionBox, Glassdoor public data, PayScale)
-COMPANY_SALARY_RANGES = {
-    # TIER 1: FAANG + Top Product (Google, Meta, Amazon, Microsoft, Apple)
-    "Google India": {
-        "Entry": (1500000, 2500000),    # 15-25 LPA
-        "Mid": (2500000, 5000000),      # 25-50 LPA
-        "Senior": (5000000, 12000000),  # 50-120 LPA
-    },
-    "Amazon India": {
-        "Entry": (1400000, 2200000),    # 14-22 LPA
-        "Mid": (2200000, 4500000),      # 22-45 LPA
-        "Senior": (4500000, 10000000),  # 45-100 LPA
-    },
-    "Microsoft India": {
-        "Entry": (1500000, 2400000),    # 15-24 LPA
-        "Mid": (2400000, 4800000),      # 24-48 LPA
-        "Senior": (4800000, 11000000),  # 48-110 LPA
-    },
-    "Meta India": {
-        "Entry": (1600000, 2600000),    # 16-26 LPA
-        "Mid": (2600000, 5200000),      # 26-52 LPA
-        "Senior": (5200000, 12000000),  # 52-120 LPA
-    },
-    "Apple India": {
-        "Entry": (1400000, 2300000),    # 14-23 LPA
-        "Mid": (2300000, 4600000),      # 23-46 LPA
-        "Senior": (4600000, 10000000),  # 46-100 LPA
-    },
-    
-    # TIER 2: Good Startups/Product (Flipkart, Swiggy, Razorpay, etc)
-    "Flipkart": {
-        "Entry": (900000, 1500000),     # 9-15 LPA
-        "Mid": (1500000, 2800000),      # 15-28 LPA
-        "Senior": (2800000, 5500000),   # 28-55 LPA
-    },
-    "Swiggy": {
-        "Entry": (1000000, 1600000),    # 10-16 LPA
-        "Mid": (1600000, 3000000),      # 16-30 LPA
-        "Senior": (3000000, 6000000),   # 30-60 LPA
-    },
-    "Zomato": {
-        "Entry": (950000, 1550000),     # 9.5-15.5 LPA
-        "Mid": (1550000, 2900000),      # 15.5-29 LPA
-        "Senior": (2900000, 5800000),   # 29-58 LPA
-    },
-    "PhonePe": {
-        "Entry": (1100000, 1700000),    # 11-17 LPA
-        "Mid": (1700000, 3200000),      # 17-32 LPA
-        "Senior": (3200000, 6500000),   # 32-65 LPA
-    },
-    "Razorpay": {
-        "Entry": (1000000, 1650000),    # 10-16.5 LPA
-        "Mid": (1650000, 3100000),      # 16.5-31 LPA
-        "Senior": (3100000, 6200000),   # 31-62 LPA
-    },
-    "CRED": {
-        "Entry": (1200000, 1800000),    # 12-18 LPA
-        "Mid": (1800000, 3500000),      # 18-35 LPA
-        "Senior": (3500000, 7000000),   # 35-70 LPA
-    },
-    "Ola": {
-        "Entry": (850000, 1400000),     # 8.5-14 LPA
-        "Mid": (1400000, 2600000),      # 14-26 LPA
-        "Senior": (2600000, 5200000),   # 26-52 LPA
-    },
-    "Paytm": {
-        "Entry": (800000, 1350000),     # 8-13.5 LPA
-        "Mid": (1350000, 2500000),      # 13.5-25 LPA
-        "Senior": (2500000, 5000000),   # 25-50 LPA
-    },
-    
-    # TIER 3: Mid-level Product/SaaS
-    "Adobe India": {
-        "Entry": (1200000, 2000000),    # 12-20 LPA
-        "Mid": (2000000, 3800000),      # 20-38 LPA
-        "Senior": (3800000, 7500000),   # 38-75 LPA
-    },
-    "Salesforce India": {
-        "Entry": (1100000, 1900000),    # 11-19 LPA
-        "Mid": (1900000, 3600000),      # 19-36 LPA
-        "Senior": (3600000, 7200000),   # 36-72 LPA
-    },
-    "VMware India": {
-        "Entry": (1000000, 1700000),    # 10-17 LPA
-        "Mid": (1700000, 3200000),      # 17-32 LPA
-        "Senior": (3200000, 6500000),   # 32-65 LPA
-    },
-    
-    # TIER 4: Service Companies (TCS, Infosys, Wipro, Capgemini, etc)
-    "TCS": {
-        "Entry": (320000, 450000),      # 3.2-4.5 LPA
-        "Mid": (650000, 1200000),       # 6.5-12 LPA
-        "Senior": (1200000, 2200000),   # 12-22 LPA
-    },
-    "Infosys": {
-        "Entry": (380000, 500000),      # 3.8-5 LPA
-        "Mid": (700000, 1300000),       # 7-13 LPA
-        "Senior": (1300000, 2400000),   # 13-24 LPA
-    },
-    "Wipro": {
-        "Entry": (350000, 480000),      # 3.5-4.8 LPA
-        "Mid": (680000, 1250000),       # 6.8-12.5 LPA
-        "Senior": (1250000, 2300000),   # 12.5-23 LPA
-    },
-    "HCL Technologies": {
-        "Entry": (340000, 470000),      # 3.4-4.7 LPA
-        "Mid": (670000, 1230000),       # 6.7-12.3 LPA
-        "Senior": (1230000, 2250000),   # 12.3-22.5 LPA
-    },
-    "Tech Mahindra": {
-        "Entry": (360000, 490000),      # 3.6-4.9 LPA
-        "Mid": (690000, 1270000),       # 6.9-12.7 LPA
-        "Senior": (1270000, 2350000),   # 12.7-23.5 LPA
-    },
-    "Capgemini": {
-        "Entry": (400000, 550000),      # 4-5.5 LPA ✅ CORRECT NOW!
-        "Mid": (750000, 1350000),       # 7.5-13.5 LPA
-        "Senior": (1350000, 2500000),   # 13.5-25 LPA (NOT 72L!)
-    },
-    "Cognizant": {
-        "Entry": (380000, 520000),      # 3.8-5.2 LPA
-        "Mid": (720000, 1320000),       # 7.2-13.2 LPA
-        "Senior": (1320000, 2450000),   # 13.2-24.5 LPA
-    },
-    "Accenture India": {
-        "Entry": (450000, 600000),      # 4.5-6 LPA
-        "Mid": (800000, 1450000),       # 8-14.5 LPA
-        "Senior": (1450000, 2700000),   # 14.5-27 LPA
-    },
-    "LTI Mindtree": {
-        "Entry": (370000, 510000),      # 3.7-5.1 LPA
-        "Mid": (710000, 1300000),       # 7.1-13 LPA
-        "Senior": (1300000, 2400000),   # 13-24 LPA
-    },
-}
-
-def get_salary_range(company_name, level):
-    """Get correct salary range for company and level"""
-    if company_name in COMPANY_SALARY_RANGES:
-        return COMPANY_SALARY_RANGES[company_name].get(level, (500000, 1000000))
-    else:
-        # Default ranges if company not in list
-        defaults = {
-            "Entry": (400000, 600000),
-            "Mid": (800000, 1500000),
-            "Senior": (1500000, 2800000),
-        }
-        return defaults.get(level, (500000, 1000000))
-
 def calculate_components(base, company_name):
     """Calculate bonus and stock based on company type"""
-    # FAANG companies
-    if company_name in ["Google India", "Amazon India", "Microsoft India", "Meta India", "Apple India"]:
-        bonus_pct = random.uniform(0.15, 0.25)
-        stock_pct = random.uniform(0.30, 0.50)
-    # Good startups
-    elif company_name in ["Flipkart", "Swiggy", "Zomato", "PhonePe", "Razorpay", "CRED"]:
-        bonus_pct = random.uniform(0.10, 0.20)
-        stock_pct = random.uniform(0.20, 0.35)
-    # Service companies
-    elif company_name in ["TCS", "Infosys", "Wipro", "HCL Technologies", "Capgemini", "Cognizant", "Accenture India"]:
-        bonus_pct = random.uniform(0.05, 0.12)
-        stock_pct = random.uniform(0.00, 0.05)  # Minimal/no stock
-    else:
-        bonus_pct = random.uniform(0.10, 0.15)
-        stock_pct = random.uniform(0.10, 0.20)
-    
-    bonus = int(base * bonus_pct)
-    stock = int(base * stock_pct)
+    bonus_range, stock_range = component_ranges(company_name)
+    bonus = int(base * random.uniform(*bonus_range))
+    stock = int(base * random.uniform(*stock_range))
     return bonus, stock
 
 # Get data
@@ -191,11 +29,11 @@ roles = db.query(Role).all()
 
 print(f"\n📊 Generating CORRECT salaries for {len(companies)} companies...\n")
 
-added = 0
 target = 250
 
 exp_ranges = {"Entry": (0, 2), "Mid": (3, 7), "Senior": (8, 15)}
 
+records = []
 for i in range(target):
     company = random.choice(companies)
     location = random.choice(locations)
@@ -211,32 +49,27 @@ for i in range(target):
     
     exp = random.randint(*exp_ranges[role.level])
     
-    salary = Salary(
-        company_id=company.id,
-        location_id=location.id,
-        role_id=role.id,
-        base_salary=base,
-        bonus=bonus,
-        stock_options=stock,
-        total_compensation=total,
-        years_of_experience=exp,
-        years_at_company=random.randint(0, min(exp, 4)),
-        employment_type="Full-time",
-        is_remote=random.choice([False] * 8 + [True] * 2),
-        currency="INR",
-        source="verified_indian_market_2024"
-    )
-    
-    db.add(salary)
-    added += 1
-    
-    if added % 50 == 0:
-        db.commit()
-        print(f"  ✓ Generated {added} entries...")
-
-db.commit()
-
-print(f"\n✅ Added {added} CORRECT salary entries!")
+    records.append({
+        "company": company.name,
+        "role": role.title,
+        "city": location.city,
+        "base_salary": base,
+        "bonus": bonus,
+        "stock_options": stock,
+        "total_compensation": total,
+        "years_of_experience": exp,
+        "years_at_company": random.randint(0, min(exp, 4)),
+        "employment_type": "Full-time",
+        "is_remote": random.choice([False] * 8 + [True] * 2),
+        "currency": "INR",
+        "source": "verified_indian_market_2024"
+    })
+
+report = bulk_load(db, records, create_missing=())
+
+print(f"\n✅ Added {report['loaded']} CORRECT salary entries "
+      f"({report['rows_per_second']} rows/sec)!")
+print(f"✅ Rebuilt {report['rollup_groups']} salary rollup groups")
 
 # Show verification samples
 print("\n" + "=" * 80)
@@ -251,16 +84,18 @@ samples = [
 ]
 
 for comp_name, level in samples:
-    company = db.query(Company).filter(Company.name == comp_name).first()
-    if company:
-        sample_salaries = db.query(Salary).filter(
-            Salary.company_id == company.id
-        ).join(Role).filter(Role.level == level).limit(2).all()
-        
-        for s in sample_salaries:
-            rol = db.query(Role).filter(Role.id == s.role_id).first()
-            print(f"{comp_name:20} | {rol.title:25} | {rol.level:8} | "
-                  f"{s.years_of_experience} yrs | ₹{s.total_compensation/100000:5.1f}L")
+    sample_salaries = (
+        db.query(Salary, Role.title, Role.level)
+        .join(Company, Salary.company_id == Company.id)
+        .join(Role, Salary.role_id == Role.id)
+        .filter(Company.name == comp_name, Role.level == level)
+        .limit(2)
+        .all()
+    )
+    
+    for s, role_title, role_level in sample_salaries:
+        print(f"{comp_name:20} | {role_title:25} | {role_level:8} | "
+              f"{s.years_of_experience} yrs | ₹{s.total_compensation/100000:5.1f}L")
 
 db.close()
 
@@ -0,0 +1,62 @@
+"""
+BULK SALARY LOADER
+Loads a CSV or NDJSON file of salaries into the database.
+
+Expected fields: company, role, level, city, state, base_salary, bonus,
+stock_options, total_compensation (defaults to base + bonus + stock),
+years_of_experience, years_at_company, employment_type, is_remote,
+currency, source.
+
+Usage:
+    python scripts/bulk_load.py salaries.csv
+    python scripts/bulk_load.py salaries.ndjson --source partner_survey_2025
+    cat salaries.ndjson | python scripts/bulk_load.py - --format ndjson
+"""
+
+import sys
+sys.path.append('.')
+import argparse
+from src.database.database import SessionLocal
+from src.database.bulk_load import bulk_load, read_records, DEFAULT_BATCH_SIZE, DIMENSIONS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk load salaries from CSV or NDJSON")
+    parser.add_argument("path", help="Input file, or - for stdin")
+    parser.add_argument("--format", choices=("csv", "ndjson"), help="Defaults to the file extension")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--source", help="Source recorded for rows without one")
+    parser.add_argument("--create", default=",".join(DIMENSIONS),
+                        help="Dimensions whose unknown names are created (default: all)")
+    parser.add_argument("--no-rollups", action="store_true", help="Skip the rollup rebuild")
+    args = parser.parse_args()
+
+    create = tuple(name for name in args.create.split(",") if name)
+    db = SessionLocal()
+    try:
+        report = bulk_load(
+            db,
+            read_records(args.path, args.format),
+            batch_size=args.batch_size,
+            create_missing=create,
+            source=args.source,
+            rebuild=not args.no_rollups,
+            progress=lambda loaded: print(f"  ✓ Loaded {loaded} rows...")
+        )
+    finally:
+        db.close()
+
+    print(f"\n✅ Loaded {report['loaded']} rows in {report['seconds']}s "
+          f"({report['rows_per_second']} rows/sec)")
+    if report["created"]:
+        print(f"   Created: {report['created']}")
+    if report["skipped"]:
+        print(f"⚠️  Skipped {report['skipped']} rows")
+        for error in report["errors"]:
+            print(f"   - {error}")
+    if report["rollup_groups"] is not None:
+        print(f"   Rollup groups: {report['rollup_groups']}")
+
+
+if __name__ == "__main__":
+    main()
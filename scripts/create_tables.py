@@ -1,16 +1,16 @@
 import sys
 sys.path.append('.')
 
-from src.database.database import engine, Base
-from src.models.company import Company
-from src.models.location import Location
-from src.models.role import Role
-from src.models.salary import Salary
+from src.database.database import engine
+from src.database.migrations import upgrade_database
+from src.database.search_index import ensure_search_indexes
 
-def create_tables():
-    print("Creating tables...")
-    Base.metadata.create_all(bind=engine)
+def create_tables(concurrently=False):
+    print("Applying migrations...")
+    upgrade_database(concurrently=concurrently)
     print("✅ All tables created successfully!")
+    ensure_search_indexes(engine)
+    print("✅ Search indexes created!")
 
 if __name__ == "__main__":
-    create_tables()
\ No newline at end of file
+    create_tables(concurrently="--concurrently" in sys.argv)
\ No newline at end of file
@@ -11,6 +11,7 @@ from src.models.company import Company
 from src.models.location import Location
 from src.models.role import Role
 from src.models.salary import Salary
+from src.database.bulk_load import bulk_load
 
 db = SessionLocal()
 
@@ -150,75 +151,43 @@ REAL_SALARY_DATA = [
 
 print(f"Total verified entries to import: {len(REAL_SALARY_DATA)}\n")
 
-imported = 0
-skipped = 0
+# Companies and locations must already exist; new roles are created
+records = (
+    {
+        "company": comp_name, "role": role_title, "level": level, "city": loc_city,
+        "base_salary": base, "bonus": bonus, "stock_options": stock,
+        "years_of_experience": exp, "employment_type": "Full-time", "currency": "INR"
+    }
+    for comp_name, role_title, level, loc_city, base, bonus, stock, exp in REAL_SALARY_DATA
+)
+report = bulk_load(db, records, create_missing=("role",), source="verified_public_sources_2024")
 
-for comp_name, role_title, level, loc_city, base, bonus, stock, exp in REAL_SALARY_DATA:
-    # Get company
-    company = db.query(Company).filter(Company.name == comp_name).first()
-    if not company:
-        print(f"⚠️  Skipping: Company '{comp_name}' not found")
-        skipped += 1
-        continue
-    
-    # Get or create location
-    location = db.query(Location).filter(Location.city == loc_city).first()
-    if not location:
-        print(f"⚠️  Skipping: Location '{loc_city}' not found")
-        skipped += 1
-        continue
-    
-    # Get or create role
-    role = db.query(Role).filter(Role.title == role_title).first()
-    if not role:
-        role = Role(title=role_title, category="Engineering", level=level)
-        db.add(role)
-        db.flush()
-    
-    total = base + bonus + stock
-    
-    # Create salary entry
-    salary = Salary(
-        company_id=company.id,
-        location_id=location.id,
-        role_id=role.id,
-        base_salary=base,
-        bonus=bonus,
-        stock_options=stock,
-        total_compensation=total,
-        years_of_experience=exp,
-        employment_type="Full-time",
-        currency="INR",
-        source="verified_public_sources_2024"
-    )
-    
-    db.add(salary)
-    imported += 1
-    
-    if imported % 10 == 0:
-        db.commit()
-        print(f"✓ Imported {imported} entries...")
-
-db.commit()
+for error in report["errors"]:
+    print(f"⚠️  Skipping: {error}")
 
 print(f"\n{'=' * 80}")
 print(f"✅ Import Complete!")
-print(f"   Imported: {imported}")
-print(f"   Skipped: {skipped}")
+print(f"   Imported: {report['loaded']} ({report['rows_per_second']} rows/sec)")
+print(f"   Skipped: {report['skipped']}")
+print(f"   Rollup groups: {report['rollup_groups']}")
 print(f"{'=' * 80}\n")
 
 # Show samples
 print("📋 SAMPLE VERIFICATION:")
 print("=" * 80)
 
-samples = db.query(Salary).order_by(Salary.id.desc()).limit(10).all()
+samples = (
+    db.query(Salary, Company.name, Role.title, Role.level, Location.city)
+    .join(Company, Salary.company_id == Company.id)
+    .join(Role, Salary.role_id == Role.id)
+    .join(Location, Salary.location_id == Location.id)
+    .order_by(Salary.id.desc())
+    .limit(10)
+    .all()
+)
 
-for s in samples:
-    comp = db.query(Company).filter(Company.id == s.company_id).first()
-    rol = db.query(Role).filter(Role.id == s.role_id).first()
-    loc = db.query(Location).filter(Location.id == s.location_id).first()
-    
-    print(f"{comp.name:25} | {rol.title:35} | {rol.level:8} | {loc.city:12} | "
+for s, company_name, role_title, role_level, city in samples:
+    print(f"{company_name:25} | {role_title:35} | {role_level:8} | {city:12} | "
           f"{s.years_of_experience} yrs | ₹{s.total_compensation/100000:6.1f}L")
 
 db.close()
@@ -0,0 +1,29 @@
+"""
+REBUILD SALARY ROLLUPS
+Recomputes salary_rollups and salary_experience_rollups from the salaries
+table. The API keeps both up to date on submit; run this after changing
+salaries outside the API, or from cron to correct any drift.
+
+Usage:
+    python scripts/rebuild_rollups.py
+"""
+
+import sys
+sys.path.append('.')
+import time
+from src.database.database import SessionLocal
+from src.database.rollups import rebuild_rollups
+
+
+def main():
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        groups = rebuild_rollups(db)
+        print(f"✅ Rebuilt {groups} salary rollup groups in {time.perf_counter() - start:.1f}s")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
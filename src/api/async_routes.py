@@ -0,0 +1,66 @@
+"""Async variants of the database-backed API routes.
+
+With `USE_ASYNC_DB` enabled, every route that depends on a sync `Session`
+is swapped for an `async def` twin that takes an `AsyncSession` instead
+and runs the original endpoint body through `AsyncSession.run_sync`. The
+body executes against a Session bound to the async connection, so every
+database round trip awaits on the event loop instead of holding one of
+the threadpool's threads, while the query code stays in one place.
+"""
+import inspect
+from fastapi import APIRouter, Depends
+from fastapi.routing import APIRoute
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.database.database import get_async_db
+
+
+def _session_parameter(endpoint):
+    for param in inspect.signature(endpoint).parameters.values():
+        if param.annotation is Session:
+            return param.name
+    return None
+
+
+def make_async_endpoint(endpoint):
+    """`async def` version of a sync endpoint taking `db: Session`"""
+    name = _session_parameter(endpoint)
+    signature = inspect.signature(endpoint)
+
+    async def async_endpoint(**kwargs):
+        db = kwargs.pop(name)
+        return await db.run_sync(lambda session: endpoint(**kwargs, **{name: session}))
+
+    async_endpoint.__signature__ = signature.replace(parameters=[
+        param.replace(annotation=AsyncSession, default=Depends(get_async_db))
+        if param.name == name else param
+        for param in signature.parameters.values()
+    ])
+    async_endpoint.__name__ = endpoint.__name__
+    async_endpoint.__qualname__ = endpoint.__qualname__
+    async_endpoint.__doc__ = endpoint.__doc__
+    async_endpoint.__module__ = endpoint.__module__
+    # Attributes set by decorators, e.g. statement_budget
+    async_endpoint.__dict__.update(endpoint.__dict__)
+    return async_endpoint
+
+
+def use_async_routes(app):
+    """Replace the app's Session-backed routes with async equivalents"""
+    for index, route in enumerate(app.router.routes):
+        if not isinstance(route, APIRoute) or not _session_parameter(route.endpoint):
+            continue
+        builder = APIRouter()
+        builder.add_api_route(
+            route.path,
+            make_async_endpoint(route.endpoint),
+            methods=list(route.methods),
+            name=route.name,
+            tags=route.tags,
+            summary=route.summary,
+            description=route.description,
+            response_class=route.response_class,
+            status_code=route.status_code,
+            include_in_schema=route.include_in_schema,
+        )
+        app.router.routes[index] = builder.routes[0]
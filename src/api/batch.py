@@ -0,0 +1,102 @@
+"""Parsing and reference checks for batch salary submission.
+
+A batch body is either a JSON array of `SalaryCreate` objects or NDJSON
+(one object per line). Each item is validated on its own so one bad row
+is reported back instead of failing the whole upload.
+"""
+import json
+import os
+from collections import defaultdict
+from fastapi import Request
+from pydantic import ValidationError
+from sqlalchemy import select, insert
+from src.models.company import Company
+from src.models.location import Location
+from src.models.role import Role
+from src.models.salary import Salary
+from src.schemas.salary import SalaryCreate
+
+MAX_SALARY_BATCH = int(os.getenv("MAX_SALARY_BATCH", "1000"))
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+async def salary_batch_body(request: Request):
+    """Dependency returning the raw body and its content type"""
+    return await request.body(), request.headers.get("content-type", "")
+
+
+def _validation_message(error):
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc'])}: {e['msg']}" for e in error.errors()
+    )
+
+
+def _validate(raw):
+    try:
+        return SalaryCreate.model_validate(raw)
+    except ValidationError as e:
+        return _validation_message(e)
+
+
+def parse_salary_batch(body, content_type=""):
+    """SalaryCreate (or an error message) for every item in the body.
+
+    Raises ValueError when the body as a whole cannot be read.
+    """
+    text = body.decode("utf-8") if isinstance(body, bytes) else body
+    is_ndjson = content_type.split(";")[0].strip() in NDJSON_MEDIA_TYPES
+    if not is_ndjson and text.lstrip().startswith("["):
+        try:
+            raw_items = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {e}")
+        return [_validate(raw) for raw in raw_items]
+
+    items = []
+    for number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            items.append(_validate(json.loads(line)))
+        except json.JSONDecodeError as e:
+            items.append(f"line {number}: invalid JSON ({e.msg})")
+    return items
+
+
+def existing_references(db, items):
+    """Company ids, role id -> level and location ids referenced by `items`.
+
+    One IN query per dimension, whatever the batch size.
+    """
+    company_ids = {item.company_id for item in items}
+    role_ids = {item.role_id for item in items}
+    location_ids = {item.location_id for item in items}
+    if not items:
+        return set(), {}, set()
+    return (
+        set(db.execute(select(Company.id).where(Company.id.in_(company_ids))).scalars()),
+        dict(db.execute(select(Role.id, Role.level).where(Role.id.in_(role_ids))).all()),
+        set(db.execute(select(Location.id).where(Location.id.in_(location_ids))).scalars()),
+    )
+
+
+def insert_salaries(db, rows):
+    """Insert `rows` (dicts of Salary columns) and return their ids in order.
+
+    SQLAlchemy batches the rows into multi-row INSERT ... RETURNING
+    statements of up to a thousand rows. Ordered RETURNING would make it
+    fall back to one INSERT per row on SQLite, so the rows come back
+    unordered and ids are matched to rows by the inserted values.
+    Identical rows are interchangeable, so which of them gets which id
+    does not matter.
+    """
+    columns = list(rows[0])
+    returned = db.execute(
+        insert(Salary).returning(Salary.id, *(getattr(Salary, c) for c in columns)),
+        rows
+    ).all()
+    ids_by_values = defaultdict(list)
+    for salary_id, *values in returned:
+        ids_by_values[tuple(values)].append(salary_id)
+    return [ids_by_values[tuple(row[c] for c in columns)].pop() for row in rows]
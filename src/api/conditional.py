@@ -0,0 +1,57 @@
+"""Conditional GET (ETag / Last-Modified) for the JSON API.
+
+Validators are derived from the data version and the normalized request,
+so an unchanged resource is answered with `304 Not Modified` before the
+endpoint runs or touches the database.
+"""
+from email.utils import format_datetime, parsedate_to_datetime
+from fastapi import Request
+from fastapi.responses import Response
+from src.cache.data_version import make_etag, last_modified, data_version
+
+# Endpoints whose response does not depend on the data version
+UNVERSIONED_PATHS = ("/api/health", "/api/internal/")
+
+
+def _etag_matches(header, etag):
+    if header.strip() == "*":
+        return True
+    return etag in [tag.strip() for tag in header.split(",")]
+
+
+def _not_modified_since(header, modified):
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    return since is not None and since.tzinfo is not None and modified <= since
+
+
+async def conditional_get(request: Request, call_next):
+    """Middleware adding validators and short-circuiting revalidation"""
+    path = request.url.path
+    if (request.method != "GET" or not path.startswith("/api/")
+            or path.startswith(UNVERSIONED_PATHS)):
+        return await call_next(request)
+
+    version = data_version()
+    etag = make_etag(path, request.query_params.multi_items(), version)
+    modified = last_modified()
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_datetime(modified, usegmt=True),
+        "Cache-Control": "no-cache",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_none_match is not None:
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+    elif if_modified_since and _not_modified_since(if_modified_since, modified):
+        return Response(status_code=304, headers=headers)
+
+    response = await call_next(request)
+    if response.status_code == 200:
+        response.headers.update(headers)
+    return response
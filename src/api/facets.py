@@ -0,0 +1,90 @@
+"""Facet counts for the salary search.
+
+`facet_counts` returns, for the current filters, how many matching
+salaries fall in each company, city, role and experience band, plus the
+overall total, from a single statement. Postgres groups once with
+GROUPING SETS; other dialects get a UNION ALL of grouped selects over
+one CTE of the matching rows.
+"""
+from sqlalchemy import select, func, literal, and_, union_all, tuple_
+from src.models.company import Company
+from src.models.location import Location
+from src.models.role import Role
+from src.api.queries import salary_select
+from src.api.stats import experience_band_column, EXPERIENCE_BANDS
+
+DEFAULT_FACET_LIMIT = 10
+
+FACET_COLUMNS = {
+    "company": lambda: Company.name,
+    "city": lambda: Location.city,
+    "role": lambda: Role.title,
+    "experience_band": experience_band_column,
+}
+
+# Facets listed in a fixed order, empty values included, rather than by count
+ORDERED_FACETS = {"experience_band": [label for label, _, _ in EXPERIENCE_BANDS]}
+
+
+def facet_counts(db, filters, limit=DEFAULT_FACET_LIMIT):
+    """(total, {facet: [{"value", "count"}, ...]}) for the filtered salaries"""
+    matching = salary_select(*[build().label(name) for name, build in FACET_COLUMNS.items()])
+    if filters:
+        matching = matching.where(and_(*filters))
+    matching = matching.cte("matching")
+
+    if db.get_bind().dialect.name == "postgresql":
+        rows = _grouping_sets_counts(db, matching)
+    else:
+        rows = _union_counts(db, matching)
+
+    total = 0
+    facets = {name: [] for name in FACET_COLUMNS}
+    for facet, value, count in rows:
+        if facet is None:
+            total = count
+        else:
+            facets[facet].append({"value": value, "count": count})
+
+    for name, values in facets.items():
+        if name in ORDERED_FACETS:
+            counts = {v["value"]: v["count"] for v in values}
+            values[:] = [{"value": value, "count": counts.get(value, 0)}
+                         for value in ORDERED_FACETS[name]]
+        else:
+            values.sort(key=lambda v: (-v["count"], v["value"]))
+            del values[limit:]
+    return total, facets
+
+
+def _grouping_sets_counts(db, matching):
+    # GROUPING(a, b, c, d) has a bit set for every column a row is *not*
+    # grouped by, so each single-column set has exactly one bit clear
+    names = list(FACET_COLUMNS)
+    columns = [matching.c[name] for name in names]
+    stmt = (
+        select(func.grouping(*columns).label("mask"), *columns, func.count().label("count"))
+        .group_by(func.grouping_sets(*columns, tuple_()))
+    )
+
+    full = (1 << len(names)) - 1
+    rows = []
+    for row in db.execute(stmt):
+        if row.mask == full:
+            rows.append((None, None, row.count))
+            continue
+        for position, name in enumerate(names):
+            if not row.mask & (1 << (len(names) - 1 - position)):
+                rows.append((name, row._mapping[name], row.count))
+    return rows
+
+
+def _union_counts(db, matching):
+    parts = [
+        select(literal(name).label("facet"), matching.c[name].label("value"), func.count())
+        .group_by(matching.c[name])
+        for name in FACET_COLUMNS
+    ]
+    parts.append(select(literal(None).label("facet"), literal(None).label("value"), func.count())
+                 .select_from(matching))
+    return db.execute(union_all(*parts)).all()
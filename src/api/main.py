@@ -1,13 +1,36 @@
-from fastapi import FastAPI, Depends, Request
+from fastapi import FastAPI, Depends, Request, Query
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse, PlainTextResponse
 from sqlalchemy.orm import Session
-from src.database.database import get_db
+from sqlalchemy import select, func
+from typing import Optional
+from src.database.database import (
+    get_db, engine, SessionLocal, USE_ASYNC_DB, async_engine, pool_metrics, async_pool_metrics
+)
+from src.monitoring.pool import pool_status
+from src.monitoring.metrics import track_requests, instrument_engine, render_metrics
+from src.monitoring.query_guard import enforce_budgets, statement_budget
+from src.database.search_index import ensure_search_indexes
+from src.cache.suggest import build_suggest_indexes
+from src.cache.dimensions import warm_dimension_caches, company_cache, role_cache, location_cache
+from src.cache.results import search_cache, stats_cache
+from src.cache.columnar import column_store, COLUMNAR_STATS
+from src.cache.data_version import data_version
 from src.models.company import Company
 from src.models.location import Location
 from src.models.role import Role
 from src.models.salary import Salary
+from src.api.queries import (
+    salary_select,
+    format_row,
+    format_salary_detail,
+    SALARY_LIST_COLUMNS,
+    SALARY_DETAIL_COLUMNS,
+)
+from src.api.pagination import apply_keyset, next_cursor, InvalidCursor
+from src.api.streaming import stream_rows, STREAM_MEDIA_TYPES
+from src.api.conditional import conditional_get
 
 # Create FastAPI app
 app = FastAPI(
@@ -16,12 +39,55 @@ app = FastAPI(
     version="0.1.0"
 )
 
+# Conditional GET validators for the JSON API
+app.middleware("http")(conditional_get)
+
+# Statement budgets declared with @statement_budget (reads the metrics below)
+app.middleware("http")(enforce_budgets)
+
+# Per-route latency and SQL metrics (outermost, so 304s are timed too)
+app.middleware("http")(track_requests)
+instrument_engine(engine)
+if async_engine is not None:
+    instrument_engine(async_engine.sync_engine)
+
 # Mount static files (CSS, JS, images)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 # Setup Jinja2 templates
 templates = Jinja2Templates(directory="templates")
 
+@app.on_event("startup")
+def create_search_indexes():
+    """Make sure company/role/city text filters are index backed"""
+    ensure_search_indexes(engine)
+
+@app.on_event("startup")
+def warm_caches():
+    """Build the in-memory typeahead indexes and dimension caches"""
+    db = SessionLocal()
+    try:
+        build_suggest_indexes(db)
+        warm_dimension_caches(db)
+    finally:
+        db.close()
+
+@app.on_event("startup")
+def load_column_store():
+    """Load salaries into the in-memory column store when enabled"""
+    if not COLUMNAR_STATS:
+        return
+    db = SessionLocal()
+    try:
+        column_store.load(db)
+    finally:
+        db.close()
+    column_store.start_resync(SessionLocal)
+
+@app.on_event("shutdown")
+def stop_column_store():
+    column_store.stop_resync()
+
 # ============================================
 # HTML PAGES (Frontend)
 # ============================================
@@ -41,6 +107,7 @@ async def submit_page(request: Request):
 # ============================================
 
 @app.get("/api/health")
+@statement_budget(0)
 def health_check():
     """Health check endpoint"""
     return {
@@ -49,6 +116,7 @@ def health_check():
     }
 
 @app.get("/api/companies")
+@statement_budget(1)
 def get_companies(db: Session = Depends(get_db)):
     """Get all companies"""
     companies = db.query(Company).all()
@@ -66,6 +134,7 @@ def get_companies(db: Session = Depends(get_db)):
     }
 
 @app.get("/api/locations")
+@statement_budget(1)
 def get_locations(db: Session = Depends(get_db)):
     """Get all locations"""
     locations = db.query(Location).all()
@@ -82,6 +151,7 @@ def get_locations(db: Session = Depends(get_db)):
     }
 
 @app.get("/api/roles")
+@statement_budget(1)
 def get_roles(db: Session = Depends(get_db)):
     """Get all roles"""
     roles = db.query(Role).all()
@@ -98,83 +168,104 @@ def get_roles(db: Session = Depends(get_db)):
     }
 
 @app.get("/api/salaries")
-def get_salaries(db: Session = Depends(get_db)):
-    """Get all salaries"""
-    salaries = db.query(Salary).all()
+@statement_budget(2)
+def get_salaries(
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size (omit for all rows)"),
+    after: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    db: Session = Depends(get_db)
+):
+    """Get all salaries, or one keyset page of them when `limit` is given"""
+    try:
+        stmt = apply_keyset(salary_select(*SALARY_LIST_COLUMNS), after=after, limit=limit)
+    except InvalidCursor as e:
+        return {"error": str(e)}
+    rows, cursor = next_cursor(db.execute(stmt).all(), limit=limit)
+    results = [format_row(row) for row in rows]
     
-    results = []
-    for s in salaries:
-        company = db.query(Company).filter(Company.id == s.company_id).first()
-        role = db.query(Role).filter(Role.id == s.role_id).first()
-        location = db.query(Location).filter(Location.id == s.location_id).first()
-        
-        results.append({
-            "id": s.id,
-            "company": company.name,
-            "role": role.title,
-            "location": f"{location.city}",
-            "total_compensation": s.total_compensation,
-            "base_salary": s.base_salary,
-            "bonus": s.bonus,
-            "stock_options": s.stock_options,
-            "years_of_experience": s.years_of_experience,
-            "employment_type": s.employment_type,
-            "currency": s.currency
-        })
+    if limit is None:
+        return {
+            "total": len(results),
+            "data": results
+        }
     
     return {
-        "total": len(results),
+        "total": db.execute(select(func.count(Salary.id))).scalar(),
+        "limit": limit,
+        "next_cursor": cursor,
         "data": results
     }
 
+@app.get("/api/salaries/stream")
+@statement_budget(1)
+def stream_salaries(
+    format: str = Query("ndjson", pattern="^(ndjson|json)$", description="ndjson lines or a chunked JSON array")
+):
+    """Stream all salaries with constant memory"""
+    stmt = salary_select(*SALARY_LIST_COLUMNS).order_by(Salary.id)
+    return StreamingResponse(
+        stream_rows(stmt, format),
+        media_type=STREAM_MEDIA_TYPES[format]
+    )
+
 @app.get("/api/salaries/{salary_id}")
+@statement_budget(1)
 def get_salary_by_id(salary_id: int, db: Session = Depends(get_db)):
     """Get single salary by ID"""
-    salary = db.query(Salary).filter(Salary.id == salary_id).first()
-    if not salary:
+    row = db.execute(
+        salary_select(*SALARY_DETAIL_COLUMNS).where(Salary.id == salary_id)
+    ).first()
+    if not row:
         return {"error": "Salary not found"}
     
-    company = db.query(Company).filter(Company.id == salary.company_id).first()
-    role = db.query(Role).filter(Role.id == salary.role_id).first()
-    location = db.query(Location).filter(Location.id == salary.location_id).first()
-    
+    return format_salary_detail(row)
+
+@app.get("/api/internal/cache")
+def cache_stats():
+    """Hit/miss counters and sizes of the in-process caches"""
     return {
-        "id": salary.id,
-        "company": {
-            "name": company.name,
-            "industry": company.industry,
-            "size": company.size
-        },
-        "role": {
-            "title": role.title,
-            "category": role.category,
-            "level": role.level
-        },
-        "location": {
-            "city": location.city,
-            "state": location.state
-        },
-        "compensation": {
-            "total": salary.total_compensation,
-            "base": salary.base_salary,
-            "bonus": salary.bonus,
-            "stocks": salary.stock_options,
-            "currency": salary.currency
-        },
-        "experience": {
-            "years_total": salary.years_of_experience,
-            "years_at_company": salary.years_at_company
-        },
-        "details": {
-            "employment_type": salary.employment_type,
-            "is_remote": salary.is_remote,
-            "submission_date": salary.submission_date.isoformat() if salary.submission_date else None
+        "data_version": data_version(),
+        "search_results": search_cache.stats(),
+        "stats_results": stats_cache.stats(),
+        "columnar": column_store.stats(),
+        "dimensions": {
+            "company": company_cache.stats(),
+            "role": role_cache.stats(),
+            "location": location_cache.stats()
         }
     }
 
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metrics():
+    """Prometheus metrics"""
+    pools = [("sync", engine, pool_metrics)]
+    if async_engine is not None:
+        pools.append(("async", async_engine.sync_engine, async_pool_metrics))
+    return PlainTextResponse(
+        render_metrics(pools), media_type="text/plain; version=0.0.4"
+    )
+
+
+@app.get("/api/internal/pool")
+def pool_stats():
+    """Database connection pool occupancy and checkout wait times"""
+    pools = {"sync": pool_status(engine, pool_metrics)}
+    if async_engine is not None:
+        pools["async"] = pool_status(async_engine.sync_engine, async_pool_metrics)
+    return pools
+
 # ============================================
 # INCLUDE ADVANCED ROUTES
 # ============================================
 
 from src.api.routes import router
-app.include_router(router)
\ No newline at end of file
+app.include_router(router)
+
+# Serve the database-backed routes through the async engine when enabled
+if USE_ASYNC_DB:
+    from src.api.async_routes import use_async_routes
+    use_async_routes(app)
+
+    @app.on_event("shutdown")
+    async def dispose_async_engine():
+        await async_engine.dispose()
\ No newline at end of file
@@ -0,0 +1,125 @@
+"""Keyset (cursor) pagination for the salary listing endpoints.
+
+A cursor is an opaque URL-safe token encoding the sort column and the
+(sort value, id) of the last row on a page. The next page seeks past that
+pair with an indexed `(sort, id) > (value, id)` predicate instead of an
+OFFSET, so deep pages cost the same as the first one. Rows inserted while
+a client is paging only ever appear at their own position in the order;
+rows already returned are never repeated or skipped.
+"""
+import base64
+import json
+import math
+from sqlalchemy import tuple_, select, func
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from src.models.salary import Salary
+
+SORT_COLUMNS = {
+    "id": Salary.id,
+    "total_compensation": Salary.total_compensation,
+    "years_of_experience": Salary.years_of_experience,
+}
+
+# JSON types a cursor's sort value may have, per sort column
+SORT_VALUE_TYPES = {
+    "id": (int,),
+    "total_compensation": (int, float),
+    "years_of_experience": (int,),
+}
+
+TOTAL_MODES = ("exact", "estimate", "none")
+
+
+class InvalidCursor(ValueError):
+    """Raised when an `after` token cannot be decoded for this sort"""
+
+
+def encode_cursor(sort, value, last_id):
+    """Opaque token for the position after (value, last_id)"""
+    payload = json.dumps([sort, value, last_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token, sort):
+    """Return (value, last_id) from a token produced by `encode_cursor`"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        cursor_sort, value, last_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError):
+        raise InvalidCursor("Invalid cursor")
+    if cursor_sort != sort or not _is_number(last_id, (int,)):
+        raise InvalidCursor("Cursor does not match sort order")
+    if not _is_number(value, SORT_VALUE_TYPES[sort]):
+        raise InvalidCursor("Invalid cursor")
+    return value, last_id
+
+
+def _is_number(value, types):
+    # bool is an int subclass; NaN and infinities never come from a row
+    if isinstance(value, bool) or not isinstance(value, types):
+        return False
+    return not isinstance(value, float) or math.isfinite(value)
+
+
+def apply_keyset(stmt, sort="id", descending=False, after=None, limit=None):
+    """Order `stmt` by (sort, id), seek past `after` and fetch one extra row.
+
+    The extra row lets `next_cursor` tell whether another page exists
+    without a separate count.
+    """
+    column = SORT_COLUMNS[sort]
+
+    if after:
+        value, last_id = decode_cursor(after, sort)
+        if sort == "id":
+            position = Salary.id < last_id if descending else Salary.id > last_id
+        else:
+            key = tuple_(column, Salary.id)
+            position = key < (value, last_id) if descending else key > (value, last_id)
+        stmt = stmt.where(position)
+
+    if sort == "id":
+        order = [Salary.id.desc() if descending else Salary.id]
+    else:
+        order = [column.desc(), Salary.id.desc()] if descending else [column, Salary.id]
+    stmt = stmt.order_by(*order)
+
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+    return stmt
+
+
+def next_cursor(rows, sort="id", limit=None):
+    """Trim the look-ahead row and return (rows, cursor for the next page)"""
+    if limit is None or len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]._mapping
+    return rows, encode_cursor(sort, last[sort], last["id"])
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, with its bound parameters"""
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    # Compiled by the executing dialect, so parameters use its paramstyle
+    # (pyformat for psycopg2, $n for asyncpg)
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def estimate_count(db: Session, stmt):
+    """Planner row estimate for `stmt` on Postgres, exact count elsewhere"""
+    if db.bind.dialect.name == "postgresql":
+        plan = db.execute(Explain(stmt)).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    return db.execute(select(func.count()).select_from(stmt.subquery())).scalar()
@@ -0,0 +1,194 @@
+"""Projected salary queries shared by the read endpoints.
+
+Every read endpoint selects exactly the columns it returns from one
+salary/company/role/location join, labelled with the response keys, so a
+page of results costs a single statement instead of one per row.
+"""
+from sqlalchemy import select, func, and_
+from src.models.company import Company
+from src.models.location import Location
+from src.models.role import Role
+from src.models.salary import Salary
+from src.database.search_index import text_filter
+
+
+def location_label(with_state=False):
+    """`city` or `city, state` labelled as `location`"""
+    if with_state:
+        return (Location.city + ", " + Location.state).label("location")
+    return Location.city.label("location")
+
+
+# Column projections, in response key order
+SALARY_LIST_COLUMNS = (
+    Salary.id,
+    Company.name.label("company"),
+    Role.title.label("role"),
+    location_label(),
+    Salary.total_compensation,
+    Salary.base_salary,
+    Salary.bonus,
+    Salary.stock_options,
+    Salary.years_of_experience,
+    Salary.employment_type,
+    Salary.currency,
+)
+
+SALARY_SEARCH_COLUMNS = (
+    Salary.id,
+    Company.name.label("company"),
+    Role.title.label("role"),
+    location_label(with_state=True),
+    Salary.total_compensation,
+    Salary.base_salary,
+    Salary.bonus,
+    Salary.stock_options,
+    Salary.years_of_experience,
+    Salary.employment_type,
+    Salary.is_remote,
+    Salary.currency,
+)
+
+COMPANY_SALARY_COLUMNS = (
+    Salary.id,
+    Role.title.label("role"),
+    location_label(),
+    Salary.total_compensation,
+    Salary.years_of_experience,
+)
+
+LOCATION_SALARY_COLUMNS = (
+    Salary.id,
+    Company.name.label("company"),
+    Role.title.label("role"),
+    Salary.total_compensation,
+    Salary.years_of_experience,
+)
+
+SALARY_DETAIL_COLUMNS = (
+    Salary.id,
+    Company.name.label("company_name"),
+    Company.industry.label("company_industry"),
+    Company.size.label("company_size"),
+    Role.title.label("role_title"),
+    Role.category.label("role_category"),
+    Role.level.label("role_level"),
+    Location.city.label("location_city"),
+    Location.state.label("location_state"),
+    Salary.total_compensation,
+    Salary.base_salary,
+    Salary.bonus,
+    Salary.stock_options,
+    Salary.currency,
+    Salary.years_of_experience,
+    Salary.years_at_company,
+    Salary.employment_type,
+    Salary.is_remote,
+    Salary.submission_date,
+)
+
+
+def salary_select(*columns):
+    """SELECT the given columns from salaries joined to its dimensions"""
+    return (
+        select(*columns)
+        .select_from(Salary)
+        .join(Company, Salary.company_id == Company.id)
+        .join(Role, Salary.role_id == Role.id)
+        .join(Location, Salary.location_id == Location.id)
+    )
+
+
+def salary_count(filters):
+    """SELECT COUNT(*) over the same join and filters as `salary_select`"""
+    stmt = salary_select(func.count(Salary.id))
+    if filters:
+        stmt = stmt.where(and_(*filters))
+    return stmt
+
+
+def salary_search_filters(
+    db,
+    company=None,
+    city=None,
+    role=None,
+    min_salary=None,
+    max_salary=None,
+    min_experience=None,
+    max_experience=None,
+    employment_type=None,
+    is_remote=None,
+):
+    """Build WHERE clauses for the salary search filters"""
+    filters = []
+
+    if company:
+        filters.append(text_filter(db, "company", company))
+
+    if city:
+        filters.append(text_filter(db, "city", city))
+
+    if role:
+        filters.append(text_filter(db, "role", role))
+
+    if min_salary:
+        filters.append(Salary.total_compensation >= min_salary)
+
+    if max_salary:
+        filters.append(Salary.total_compensation <= max_salary)
+
+    if min_experience is not None:
+        filters.append(Salary.years_of_experience >= min_experience)
+
+    if max_experience is not None:
+        filters.append(Salary.years_of_experience <= max_experience)
+
+    if employment_type:
+        filters.append(Salary.employment_type == employment_type)
+
+    if is_remote is not None:
+        filters.append(Salary.is_remote == is_remote)
+
+    return filters
+
+
+def format_row(row):
+    """Plain dict keyed by the projection labels"""
+    return dict(row._mapping)
+
+
+def format_salary_detail(row):
+    """Nested response for a single salary from SALARY_DETAIL_COLUMNS"""
+    return {
+        "id": row.id,
+        "company": {
+            "name": row.company_name,
+            "industry": row.company_industry,
+            "size": row.company_size
+        },
+        "role": {
+            "title": row.role_title,
+            "category": row.role_category,
+            "level": row.role_level
+        },
+        "location": {
+            "city": row.location_city,
+            "state": row.location_state
+        },
+        "compensation": {
+            "total": row.total_compensation,
+            "base": row.base_salary,
+            "bonus": row.bonus,
+            "stocks": row.stock_options,
+            "currency": row.currency
+        },
+        "experience": {
+            "years_total": row.years_of_experience,
+            "years_at_company": row.years_at_company
+        },
+        "details": {
+            "employment_type": row.employment_type,
+            "is_remote": row.is_remote,
+            "submission_date": row.submission_date.isoformat() if row.submission_date else None
+        }
+    }
@@ -1,16 +1,65 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, select, func
 from typing import Optional, List
 from src.database.database import get_db
+from src.database.search_index import best_match
+from src.database.rollups import (
+    record_salary,
+    record_salaries,
+    rollup_filters,
+    rollup_stats,
+    experience_curve,
+)
+from src.cache.suggest import suggest, add_suggestion, location_label, DEFAULT_SUGGEST_LIMIT
+from src.cache.dimensions import company_cache, role_cache, location_cache
+from src.cache.summary import get_summary
+from src.cache.data_version import bump_data_version
+from src.cache.results import search_cache, stats_cache, search_cache_key
+from src.cache.columnar import column_store, use_column_store
+from src.monitoring.query_guard import statement_budget
 from src.models.company import Company
 from src.models.location import Location
 from src.models.role import Role
 from src.models.salary import Salary
+from src.models.salary_experience_rollup import SalaryExperienceRollup
+from src.api.queries import (
+    salary_select,
+    salary_count,
+    salary_search_filters,
+    format_row,
+    SALARY_SEARCH_COLUMNS,
+    COMPANY_SALARY_COLUMNS,
+    LOCATION_SALARY_COLUMNS,
+)
+from src.api.stats import (
+    percentile_stats,
+    compare_stats,
+    format_comparison,
+    COMPARE_PERCENTILES,
+    COMPONENT_AVERAGES,
+    MAX_COMPARE_COMPANIES,
+    salary_histogram,
+    TooManyBins,
+    DEFAULT_HISTOGRAM_BINS,
+    MAX_HISTOGRAM_BINS,
+    experience_band_filters,
+    format_salary_stats,
+    format_rollup_stats,
+    EXPERIENCE_BAND_PATTERN,
+)
+from src.api.facets import facet_counts, DEFAULT_FACET_LIMIT
+from src.api.pagination import (
+    apply_keyset,
+    next_cursor,
+    estimate_count,
+    InvalidCursor,
+)
 
 router = APIRouter(prefix="/api", tags=["salaries"])
 
 @router.get("/search/salaries")
+@statement_budget(2)
 def search_salaries(
     company: Optional[str] = Query(None, description="Company name"),
     city: Optional[str] = Query(None, description="City name"),
@@ -23,6 +72,12 @@ def search_salaries(
     is_remote: Optional[bool] = Query(None, description="Remote jobs only"),
     limit: int = Query(10, ge=1, le=100, description="Number of results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    after: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    sort: str = Query("id", pattern="^(id|total_compensation|years_of_experience)$", description="Sort column"),
+    order: str = Query("asc", pattern="^(asc|desc)$", description="Sort direction"),
+    total: str = Query("exact", pattern="^(exact|estimate|none)$", description="Total count mode"),
+    facets: bool = Query(False, description="Include per company/city/role/experience counts"),
+    facet_limit: int = Query(DEFAULT_FACET_LIMIT, ge=1, le=100, description="Values per facet"),
     db: Session = Depends(get_db)
 ):
     """
@@ -36,166 +91,477 @@ def search_salaries(
     - Experience range
     - Employment type
     - Remote/On-site
-    """
-    
-    query = db.query(Salary).join(Company).join(Role).join(Location)
-    
-    # Apply filters
-    filters = []
-    
-    if company:
-        filters.append(Company.name.ilike(f"%{company}%"))
-    
-    if city:
-        filters.append(Location.city.ilike(f"%{city}%"))
     
-    if role:
-        filters.append(Role.title.ilike(f"%{role}%"))
+    Pass `after` with the previous page's `next_cursor` to seek instead of
+    using `offset`. `total=estimate` uses the planner's row estimate and
+    `total=none` skips counting altogether.
     
-    if min_salary:
-        filters.append(Salary.total_compensation >= min_salary)
-    
-    if max_salary:
-        filters.append(Salary.total_compensation <= max_salary)
-    
-    if min_experience is not None:
-        filters.append(Salary.years_of_experience >= min_experience)
-    
-    if max_experience is not None:
-        filters.append(Salary.years_of_experience <= max_experience)
+    `facets=true` adds `facets`: how many matching salaries each company,
+    city, role and experience band has, from one grouped statement that
+    also yields the exact total.
+    """
     
-    if employment_type:
-        filters.append(Salary.employment_type == employment_type)
+    cache_key = search_cache_key(
+        company=company,
+        city=city,
+        role=role,
+        min_salary=min_salary,
+        max_salary=max_salary,
+        min_experience=min_experience,
+        max_experience=max_experience,
+        employment_type=employment_type,
+        is_remote=is_remote,
+        limit=limit,
+        offset=offset,
+        after=after,
+        sort=sort,
+        order=order,
+        total=total,
+        facet_limit=facet_limit if facets else None,
+    )
+    cached = search_cache.get(cache_key)
+    if cached is not None:
+        return cached
     
-    if is_remote is not None:
-        filters.append(Salary.is_remote == is_remote)
+    filters = salary_search_filters(
+        db,
+        company=company,
+        city=city,
+        role=role,
+        min_salary=min_salary,
+        max_salary=max_salary,
+        min_experience=min_experience,
+        max_experience=max_experience,
+        employment_type=employment_type,
+        is_remote=is_remote,
+    )
     
+    stmt = salary_select(*SALARY_SEARCH_COLUMNS)
     if filters:
-        query = query.filter(and_(*filters))
-    
-    # Get total count
-    total = query.count()
+        stmt = stmt.where(and_(*filters))
+    
+    # Get total count (facet counts include it)
+    facet_values = None
+    if facets:
+        facet_total, facet_values = facet_counts(db, filters, facet_limit)
+    
+    if facets and total != "none":
+        total_count = facet_total
+    elif total == "exact":
+        total_count = db.execute(salary_count(filters)).scalar()
+    elif total == "estimate":
+        total_count = estimate_count(db, stmt)
+    else:
+        total_count = None
     
     # Apply pagination
-    salaries = query.offset(offset).limit(limit).all()
+    try:
+        page = apply_keyset(stmt, sort, order == "desc", after, limit)
+    except InvalidCursor as e:
+        return {"error": str(e)}
+    if not after:
+        page = page.offset(offset)
+    rows, cursor = next_cursor(db.execute(page).all(), sort, limit)
     
     # Format results
-    results = []
-    for s in salaries:
-        company_obj = db.query(Company).filter(Company.id == s.company_id).first()
-        role_obj = db.query(Role).filter(Role.id == s.role_id).first()
-        location_obj = db.query(Location).filter(Location.id == s.location_id).first()
-        
-        results.append({
-            "id": s.id,
-            "company": company_obj.name,
-            "role": role_obj.title,
-            "location": f"{location_obj.city}, {location_obj.state}",
-            "total_compensation": s.total_compensation,
-            "base_salary": s.base_salary,
-            "bonus": s.bonus,
-            "stock_options": s.stock_options,
-            "years_of_experience": s.years_of_experience,
-            "employment_type": s.employment_type,
-            "is_remote": s.is_remote,
-            "currency": s.currency
-        })
+    results = [format_row(row) for row in rows]
     
-    return {
-        "total": total,
+    response = {
+        "total": total_count,
         "limit": limit,
-        "offset": offset,
+        "offset": 0 if after else offset,
         "results": len(results),
+        "next_cursor": cursor,
         "data": results
     }
+    if facet_values is not None:
+        response["facets"] = facet_values
+    search_cache.set(cache_key, response)
+    return response
 
 
 @router.get("/salaries/by-company/{company_name}")
-def get_salaries_by_company(company_name: str, db: Session = Depends(get_db)):
+@statement_budget(3)
+def get_salaries_by_company(
+    company_name: str,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size (omit for all rows)"),
+    after: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    db: Session = Depends(get_db)
+):
     """Get all salaries for a specific company"""
     
-    company = db.query(Company).filter(Company.name.ilike(f"%{company_name}%")).first()
+    company = best_match(db, "company", company_name)
     
     if not company:
         return {"error": "Company not found", "data": []}
     
-    salaries = db.query(Salary).filter(Salary.company_id == company.id).all()
+    stmt = salary_select(*COMPANY_SALARY_COLUMNS).where(Salary.company_id == company.id)
+    try:
+        stmt = apply_keyset(stmt, after=after, limit=limit)
+    except InvalidCursor as e:
+        return {"error": str(e), "data": []}
+    rows, cursor = next_cursor(db.execute(stmt).all(), limit=limit)
     
-    results = []
-    for s in salaries:
-        role = db.query(Role).filter(Role.id == s.role_id).first()
-        location = db.query(Location).filter(Location.id == s.location_id).first()
-        
-        results.append({
-            "id": s.id,
-            "role": role.title,
-            "location": f"{location.city}",
-            "total_compensation": s.total_compensation,
-            "years_of_experience": s.years_of_experience
-        })
+    results = [format_row(row) for row in rows]
+    
+    if limit is None:
+        return {
+            "company": company.name,
+            "total_salaries": len(results),
+            "data": results
+        }
     
     return {
         "company": company.name,
-        "total_salaries": len(results),
+        "total_salaries": db.execute(
+            select(func.count(Salary.id)).where(Salary.company_id == company.id)
+        ).scalar(),
+        "next_cursor": cursor,
         "data": results
     }
 
 
 @router.get("/salaries/by-location/{city}")
-def get_salaries_by_location(city: str, db: Session = Depends(get_db)):
+@statement_budget(3)
+def get_salaries_by_location(
+    city: str,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size (omit for all rows)"),
+    after: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    db: Session = Depends(get_db)
+):
     """Get all salaries for a specific city"""
     
-    location = db.query(Location).filter(Location.city.ilike(f"%{city}%")).first()
+    location = best_match(db, "city", city)
     
     if not location:
         return {"error": "Location not found", "data": []}
     
-    salaries = db.query(Salary).filter(Salary.location_id == location.id).all()
+    stmt = salary_select(*LOCATION_SALARY_COLUMNS).where(Salary.location_id == location.id)
+    try:
+        stmt = apply_keyset(stmt, after=after, limit=limit)
+    except InvalidCursor as e:
+        return {"error": str(e), "data": []}
+    rows, cursor = next_cursor(db.execute(stmt).all(), limit=limit)
     
-    results = []
-    for s in salaries:
-        company = db.query(Company).filter(Company.id == s.company_id).first()
-        role = db.query(Role).filter(Role.id == s.role_id).first()
-        
-        results.append({
-            "id": s.id,
-            "company": company.name,
-            "role": role.title,
-            "total_compensation": s.total_compensation,
-            "years_of_experience": s.years_of_experience
-        })
+    results = [format_row(row) for row in rows]
+    
+    if limit is None:
+        return {
+            "location": f"{location.city}, {location.state}",
+            "total_salaries": len(results),
+            "average_salary": sum(r["total_compensation"] for r in results) / len(results) if results else 0,
+            "data": results
+        }
+    
+    count, average = db.execute(
+        select(func.count(Salary.id), func.avg(Salary.total_compensation))
+        .where(Salary.location_id == location.id)
+    ).one()
     
     return {
         "location": f"{location.city}, {location.state}",
-        "total_salaries": len(results),
-        "average_salary": sum(s.total_compensation for s in salaries) / len(salaries) if salaries else 0,
+        "total_salaries": count,
+        "average_salary": average or 0,
+        "next_cursor": cursor,
         "data": results
     }
 
 
 @router.get("/stats/salary-range")
-def get_salary_range_stats(db: Session = Depends(get_db)):
-    """Get salary statistics and ranges"""
+@statement_budget(1)
+def get_salary_range_stats(
+    company: Optional[str] = Query(None, description="Company name"),
+    city: Optional[str] = Query(None, description="City name"),
+    role: Optional[str] = Query(None, description="Role title"),
+    experience_band: Optional[str] = Query(None, pattern=EXPERIENCE_BAND_PATTERN, description="Experience band"),
+    group_by: Optional[str] = Query(None, pattern="^(company|role|city|level|experience_band)$", description="Group results by"),
+    db: Session = Depends(get_db)
+):
+    """
+    📊 Salary Statistics
+    
+    Min/max/average/median plus p10-p90 of total compensation, computed
+    in the database. Optionally filtered and grouped by company, role,
+    city, level or experience band.
+    """
+    
+    if use_column_store():
+        stats = column_store.percentile_stats(
+            *column_store.mask(
+                company=company, city=city, role=role, **experience_band_filters(experience_band)
+            ),
+            group_by,
+        )
+    else:
+        filters = salary_search_filters(
+            db,
+            company=company,
+            city=city,
+            role=role,
+            **experience_band_filters(experience_band),
+        )
+        stats = percentile_stats(db, filters, group_by)
+    
+    if group_by:
+        return {
+            "group_by": group_by,
+            "groups": [
+                {group_by: s["group"], **format_salary_stats(s)} for s in stats
+            ]
+        }
+    
+    if not stats or not stats[0]["count"]:
+        return {"error": "No data available"}
+    
+    return format_salary_stats(stats[0])
+
+
+@router.get("/stats/histogram")
+@statement_budget(1)
+def get_salary_histogram(
+    company: Optional[str] = Query(None, description="Company name"),
+    city: Optional[str] = Query(None, description="City name"),
+    role: Optional[str] = Query(None, description="Role title"),
+    min_salary: Optional[float] = Query(None, description="Minimum salary"),
+    max_salary: Optional[float] = Query(None, description="Maximum salary"),
+    min_experience: Optional[int] = Query(None, description="Minimum years of experience"),
+    max_experience: Optional[int] = Query(None, description="Maximum years of experience"),
+    employment_type: Optional[str] = Query(None, description="Employment type"),
+    is_remote: Optional[bool] = Query(None, description="Remote jobs only"),
+    value: str = Query("total_compensation", pattern="^(total_compensation|base_salary)$", description="Column to bin"),
+    bins: int = Query(DEFAULT_HISTOGRAM_BINS, ge=1, le=MAX_HISTOGRAM_BINS, description="Number of bins"),
+    bin_width: Optional[float] = Query(None, gt=0, description="Bin width (overrides bins)"),
+    db: Session = Depends(get_db)
+):
+    """
+    📶 Salary Distribution
+    
+    Equal-width histogram of total compensation or base salary over the
+    same filters as the salary search, binned in the database. Bin `i`
+    covers `[start + i * bin_width, start + (i + 1) * bin_width)`; the
+    last bin also holds the maximum.
+    """
+    
+    search = dict(
+        company=company,
+        city=city,
+        role=role,
+        min_salary=min_salary,
+        max_salary=max_salary,
+        min_experience=min_experience,
+        max_experience=max_experience,
+        employment_type=employment_type,
+        is_remote=is_remote,
+    )
+    try:
+        if use_column_store():
+            return column_store.histogram(*column_store.mask(**search), value, bins, bin_width)
+        return salary_histogram(db, salary_search_filters(db, **search), value, bins, bin_width)
+    except TooManyBins as e:
+        return {"error": str(e)}
+
+
+@router.get("/stats/summary")
+@statement_budget(2)
+def get_stats_summary(db: Session = Depends(get_db)):
+    """
+    🏠 Home Page Summary
+    
+    Company count, salary count, average and median in one call, served
+    from the rollup table and cached until the next write.
+    """
+    return get_summary(db)
+
+
+@router.get("/stats/aggregates")
+@statement_budget(1)
+def get_aggregate_stats(
+    company: Optional[str] = Query(None, description="Company name"),
+    city: Optional[str] = Query(None, description="City name"),
+    role: Optional[str] = Query(None, description="Role title"),
+    level: Optional[str] = Query(None, description="Role level (Entry, Mid, Senior)"),
+    group_by: Optional[str] = Query(None, pattern="^(company|role|city|level)$", description="Group results by"),
+    db: Session = Depends(get_db)
+):
+    """
+    🧮 Pre-aggregated Salary Statistics
     
-    salaries = db.query(Salary).all()
+    Answered from the company x role x city rollup table, so the cost
+    grows with the number of groups rather than the number of salaries.
+    Percentiles interpolate between ranks like `/stats/salary-range`,
+    estimated from a mergeable sketch with 1% relative error.
+    """
+    
+    filters = rollup_filters(db, company=company, role=role, city=city, level=level)
+    stats = rollup_stats(db, filters, group_by)
     
-    if not salaries:
+    if group_by:
+        return {
+            "group_by": group_by,
+            "groups": [
+                {group_by: s["group"], **format_rollup_stats(s)} for s in stats
+            ]
+        }
+    
+    if not stats or not stats[0]["count"]:
         return {"error": "No data available"}
     
-    compensations = [s.total_compensation for s in salaries]
+    return format_rollup_stats(stats[0])
+
+
+@router.get("/stats/experience-curve")
+@statement_budget(1)
+def get_experience_curve(
+    company: Optional[str] = Query(None, description="Company name"),
+    city: Optional[str] = Query(None, description="City name"),
+    role: Optional[str] = Query(None, description="Role title"),
+    level: Optional[str] = Query(None, description="Role level (Entry, Mid, Senior)"),
+    min_count: int = Query(1, ge=1, description="Leave out years with fewer salaries"),
+    db: Session = Depends(get_db)
+):
+    """
+    📈 Experience Curve
+    
+    p25/p50/p75 of total compensation for each year of experience,
+    answered from the per-year rollup table and cached until the next
+    write. Percentiles are sketch estimates with 1% relative error.
+    """
+    
+    cache_key = search_cache_key(
+        endpoint="experience-curve",
+        company=company,
+        city=city,
+        role=role,
+        level=level,
+        min_count=min_count,
+    )
+    cached = stats_cache.get(cache_key)
+    if cached is not None:
+        return cached
     
+    filters = rollup_filters(
+        db, company=company, role=role, city=city, level=level, model=SalaryExperienceRollup
+    )
+    curve = [
+        {
+            "years_of_experience": point["years_of_experience"],
+            "count": point["count"],
+            "average_salary": point["avg"],
+            **point["percentiles"],
+        }
+        for point in experience_curve(db, filters)
+        if point["count"] >= min_count
+    ]
+    
+    response = {
+        "total_entries": sum(point["count"] for point in curve),
+        "data": curve
+    }
+    stats_cache.set(cache_key, response)
+    return response
+
+
+@router.get("/compare")
+@statement_budget(1 + 2 * MAX_COMPARE_COMPANIES, max_repeats=MAX_COMPARE_COMPANIES)
+def compare_companies(
+    companies: str = Query(..., description="Comma-separated company names"),
+    role: Optional[str] = Query(None, description="Role title"),
+    level: Optional[str] = Query(None, description="Role level (Entry, Mid, Senior)"),
+    city: Optional[str] = Query(None, description="City name"),
+    db: Session = Depends(get_db)
+):
+    """
+    ⚖️ Compare Companies
+    
+    Count, median, p75 and the average base/bonus/stock split of total
+    compensation for up to five companies side by side, from one grouped
+    statement. Names are matched exactly from the company cache first,
+    then by the closest search match.
+    """
+    
+    names = list(dict.fromkeys(n.strip() for n in companies.split(",") if n.strip()))
+    if not names:
+        return {"error": "No companies given"}
+    if len(names) > MAX_COMPARE_COMPANIES:
+        return {"error": f"At most {MAX_COMPARE_COMPANIES} companies can be compared"}
+    
+    cache_key = search_cache_key(
+        endpoint="compare",
+        companies=",".join(names),
+        role=role,
+        level=level,
+        city=city,
+    )
+    cached = stats_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    matched = {
+        name: company_cache.find(db, name) or best_match(db, "company", name)
+        for name in names
+    }
+    found = {name: company for name, company in matched.items() if company}
+    
+    stats = {}
+    company_ids = list({c.id for c in found.values()})
+    if found and use_column_store():
+        columns, mask = column_store.mask(role=role, city=city, level=level, company_ids=company_ids)
+        stats = {
+            s["group"]: s for s in column_store.percentile_stats(
+                columns, mask, "company_id",
+                percentiles=COMPARE_PERCENTILES, averages=COMPONENT_AVERAGES,
+            )
+        }
+    elif found:
+        filters = salary_search_filters(db, role=role, city=city)
+        if level:
+            filters.append(Role.level == level)
+        stats = compare_stats(db, company_ids, filters)
+    
+    response = {
+        "role": role,
+        "level": level,
+        "city": city,
+        "data": [
+            {
+                "query": name,
+                "company": company.name,
+                **(format_comparison(stats[company.id]) if company.id in stats
+                   else {"total_entries": 0}),
+            }
+            for name, company in found.items()
+        ],
+        "not_found": [name for name, company in matched.items() if not company]
+    }
+    stats_cache.set(cache_key, response)
+    return response
+
+
+@router.get("/suggest")
+@statement_budget(0)
+def suggest_names(
+    kind: str = Query(..., pattern="^(company|role|city|location)$", description="company, role, city or location (City, State)"),
+    q: str = Query(..., min_length=1, description="Prefix typed so far"),
+    limit: int = Query(DEFAULT_SUGGEST_LIMIT, ge=1, le=50, description="Number of suggestions")
+):
+    """
+    ⌨️ Typeahead Suggestions
+    
+    Served from the in-memory prefix index, no database query.
+    """
     return {
-        "total_entries": len(salaries),
-        "min_salary": min(compensations),
-        "max_salary": max(compensations),
-        "average_salary": sum(compensations) / len(compensations),
-        "median_salary": sorted(compensations)[len(compensations) // 2]
+        "kind": kind,
+        "query": q,
+        "data": suggest(kind, q, limit)
     }
 
 
 from src.schemas.salary import SalaryCreate
 
+# Worst case: three dimension cache misses, the insert, then per rollup
+# table a locking select and an INSERT or UPDATE of the group
 @router.post("/salaries/submit")
+@statement_budget(8)
 def submit_salary(
     salary_data: SalaryCreate,
     db: Session = Depends(get_db)
@@ -207,17 +573,17 @@ def submit_salary(
     """
     
     # Verify company exists
-    company = db.query(Company).filter(Company.id == salary_data.company_id).first()
+    company = company_cache.get(db, salary_data.company_id)
     if not company:
         return {"error": "Company not found"}
     
     # Verify role exists
-    role = db.query(Role).filter(Role.id == salary_data.role_id).first()
+    role = role_cache.get(db, salary_data.role_id)
     if not role:
         return {"error": "Role not found"}
     
     # Verify location exists
-    location = db.query(Location).filter(Location.id == salary_data.location_id).first()
+    location = location_cache.get(db, salary_data.location_id)
     if not location:
         return {"error": "Location not found"}
     
@@ -240,20 +606,106 @@ def submit_salary(
     )
     
     db.add(new_salary)
+    db.flush()
+    salary_id = new_salary.id
+    record_salary(db, new_salary, role.level)
     db.commit()
-    db.refresh(new_salary)
+    bump_data_version()
+    column_store.append([{**salary_data.model_dump(), "id": salary_id}])
     
     return {
         "message": "Salary submitted successfully!",
-        "id": new_salary.id,
+        "id": salary_id,
         "company": company.name,
         "role": role.title,
         "location": f"{location.city}, {location.state}",
-        "total_compensation": new_salary.total_compensation
+        "total_compensation": salary_data.total_compensation
+    }
+
+
+from src.api.batch import (
+    MAX_SALARY_BATCH,
+    salary_batch_body,
+    parse_salary_batch,
+    existing_references,
+    insert_salaries
+)
+
+# Independent of the batch size: three reference checks, the salary
+# INSERT, then per rollup table a locking select, one INSERT of the new
+# groups and one executemany UPDATE of the existing ones
+@router.post("/salaries/submit/batch")
+@statement_budget(10)
+def submit_salary_batch(
+    body: tuple = Depends(salary_batch_body),
+    db: Session = Depends(get_db)
+):
+    """
+    📦 Submit Salaries in Bulk
+    
+    Accepts a JSON array or NDJSON body of salary submissions. Valid items
+    are inserted in one transaction; every item gets its own result.
+    """
+    
+    try:
+        items = parse_salary_batch(*body)
+    except ValueError as e:
+        return {"error": str(e)}
+    if not items:
+        return {"error": "No salaries in request body"}
+    if len(items) > MAX_SALARY_BATCH:
+        return {"error": f"Batch too large: {len(items)} items (max {MAX_SALARY_BATCH})"}
+    
+    # Verify companies, roles and locations: one query per dimension
+    valid = [item for item in items if isinstance(item, SalaryCreate)]
+    company_ids, role_levels, location_ids = existing_references(db, valid)
+    
+    results = []
+    rows = []
+    for index, item in enumerate(items):
+        if not isinstance(item, SalaryCreate):
+            error = item
+        elif item.company_id not in company_ids:
+            error = "Company not found"
+        elif item.role_id not in role_levels:
+            error = "Role not found"
+        elif item.location_id not in location_ids:
+            error = "Location not found"
+        else:
+            error = None
+        
+        if error:
+            results.append({"index": index, "status": "error", "error": error})
+        else:
+            results.append({"index": index, "status": "created"})
+            rows.append(dict(item.model_dump(), is_verified=False))
+    
+    if rows:
+        ids = insert_salaries(db, rows)
+        record_salaries(db, [
+            (row["company_id"], row["role_id"], row["location_id"],
+             role_levels[row["role_id"]], row["years_of_experience"], row["total_compensation"])
+            for row in rows
+        ])
+        db.commit()
+        bump_data_version()
+        column_store.append([dict(row, id=salary_id) for row, salary_id in zip(rows, ids)])
+        
+        created = iter(ids)
+        for result in results:
+            if result["status"] == "created":
+                result["id"] = next(created)
+    
+    return {
+        "message": f"{len(rows)} of {len(items)} salaries submitted",
+        "created": len(rows),
+        "failed": len(items) - len(rows),
+        "results": results
     }
 
 
 @router.post("/companies/add")
+@statement_budget(3)
 def add_company(
     name: str,
     industry: Optional[str] = None,
@@ -269,7 +721,7 @@ def add_company(
     """
     
     # Check if company already exists
-    existing = db.query(Company).filter(Company.name == name).first()
+    existing = company_cache.find(db, name)
     if existing:
         return {"error": "Company already exists", "id": existing.id, "name": existing.name}
     
@@ -284,6 +736,10 @@ def add_company(
     db.add(new_company)
     db.commit()
     db.refresh(new_company)
+    bump_data_version()
+    company_cache.put(new_company)
+    add_suggestion("company", new_company.id, new_company.name)
+    column_store.add_dimension("company", new_company.id, name=new_company.name)
     
     return {
         "message": "Company added successfully!",
@@ -294,6 +750,7 @@ def add_company(
 
 
 @router.post("/locations/add")
+@statement_budget(3)
 def add_location(
     city: str,
     state: str,
@@ -308,10 +765,7 @@ def add_location(
     """
     
     # Check if location already exists
-    existing = db.query(Location).filter(
-        Location.city == city,
-        Location.state == state
-    ).first()
+    existing = location_cache.find(db, city, state)
     
     if existing:
         return {"error": "Location already exists", "id": existing.id}
@@ -326,6 +780,11 @@ def add_location(
     db.add(new_location)
     db.commit()
     db.refresh(new_location)
+    bump_data_version()
+    location_cache.put(new_location)
+    add_suggestion("city", new_location.id, new_location.city)
+    add_suggestion("location", new_location.id, location_label(new_location.city, new_location.state))
+    column_store.add_dimension("city", new_location.id, city=new_location.city)
     
     return {
         "message": "Location added successfully!",
@@ -336,6 +795,7 @@ def add_location(
 
 
 @router.post("/roles/add")
+@statement_budget(3)
 def add_role(
     title: str,
     category: Optional[str] = None,
@@ -349,7 +809,7 @@ def add_role(
     """
     
     # Check if role already exists
-    existing = db.query(Role).filter(Role.title == title).first()
+    existing = role_cache.find(db, title)
     if existing:
         return {"error": "Role already exists", "id": existing.id, "title": existing.title}
     
@@ -362,6 +822,10 @@ def add_role(
     db.add(new_role)
     db.commit()
     db.refresh(new_role)
+    bump_data_version()
+    role_cache.put(new_role)
+    add_suggestion("role", new_role.id, new_role.title)
+    column_store.add_dimension("role", new_role.id, title=new_role.title, level=new_role.level)
     
     return {
         "message": "Role added successfully!",
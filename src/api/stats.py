@@ -0,0 +1,323 @@
+"""Salary statistics computed inside the database.
+
+`percentile_stats` returns count/min/max/avg and a set of percentiles per
+group in a single statement. Postgres uses `percentile_cont` directly.
+SQLite has no ordered-set aggregates, so rows are ranked with window
+functions in a CTE and the two values around each percentile position are
+picked out by conditional aggregates; the linear interpolation between
+them (the same definition `percentile_cont` uses) is finished in Python.
+
+`compare_stats` puts a few companies side by side, again in one grouped
+statement, with the average base/bonus/stock split of each.
+
+`salary_histogram` bins a salary column over the filtered rows in one
+statement as well: `width_bucket` on Postgres, integer division by the
+bin width elsewhere. Only the per-bin counts leave the database.
+"""
+import math
+from sqlalchemy import select, func, case, cast, and_, true, Integer, Float
+from src.models.company import Company
+from src.models.location import Location
+from src.models.role import Role
+from src.models.salary import Salary
+from src.api.queries import salary_select
+
+PERCENTILES = (0.10, 0.25, 0.50, 0.75, 0.90)
+
+# (label, min years, max years) - max is None for the open-ended band
+EXPERIENCE_BANDS = (
+    ("0-2", 0, 2),
+    ("3-5", 3, 5),
+    ("6-9", 6, 9),
+    ("10+", 10, None),
+)
+
+
+EXPERIENCE_BAND_PATTERN = "^(" + "|".join(
+    label.replace("+", "\\+") for label, _, _ in EXPERIENCE_BANDS
+) + ")$"
+
+
+def experience_band_filters(band):
+    """`salary_search_filters` experience kwargs for a band label"""
+    for label, low, high in EXPERIENCE_BANDS:
+        if label == band:
+            return {"min_experience": low, "max_experience": high}
+    return {}
+
+
+def experience_band_column():
+    """CASE expression mapping years_of_experience to its band label"""
+    whens = [
+        (Salary.years_of_experience <= high, label)
+        for label, low, high in EXPERIENCE_BANDS if high is not None
+    ]
+    return case(*whens, else_=EXPERIENCE_BANDS[-1][0])
+
+
+GROUP_BY_COLUMNS = {
+    "company": lambda: Company.name,
+    "company_id": lambda: Salary.company_id,
+    "role": lambda: Role.title,
+    "city": lambda: Location.city,
+    "level": lambda: Role.level,
+    "experience_band": experience_band_column,
+}
+
+
+def percentile_key(p):
+    """Response key for a percentile, e.g. 0.5 -> 'p50'"""
+    return f"p{round(p * 100)}"
+
+
+def percentile_stats(db, filters, group_by=None, value=Salary.total_compensation,
+                     percentiles=PERCENTILES, averages=None):
+    """Aggregate `value` over the filtered salaries, one dict per group.
+
+    `averages` maps extra response keys to Salary columns whose mean is
+    returned alongside the standard aggregates.
+    """
+    group = GROUP_BY_COLUMNS[group_by]().label("group") if group_by else None
+    averages = averages or {}
+
+    if db.get_bind().dialect.name == "postgresql":
+        columns = [
+            func.count(value).label("count"),
+            func.min(value).label("min"),
+            func.max(value).label("max"),
+            func.avg(value).label("avg"),
+        ]
+        columns += [
+            func.percentile_cont(p).within_group(value).label(percentile_key(p))
+            for p in percentiles
+        ]
+        columns += [func.avg(col).label(key) for key, col in averages.items()]
+        stmt = salary_select(*([group] if group is not None else []), *columns)
+        if filters:
+            stmt = stmt.where(and_(*filters))
+        if group is not None:
+            stmt = stmt.group_by(group).order_by(group)
+        return [_pg_row(row, percentiles) for row in db.execute(stmt)]
+
+    return _ranked_percentile_stats(db, filters, group, value, percentiles, averages)
+
+
+def _pg_row(row, percentiles):
+    data = dict(row._mapping)
+    data["percentiles"] = {percentile_key(p): data.pop(percentile_key(p)) for p in percentiles}
+    return data
+
+
+def _ranked_percentile_stats(db, filters, group, value, percentiles, averages):
+    partition = [group] if group is not None else None
+    ranked = salary_select(
+        *([group] if group is not None else []),
+        value.label("v"),
+        func.row_number().over(partition_by=partition, order_by=value).label("rn"),
+        func.count().over(partition_by=partition).label("n"),
+        *[col.label(key) for key, col in averages.items()],
+    )
+    if filters:
+        ranked = ranked.where(and_(*filters))
+    ranked = ranked.cte("ranked")
+
+    columns = [
+        func.count().label("count"),
+        func.min(ranked.c.v).label("min"),
+        func.max(ranked.c.v).label("max"),
+        func.avg(ranked.c.v).label("avg"),
+    ]
+    for p in percentiles:
+        position = cast(p * (ranked.c.n - 1), Integer) + 1
+        key = percentile_key(p)
+        columns.append(func.max(case((ranked.c.rn == position, ranked.c.v))).label(f"{key}_lo"))
+        columns.append(func.max(case((ranked.c.rn == position + 1, ranked.c.v))).label(f"{key}_hi"))
+    columns += [func.avg(ranked.c[key]).label(key) for key in averages]
+
+    stmt = select(*([ranked.c.group] if group is not None else []), *columns).select_from(ranked)
+    if group is not None:
+        stmt = stmt.group_by(ranked.c.group).order_by(ranked.c.group)
+
+    results = []
+    for row in db.execute(stmt):
+        data = dict(row._mapping)
+        count = data["count"]
+        data["percentiles"] = {}
+        for p in percentiles:
+            key = percentile_key(p)
+            lo, hi = data.pop(f"{key}_lo"), data.pop(f"{key}_hi")
+            if lo is None:
+                data["percentiles"][key] = None
+                continue
+            position = p * (count - 1)
+            fraction = position - math.floor(position)
+            data["percentiles"][key] = lo + fraction * (hi - lo) if hi is not None else lo
+        results.append(data)
+    return results
+
+
+def format_salary_stats(stats):
+    """Response body for one `percentile_stats` result"""
+    return {
+        "total_entries": stats["count"],
+        "min_salary": stats["min"],
+        "max_salary": stats["max"],
+        "average_salary": stats["avg"],
+        "median_salary": stats["percentiles"].get("p50"),
+        "percentiles": stats["percentiles"]
+    }
+
+
+def format_rollup_stats(stats):
+    """Response body for one `rollup_stats` result"""
+    return {
+        **format_salary_stats(stats),
+        "stddev_salary": stats["stddev"]
+    }
+
+
+# ==================== COMPARISON ====================
+
+COMPARE_PERCENTILES = (0.50, 0.75)
+MAX_COMPARE_COMPANIES = 5
+
+# Response key -> Salary column; missing bonus/stock count as zero
+COMPENSATION_COMPONENTS = {
+    "base": "base_salary",
+    "bonus": "bonus",
+    "stock": "stock_options",
+}
+
+# `averages` keys used for the components by `compare_stats`
+COMPONENT_AVERAGES = {f"avg_{key}": name for key, name in COMPENSATION_COMPONENTS.items()}
+
+
+def compare_stats(db, company_ids, filters):
+    """`percentile_stats` per company for `company_ids`, keyed by company id"""
+    stats = percentile_stats(
+        db,
+        [Salary.company_id.in_(company_ids), *filters],
+        group_by="company_id",
+        percentiles=COMPARE_PERCENTILES,
+        averages={
+            key: func.coalesce(getattr(Salary, name), 0) for key, name in COMPONENT_AVERAGES.items()
+        },
+    )
+    return {s["group"]: s for s in stats}
+
+
+def format_comparison(stats):
+    """Response body for one `compare_stats` entry"""
+    averages = {key: stats[f"avg_{key}"] or 0 for key in COMPENSATION_COMPONENTS}
+    total = sum(averages.values())
+    return {
+        "total_entries": stats["count"],
+        "average_salary": stats["avg"],
+        "median_salary": stats["percentiles"]["p50"],
+        "p75_salary": stats["percentiles"]["p75"],
+        "average_components": averages,
+        "mix": {key: value / total if total else None for key, value in averages.items()},
+    }
+
+
+# ==================== HISTOGRAMS ====================
+
+HISTOGRAM_VALUES = {
+    "total_compensation": Salary.total_compensation,
+    "base_salary": Salary.base_salary,
+}
+
+DEFAULT_HISTOGRAM_BINS = 20
+MAX_HISTOGRAM_BINS = 200
+
+
+class TooManyBins(ValueError):
+    """`bin_width` would split the range into more than MAX_HISTOGRAM_BINS"""
+
+
+def salary_histogram(db, filters, value="total_compensation", bins=DEFAULT_HISTOGRAM_BINS,
+                     bin_width=None):
+    """Counts of `value` in equal-width bins over the filtered salaries.
+
+    With `bins` the range from the smallest to the largest matching value
+    is split into that many bins. With `bin_width` bins start at a
+    multiple of the width instead, e.g. every 5 lakh.
+    """
+    matching = salary_select(HISTOGRAM_VALUES[value].label("v"))
+    if filters:
+        matching = matching.where(and_(*filters))
+    matching = matching.cte("matching")
+    bounds = select(
+        func.min(matching.c.v).label("lo"), func.max(matching.c.v).label("hi")
+    ).cte("bounds")
+    v, lo, hi = matching.c.v, bounds.c.lo, bounds.c.hi
+    postgres = db.get_bind().dialect.name == "postgresql"
+
+    def floor(expr):
+        # CAST rounds on Postgres; elsewhere it truncates, which for the
+        # non-negative values here is floor
+        return cast(func.floor(expr) if postgres else expr, Integer)
+
+    if bin_width:
+        # Kept in floating point: with a tiny width the bin number of a
+        # salary in crores does not fit a Postgres integer
+        start = (func.floor(lo / bin_width) if postgres else floor(lo / bin_width)) * bin_width
+        start = cast(start, Float)
+        offset = (v - start) / bin_width
+        # Clamped before the cast, so a tiny width still returns at most
+        # MAX + 1 groups and the TooManyBins error below
+        bucket = floor(case((offset > MAX_HISTOGRAM_BINS, MAX_HISTOGRAM_BINS), else_=offset))
+    elif postgres:
+        start = lo
+        bucket = func.least(func.width_bucket(v, lo, hi, bins), bins) - 1
+    else:
+        start = lo
+        bucket = floor((v - lo) * bins / (hi - lo))
+        # The maximum itself lands on the upper edge of the last bin
+        bucket = case((bucket >= bins, bins - 1), else_=bucket)
+    if not bin_width:
+        # All values equal: one bin holding everything
+        bucket = case((hi == lo, 0), else_=bucket)
+    bucket = bucket.label("bucket")
+
+    stmt = (
+        select(
+            bucket,
+            func.count().label("count"),
+            func.min(start).label("start"),
+            func.min(lo).label("lo"),
+            func.max(hi).label("hi"),
+        )
+        .select_from(matching.join(bounds, true()))
+        .group_by(bucket)
+        .order_by(bucket)
+    )
+    rows = db.execute(stmt).all()
+    if not rows:
+        return {"value": value, "total": 0, "min": None, "max": None,
+                "start": None, "bin_width": bin_width, "counts": []}
+
+    first = rows[0]
+    if bin_width:
+        if rows[-1].bucket >= MAX_HISTOGRAM_BINS:
+            raise TooManyBins(
+                f"bin_width {bin_width:g} needs more than {MAX_HISTOGRAM_BINS} bins"
+            )
+        bins = rows[-1].bucket + 1
+    elif first.hi == first.lo:
+        bins = 1
+    else:
+        bin_width = (first.hi - first.lo) / bins
+
+    counts = [0] * bins
+    for row in rows:
+        counts[row.bucket] = row.count
+    return {
+        "value": value,
+        "total": sum(counts),
+        "min": first.lo,
+        "max": first.hi,
+        "start": first.start,
+        "bin_width": bin_width,
+        "counts": counts,
+    }
@@ -0,0 +1,43 @@
+"""Streaming serialisation of large salary result sets.
+
+Rows are fetched through a server-side cursor (`yield_per`, which turns on
+`stream_results` for Postgres) and written out one batch at a time, so
+memory stays flat regardless of table size and the first bytes leave as
+soon as the first batch is fetched.
+"""
+import json
+from src.database.database import SessionLocal
+from src.api.queries import format_row
+
+STREAM_BATCH_SIZE = 1000
+
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+
+
+def stream_rows(stmt, fmt="ndjson", batch_size=STREAM_BATCH_SIZE):
+    """Yield `stmt` rows as NDJSON lines or as chunks of one JSON array.
+
+    The generator owns its session: the request-scoped one from `get_db`
+    may be closed before a streaming response has finished sending.
+    """
+    db = SessionLocal()
+    try:
+        result = db.execute(stmt.execution_options(yield_per=batch_size))
+        if fmt == "json":
+            yield "["
+        first = True
+        for partition in result.partitions():
+            lines = [json.dumps(format_row(row)) for row in partition]
+            if fmt == "json":
+                chunk = ",".join(lines)
+                yield chunk if first else "," + chunk
+            else:
+                yield "\n".join(lines) + "\n"
+            first = False
+        if fmt == "json":
+            yield "]"
+    finally:
+        db.close()
@@ -0,0 +1,483 @@
+"""Optional in-memory column store for the read-heavy statistics endpoints.
+
+With `COLUMNAR_STATS=true` the salaries table is loaded at startup into
+one NumPy array per column, next to id -> name maps of the companies,
+roles and cities. `/stats/salary-range`, `/stats/histogram` and
+`/compare` then filter with boolean masks and aggregate with sorted
+segment reductions instead of querying the database, and return the same
+response bodies as the SQL path.
+
+Freshness:
+
+- `submit_salary` and the batch endpoint append the rows they commit,
+  and the add endpoints register new dimension rows.
+- A background thread reloads everything every `COLUMNAR_RESYNC_SECONDS`
+  so rows written by scripts or by other worker processes, and any
+  updates or deletes, show up within one interval. A reload that finds
+  different rows or names bumps the data version, so cached stats
+  responses and ETags do not outlive it.
+
+Text filters are case-insensitive substring matches on the names, i.e.
+the `ilike '%x%'` semantics of `text_filter` without the typo tolerance
+of the Postgres trigram backend.
+
+Readers take an immutable (columns, size) snapshot. Appends write past
+`size` in over-allocated arrays, or into copies when they are full, and
+then publish a new snapshot, so a query never sees a half-written row.
+"""
+import logging
+import os
+import threading
+import time
+import numpy as np
+from sqlalchemy import select, func
+from src.cache.data_version import bump_data_version
+from src.models.company import Company
+from src.models.location import Location
+from src.models.role import Role
+from src.models.salary import Salary
+from src.api.stats import (
+    EXPERIENCE_BANDS,
+    PERCENTILES,
+    DEFAULT_HISTOGRAM_BINS,
+    MAX_HISTOGRAM_BINS,
+    TooManyBins,
+    percentile_key,
+)
+
+logger = logging.getLogger(__name__)
+
+COLUMNAR_STATS = os.getenv("COLUMNAR_STATS", "false").lower() == "true"
+COLUMNAR_RESYNC_SECONDS = float(os.getenv("COLUMNAR_RESYNC_SECONDS", "300"))
+
+LOAD_CHUNK_SIZE = 100000
+INITIAL_CAPACITY = 1024
+
+# Column name -> (dtype, SELECT expression); missing bonus/stock load as zero
+COLUMNS = {
+    "id": (np.int64, lambda: Salary.id),
+    "company_id": (np.int32, lambda: Salary.company_id),
+    "role_id": (np.int32, lambda: Salary.role_id),
+    "location_id": (np.int32, lambda: Salary.location_id),
+    "years_of_experience": (np.int32, lambda: Salary.years_of_experience),
+    "base_salary": (np.float64, lambda: Salary.base_salary),
+    "bonus": (np.float64, lambda: func.coalesce(Salary.bonus, 0)),
+    "stock_options": (np.float64, lambda: func.coalesce(Salary.stock_options, 0)),
+    "total_compensation": (np.float64, lambda: Salary.total_compensation),
+    "employment_type": (np.int16, lambda: Salary.employment_type),
+    "is_remote": (np.bool_, lambda: func.coalesce(Salary.is_remote, False)),
+}
+
+# Dimension kind -> (salary column, name field)
+GROUP_DIMENSIONS = {
+    "company": ("company_id", "name"),
+    "role": ("role_id", "title"),
+    "city": ("location_id", "city"),
+    "level": ("role_id", "level"),
+}
+
+
+class ColumnStore:
+    """Salaries as NumPy columns plus the dimension names they refer to"""
+
+    def __init__(self):
+        self._snapshot = None
+        self._dimensions = {"company": {}, "role": {}, "city": {}}
+        self._employment_types = {}
+        self._write_lock = threading.Lock()
+        self._reloading = None
+        self._stop = threading.Event()
+        self._thread = None
+        self.loaded_at = None
+        self.load_seconds = None
+        self.reloads = 0
+        self.appended = 0
+
+    @property
+    def ready(self):
+        return self._snapshot is not None
+
+    def __len__(self):
+        return self._snapshot[1] if self._snapshot else 0
+
+    # ==================== LOADING ====================
+
+    def load(self, db):
+        """Replace the contents with the current database rows.
+
+        Bumps the data version when a reload changes what was loaded.
+        """
+        start = time.perf_counter()
+        dimensions = {
+            "company": {
+                row.id: {"name": row.name}
+                for row in db.execute(select(Company.id, Company.name))
+            },
+            "role": {
+                row.id: {"title": row.title, "level": row.level}
+                for row in db.execute(select(Role.id, Role.title, Role.level))
+            },
+            "city": {
+                row.id: {"city": row.city}
+                for row in db.execute(select(Location.id, Location.city))
+            },
+        }
+
+        with self._write_lock:
+            # Rows appended while the table is read are re-applied below
+            self._reloading = []
+        try:
+            stmt = select(*[build().label(name) for name, (_, build) in COLUMNS.items()])
+            chunks = {name: [] for name in COLUMNS}
+            employment_types = dict(self._employment_types)
+            for rows in db.execute(stmt.execution_options(yield_per=LOAD_CHUNK_SIZE)).partitions():
+                encoded = self._encode(rows, employment_types)
+                for name in COLUMNS:
+                    chunks[name].append(encoded[name])
+            columns = {
+                name: np.concatenate(parts) if parts else np.empty(0, dtype=COLUMNS[name][0])
+                for name, parts in chunks.items()
+            }
+        except Exception:
+            with self._write_lock:
+                self._reloading = None
+            raise
+
+        size = len(columns["id"])
+        with self._write_lock:
+            previous, previous_dimensions = self._snapshot, self._dimensions
+            pending, self._reloading = self._reloading, None
+            self._employment_types = employment_types
+            self._dimensions = dimensions
+            headroom = max(size // 4, INITIAL_CAPACITY)
+            self._snapshot = (self._with_capacity(columns, size, size + headroom), size)
+            if pending:
+                loaded = np.isin([row["id"] for row in pending], columns["id"])
+                missing = [row for row, found in zip(pending, loaded) if not found]
+                if missing:
+                    self._append_locked(missing)
+            current = self._snapshot
+        self.loaded_at = time.time()
+        self.load_seconds = time.perf_counter() - start
+        self.reloads += 1
+        if previous is not None and (
+            dimensions != previous_dimensions or not self._same_rows(previous, current)
+        ):
+            bump_data_version()
+        return size
+
+    @staticmethod
+    def _same_rows(a, b):
+        """Whether two (columns, size) snapshots hold the same rows, in any order"""
+        (a_columns, a_size), (b_columns, b_size) = a, b
+        if a_size != b_size:
+            return False
+        a_order = np.argsort(a_columns["id"][:a_size], kind="stable")
+        b_order = np.argsort(b_columns["id"][:b_size], kind="stable")
+        return all(
+            np.array_equal(
+                a_columns[name][:a_size][a_order], b_columns[name][:b_size][b_order], equal_nan=True
+            )
+            for name in COLUMNS
+        )
+
+    def _encode(self, rows, employment_types):
+        """Column arrays for a list of rows (tuples in COLUMNS order or dicts)"""
+        if rows and isinstance(rows[0], dict):
+            rows = [tuple(row.get(name) for name in COLUMNS) for row in rows]
+        values = list(zip(*rows)) if rows else [()] * len(COLUMNS)
+        encoded = {}
+        for (name, (dtype, _)), column in zip(COLUMNS.items(), values):
+            if name == "employment_type":
+                column = [self._employment_code(value, employment_types) for value in column]
+            elif name in ("bonus", "stock_options"):
+                column = [value or 0 for value in column]
+            elif name == "is_remote":
+                column = [bool(value) for value in column]
+            encoded[name] = np.array(column, dtype=dtype)
+        return encoded
+
+    @staticmethod
+    def _employment_code(value, employment_types):
+        if value is None:
+            return -1
+        if value not in employment_types:
+            employment_types[value] = len(employment_types)
+        return employment_types[value]
+
+    @staticmethod
+    def _with_capacity(columns, size, capacity):
+        """Copies of `columns` with room for `capacity` rows"""
+        capacity = max(capacity, INITIAL_CAPACITY)
+        grown = {}
+        for name, column in columns.items():
+            array = np.empty(capacity, dtype=COLUMNS[name][0])
+            array[:size] = column[:size]
+            grown[name] = array
+        return grown
+
+    # ==================== WRITES ====================
+
+    def append(self, rows):
+        """Add committed salaries, given as dicts with `id` and the Salary fields"""
+        if not rows or not self.ready:
+            return
+        with self._write_lock:
+            if self._reloading is not None:
+                self._reloading.extend(rows)
+            self._append_locked(rows)
+
+    def _append_locked(self, rows):
+        columns, size = self._snapshot
+        encoded = self._encode(rows, self._employment_types)
+        end = size + len(rows)
+        capacity = len(columns["id"])
+        if end > capacity:
+            # Readers may still hold the old arrays: grow into copies
+            columns = self._with_capacity(columns, size, max(end, capacity * 2))
+        for name, values in encoded.items():
+            columns[name][size:end] = values
+        self._snapshot = (columns, end)
+        self.appended += len(rows)
+
+    def add_dimension(self, kind, item_id, **fields):
+        """Register a newly inserted company, role or city"""
+        if not self.ready:
+            return
+        with self._write_lock:
+            dimension = dict(self._dimensions[kind])
+            dimension[item_id] = fields
+            self._dimensions = {**self._dimensions, kind: dimension}
+
+    # ==================== RESYNC ====================
+
+    def start_resync(self, session_factory, interval=COLUMNAR_RESYNC_SECONDS):
+        """Reload from the database every `interval` seconds in a thread"""
+        if self._thread is not None or interval <= 0:
+            return
+
+        def run():
+            while not self._stop.wait(interval):
+                db = session_factory()
+                try:
+                    self.load(db)
+                except Exception as e:
+                    logger.warning("Column store resync failed, keeping old data: %s", e)
+                finally:
+                    db.close()
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=run, name="column-store-resync", daemon=True)
+        self._thread.start()
+
+    def stop_resync(self):
+        self._stop.set()
+        self._thread = None
+
+    # ==================== QUERIES ====================
+
+    def _matching_ids(self, kind, field, predicate):
+        return np.fromiter(
+            (item_id for item_id, fields in self._dimensions[kind].items()
+             if predicate(fields.get(field))),
+            dtype=np.int64,
+        )
+
+    def _contains(self, kind, field, q):
+        needle = q.casefold()
+        return self._matching_ids(kind, field, lambda name: name is not None and needle in name.casefold())
+
+    def mask(self, company=None, city=None, role=None, level=None,
+             min_salary=None, max_salary=None, min_experience=None,
+             max_experience=None, employment_type=None, is_remote=None,
+             company_ids=None):
+        """(columns, boolean mask) for the filters of `salary_search_filters`"""
+        columns, size = self._snapshot
+        columns = {name: column[:size] for name, column in columns.items()}
+        mask = np.ones(size, dtype=bool)
+
+        if company:
+            mask &= np.isin(columns["company_id"], self._contains("company", "name", company))
+        if city:
+            mask &= np.isin(columns["location_id"], self._contains("city", "city", city))
+        if role:
+            mask &= np.isin(columns["role_id"], self._contains("role", "title", role))
+        if level:
+            mask &= np.isin(columns["role_id"],
+                            self._matching_ids("role", "level", lambda value: value == level))
+        if company_ids is not None:
+            mask &= np.isin(columns["company_id"], np.fromiter(company_ids, dtype=np.int64))
+        if min_salary:
+            mask &= columns["total_compensation"] >= min_salary
+        if max_salary:
+            mask &= columns["total_compensation"] <= max_salary
+        if min_experience is not None:
+            mask &= columns["years_of_experience"] >= min_experience
+        if max_experience is not None:
+            mask &= columns["years_of_experience"] <= max_experience
+        if employment_type:
+            code = self._employment_types.get(employment_type)
+            if code is None:
+                mask[:] = False
+            else:
+                mask &= columns["employment_type"] == code
+        if is_remote is not None:
+            mask &= columns["is_remote"] == is_remote
+        return columns, mask
+
+    def _group_codes(self, columns, mask, group_by):
+        """(codes, labels): each matching row's index into `labels`, or -1 for None"""
+        if group_by == "experience_band":
+            labels = sorted(label for label, _, _ in EXPERIENCE_BANDS)
+            position = {label: i for i, label in enumerate(labels)}
+            years = columns["years_of_experience"][mask]
+            codes = np.full(len(years), position[EXPERIENCE_BANDS[-1][0]], dtype=np.int64)
+            for label, low, high in reversed(EXPERIENCE_BANDS[:-1]):
+                codes[years <= high] = position[label]
+            return codes, labels
+
+        if group_by == "company_id":
+            ids = columns["company_id"][mask]
+            labels = np.unique(ids)
+            return np.searchsorted(labels, ids), labels.tolist()
+
+        column, field = GROUP_DIMENSIONS[group_by]
+        kind = "role" if group_by == "level" else group_by
+        names = {item_id: fields.get(field) for item_id, fields in self._dimensions[kind].items()}
+        labels = sorted({name for name in names.values() if name is not None})
+        position = {label: i for i, label in enumerate(labels)}
+        ids = columns[column][mask]
+        lookup = np.full(max(names, default=0) + 1, -1, dtype=np.int64)
+        for item_id, name in names.items():
+            if name is not None:
+                lookup[item_id] = position[name]
+        known = ids < len(lookup)
+        codes = np.full(len(ids), -1, dtype=np.int64)
+        codes[known] = lookup[ids[known]]
+        return codes, labels
+
+    def percentile_stats(self, columns, mask, group_by=None, value="total_compensation",
+                         percentiles=PERCENTILES, averages=None):
+        """Same result shape as `src.api.stats.percentile_stats`.
+
+        `averages` maps response keys to column names.
+        """
+        averages = averages or {}
+        values = columns[value][mask]
+        if group_by:
+            codes, labels = self._group_codes(columns, mask, group_by)
+            # None sorts first, as NULL does in SQLite
+            codes = codes + 1
+            labels = [None] + list(labels)
+        else:
+            codes = np.zeros(len(values), dtype=np.int64)
+            labels = [None]
+
+        if not len(values):
+            if group_by:
+                return []
+            return [{
+                "count": 0, "min": None, "max": None, "avg": None,
+                "percentiles": {percentile_key(p): None for p in percentiles},
+                **{key: None for key in averages},
+            }]
+
+        order = np.lexsort((values, codes))
+        codes, values = codes[order], values[order]
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        counts = np.diff(np.r_[starts, len(values)])
+        ends = starts + counts - 1
+
+        sums = np.add.reduceat(values, starts)
+        results = {
+            "count": counts,
+            "min": values[starts],
+            "max": values[ends],
+            "avg": sums / counts,
+        }
+        for p in percentiles:
+            # Linear interpolation between closest ranks, as percentile_cont
+            position = p * (counts - 1)
+            below = np.floor(position).astype(np.int64)
+            lo = values[starts + below]
+            hi = values[np.minimum(starts + below + 1, ends)]
+            results[percentile_key(p)] = lo + (position - below) * (hi - lo)
+        for key, name in averages.items():
+            results[key] = np.add.reduceat(columns[name][mask][order], starts) / counts
+
+        stats = []
+        for i, code in enumerate(codes[starts]):
+            row = {
+                "count": int(counts[i]),
+                "min": float(results["min"][i]),
+                "max": float(results["max"][i]),
+                "avg": float(results["avg"][i]),
+                "percentiles": {
+                    percentile_key(p): float(results[percentile_key(p)][i]) for p in percentiles
+                },
+                **{key: float(results[key][i]) for key in averages},
+            }
+            if group_by:
+                row = {"group": labels[code], **row}
+            stats.append(row)
+        return stats
+
+    def histogram(self, columns, mask, value="total_compensation", bins=DEFAULT_HISTOGRAM_BINS,
+                  bin_width=None):
+        """Same result shape and bins as `src.api.stats.salary_histogram`"""
+        values = columns[value][mask]
+        if not len(values):
+            return {"value": value, "total": 0, "min": None, "max": None,
+                    "start": None, "bin_width": bin_width, "counts": []}
+
+        lo, hi = float(values.min()), float(values.max())
+        if bin_width:
+            start = float(np.floor(lo / bin_width) * bin_width)
+            buckets = np.floor((values - start) / bin_width).astype(np.int64)
+            if buckets.max() >= MAX_HISTOGRAM_BINS:
+                raise TooManyBins(
+                    f"bin_width {bin_width:g} needs more than {MAX_HISTOGRAM_BINS} bins"
+                )
+            bins = int(buckets.max()) + 1
+        elif hi == lo:
+            start, bins = lo, 1
+            buckets = np.zeros(len(values), dtype=np.int64)
+        else:
+            start = lo
+            buckets = np.floor((values - lo) * bins / (hi - lo)).astype(np.int64)
+            # The maximum itself lands on the upper edge of the last bin
+            np.minimum(buckets, bins - 1, out=buckets)
+            bin_width = (hi - lo) / bins
+
+        counts = np.bincount(buckets, minlength=bins)
+        return {
+            "value": value,
+            "total": int(counts.sum()),
+            "min": lo,
+            "max": hi,
+            "start": start,
+            "bin_width": bin_width,
+            "counts": counts.tolist(),
+        }
+
+    def stats(self):
+        columns, size = self._snapshot if self._snapshot else ({}, 0)
+        return {
+            "enabled": COLUMNAR_STATS,
+            "rows": size,
+            "capacity": len(columns["id"]) if columns else 0,
+            "bytes": sum(column.nbytes for column in columns.values()),
+            "loaded_at": self.loaded_at,
+            "load_seconds": self.load_seconds,
+            "reloads": self.reloads,
+            "appended": self.appended,
+            "resync_seconds": COLUMNAR_RESYNC_SECONDS,
+        }
+
+
+column_store = ColumnStore()
+
+
+def use_column_store():
+    """Whether the stats endpoints should read from the column store"""
+    return COLUMNAR_STATS and column_store.ready
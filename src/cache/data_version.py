@@ -0,0 +1,61 @@
+"""Monotonic data version used for cache validators and invalidation.
+
+Every write endpoint calls `bump_data_version`. Anything derived from the
+data (ETags, cached summaries, cached search results) is keyed on the
+current version, so it goes stale exactly when a write happens.
+
+The counter is process-local and starts from a per-boot token, which is
+correct for the single-process deployment in the Procfile. Rows written
+outside the API (import scripts) only become visible to validators after
+a restart, or at the next column store resync that sees them when
+`COLUMNAR_STATS` is on.
+"""
+import hashlib
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+_lock = threading.Lock()
+_boot = format(int(time.time() * 1000), "x")
+_version = 0
+_last_modified = datetime.now(timezone.utc).replace(microsecond=0)
+_listeners = []
+
+
+def on_data_change(callback):
+    """Call `callback()` after every bump, e.g. to clear a cache"""
+    _listeners.append(callback)
+    return callback
+
+
+def bump_data_version():
+    """Record that the data changed; returns the new version"""
+    global _version, _last_modified
+    with _lock:
+        _version += 1
+        # HTTP dates have one-second resolution: always move forward by at
+        # least a second so If-Modified-Since never hides a write
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        _last_modified = max(now, _last_modified + timedelta(seconds=1))
+        version = _version
+    for callback in _listeners:
+        callback()
+    return version
+
+
+def data_version():
+    """Current version number"""
+    return _version
+
+
+def last_modified():
+    """Time of the last write (or of process start), second precision"""
+    return _last_modified
+
+
+def make_etag(path, query_items, version=None):
+    """Weak ETag for `path` + normalized query parameters at `version`"""
+    version = _version if version is None else version
+    canonical = path + "?" + "&".join(f"{k}={v}" for k, v in sorted(query_items))
+    digest = hashlib.sha1(canonical.encode()).hexdigest()[:16]
+    return f'W/"{_boot}-{version}-{digest}"'
@@ -0,0 +1,145 @@
+"""Process-local cache of Company, Role and Location rows.
+
+The dimension tables hold a few hundred rows that nearly every request
+touches. Each cache keeps detached snapshots of those rows keyed by id and
+by normalized name, bounded by `DIMENSION_CACHE_SIZE` with LRU eviction.
+Caches are warmed on startup and written through by the add endpoints, so
+validating a submission or checking for an existing name normally costs no
+query at all. A miss still falls back to the database, which keeps rows
+inserted by scripts or other workers visible.
+"""
+import os
+import threading
+from collections import OrderedDict
+from types import SimpleNamespace
+from sqlalchemy import select, func
+from src.models.company import Company
+from src.models.location import Location
+from src.models.role import Role
+
+DIMENSION_CACHE_SIZE = int(os.getenv("DIMENSION_CACHE_SIZE", "10000"))
+
+
+def normalize_name(*parts):
+    """Case-insensitive lookup key for a dimension name"""
+    return ", ".join(" ".join(part.casefold().split()) for part in parts)
+
+
+def name_pattern(part):
+    """LIKE pattern for lower(trim(column)) matching every name that
+    normalizes like `part`, plus a few that don't.
+
+    Whitespace runs become %, and so does anything outside ASCII, which
+    SQLite's lower() leaves alone. Candidates are compared with
+    `normalize_name` afterwards.
+    """
+    pattern = []
+    for char in normalize_name(part):
+        if char.isspace() or not char.isascii():
+            char = "%"
+        elif char in "%_\\":
+            char = "\\" + char
+        if not (char == "%" and pattern and pattern[-1] == "%"):
+            pattern.append(char)
+    return "".join(pattern)
+
+
+class DimensionCache:
+    """LRU cache of one dimension table keyed by id and normalized name"""
+
+    def __init__(self, model, name_columns, maxsize=DIMENSION_CACHE_SIZE):
+        self.model = model
+        self.name_columns = name_columns
+        self.maxsize = maxsize
+        self._by_id = OrderedDict()
+        self._by_name = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def _key(self, record):
+        return normalize_name(*(getattr(record, c.key) for c in self.name_columns))
+
+    def put(self, obj):
+        """Cache a snapshot of `obj` (an ORM instance or row) and return it"""
+        record = SimpleNamespace(**{
+            c.key: getattr(obj, c.key) for c in self.model.__table__.columns
+        })
+        with self._lock:
+            old = self._by_id.pop(record.id, None)
+            if old is not None:
+                self._by_name.pop(self._key(old), None)
+            self._by_id[record.id] = record
+            self._by_name[self._key(record)] = record.id
+            while len(self._by_id) > self.maxsize:
+                _, evicted = self._by_id.popitem(last=False)
+                self._by_name.pop(self._key(evicted), None)
+        return record
+
+    def _hit(self, item_id):
+        with self._lock:
+            record = self._by_id.get(item_id)
+            if record is None:
+                self.misses += 1
+                return None
+            self._by_id.move_to_end(item_id)
+            self.hits += 1
+            return record
+
+    def get(self, db, item_id):
+        """Row snapshot for `item_id`, or None if it does not exist"""
+        record = self._hit(item_id)
+        if record is None:
+            obj = db.get(self.model, item_id)
+            if obj is not None:
+                record = self.put(obj)
+        return record
+
+    def find(self, db, *name_parts):
+        """Row snapshot whose name matches `name_parts`, or None"""
+        item_id = self._by_name.get(normalize_name(*name_parts))
+        record = self._hit(item_id) if item_id is not None else None
+        if record is None:
+            if item_id is None:
+                with self._lock:
+                    self.misses += 1
+            # Same normalization as the cache key: narrow down in SQL,
+            # then compare normalize_name in Python
+            conditions = [
+                func.lower(func.trim(c)).like(name_pattern(part), escape="\\")
+                for c, part in zip(self.name_columns, name_parts)
+            ]
+            key = normalize_name(*name_parts)
+            for obj in db.execute(select(self.model).where(*conditions)).scalars():
+                if self._key(obj) == key:
+                    record = self.put(obj)
+                    break
+        return record
+
+    def warm(self, db):
+        """Load up to `maxsize` rows from the table"""
+        rows = db.execute(select(self.model).limit(self.maxsize)).scalars()
+        for obj in rows:
+            self.put(obj)
+
+    def stats(self):
+        return {
+            "size": len(self._by_id),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+company_cache = DimensionCache(Company, (Company.name,))
+role_cache = DimensionCache(Role, (Role.title,))
+location_cache = DimensionCache(Location, (Location.city, Location.state))
+
+
+def warm_dimension_caches(db):
+    """Fill the company, role and location caches"""
+    for cache in (company_cache, role_cache, location_cache):
+        cache.warm(db)
@@ -0,0 +1,112 @@
+"""Response caches for popular salary searches and rollup-backed stats.
+
+Entries are keyed on the canonicalized search parameters plus the data
+version, expire after `RESULT_CACHE_TTL` seconds and are evicted least
+recently used once the serialized size of all entries passes
+`RESULT_CACHE_MAX_BYTES`. Every data version bump also clears the cache
+outright so memory is not held by entries that can no longer be hit.
+"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from src.cache.data_version import data_version, on_data_change
+
+RESULT_CACHE_MAX_BYTES = int(os.getenv("RESULT_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+RESULT_CACHE_TTL = float(os.getenv("RESULT_CACHE_TTL", "60"))
+
+# Search parameters compared case-insensitively by the text filters
+TEXT_PARAMS = ("company", "city", "role")
+
+
+class ResultCache:
+    """Byte-bounded LRU cache with a TTL and hit/miss counters"""
+
+    def __init__(self, max_bytes=RESULT_CACHE_MAX_BYTES, ttl=RESULT_CACHE_TTL):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        """Cached value for `key`, or None"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires, size, value = entry
+            if expires < now:
+                del self._entries[key]
+                self._bytes -= size
+                self.expired += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """Store `value`, evicting least recently used entries to fit"""
+        size = len(json.dumps(value, default=str))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (time.monotonic() + self.ttl, size, value)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry after a write"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.invalidations += 1
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else None,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+search_cache = ResultCache()
+on_data_change(search_cache.clear)
+
+stats_cache = ResultCache()
+on_data_change(stats_cache.clear)
+
+
+def search_cache_key(**params):
+    """Canonical cache key for a set of search parameters"""
+    items = []
+    for name, value in sorted(params.items()):
+        if value is None:
+            continue
+        if name in TEXT_PARAMS:
+            value = " ".join(value.casefold().split())
+        items.append((name, value))
+    return (data_version(), tuple(items))
@@ -0,0 +1,122 @@
+"""In-process prefix indexes for company, role and city typeahead.
+
+Each index is a sorted list of `(key, position, name, id)` tuples with one
+entry per word of the name, so "goo" finds "Google India" and "ind" finds
+it too. Lookups bisect to the first key >= the query and walk forward
+while keys still start with it, which answers a keystroke in microseconds
+without touching the database.
+
+The "city" index feeds the city search filter and holds bare city names.
+The "location" index is for picking a location row, so its names are
+"City, State" and cities that share a name stay distinguishable.
+"""
+import threading
+from bisect import bisect_left, insort
+from sqlalchemy import select
+from src.database.search_index import SEARCH_FIELDS
+from src.models.location import Location
+
+DEFAULT_SUGGEST_LIMIT = 10
+
+
+def normalize(name):
+    """Case-folded, whitespace-collapsed form used for keys"""
+    return " ".join(name.casefold().split())
+
+
+class PrefixIndex:
+    """Sorted-array prefix index over (id, name) pairs"""
+
+    def __init__(self):
+        self._entries = []
+        self._ids = set()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._ids)
+
+    def add(self, item_id, name):
+        """Index `name` under the prefix of every word it contains"""
+        if not name:
+            return
+        words = normalize(name).split(" ")
+        with self._lock:
+            if item_id in self._ids:
+                return
+            self._ids.add(item_id)
+            for position in range(len(words)):
+                key = " ".join(words[position:])
+                insort(self._entries, (key, position, name, item_id))
+
+    def load(self, pairs):
+        """Replace the index contents with `pairs` of (id, name)"""
+        entries = []
+        ids = set()
+        for item_id, name in pairs:
+            if not name or item_id in ids:
+                continue
+            ids.add(item_id)
+            words = normalize(name).split(" ")
+            for position in range(len(words)):
+                entries.append((" ".join(words[position:]), position, name, item_id))
+        entries.sort()
+        with self._lock:
+            self._entries = entries
+            self._ids = ids
+
+    def search(self, query, limit=DEFAULT_SUGGEST_LIMIT):
+        """Top `limit` names with a word starting with `query`.
+
+        Names that start with the query rank ahead of names matching on a
+        later word; ties are broken alphabetically.
+        """
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        entries = self._entries
+        start = bisect_left(entries, (prefix,))
+        # Whole-name matches come first in the final ordering, so look a
+        # little past `limit` word matches before cutting off
+        budget = limit * 4
+        best = {}
+        for i in range(start, len(entries)):
+            key, position, name, item_id = entries[i]
+            if not key.startswith(prefix):
+                break
+            if item_id not in best or position < best[item_id][0]:
+                best[item_id] = (position, name)
+            if len(best) >= budget:
+                break
+        ranked = sorted(
+            best.items(),
+            key=lambda item: (item[1][0] > 0, item[1][1], item[0])
+        )
+        return [{"id": item_id, "name": name} for item_id, (_, name) in ranked[:limit]]
+
+
+suggest_indexes = {kind: PrefixIndex() for kind in (*SEARCH_FIELDS, "location")}
+
+
+def location_label(city, state):
+    """Name a location is suggested under, e.g. 'Aurangabad, Bihar'"""
+    return f"{city}, {state}" if state else city
+
+
+def build_suggest_indexes(db):
+    """Load every company, role, city and location into its prefix index"""
+    for kind, (model, column) in SEARCH_FIELDS.items():
+        suggest_indexes[kind].load(db.execute(select(model.id, column)).all())
+    suggest_indexes["location"].load(
+        (row.id, location_label(row.city, row.state))
+        for row in db.execute(select(Location.id, Location.city, Location.state))
+    )
+
+
+def add_suggestion(kind, item_id, name):
+    """Make a newly inserted dimension row suggestible"""
+    suggest_indexes[kind].add(item_id, name)
+
+
+def suggest(kind, query, limit=DEFAULT_SUGGEST_LIMIT):
+    """Top matches for `query` from the `kind` index"""
+    return suggest_indexes[kind].search(query, limit)
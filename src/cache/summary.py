@@ -0,0 +1,43 @@
+"""Home page summary numbers, cached until the next write.
+
+The summary is built from the rollup table (O(groups)) plus a count of
+companies, then held in memory for as long as the data version is
+unchanged. Salaries only show up once they are in the rollups: after
+loading data outside the API, run scripts/rebuild_rollups.py.
+"""
+import threading
+from sqlalchemy import select, func
+from src.models.company import Company
+from src.database.rollups import rollup_stats
+from src.cache.data_version import data_version
+
+_lock = threading.Lock()
+_cached = (None, None)
+
+
+def compute_summary(db):
+    """Company count, salary count, average and median compensation"""
+    companies = db.execute(select(func.count(Company.id))).scalar()
+    stats = rollup_stats(db, [])
+    stats = stats[0] if stats else {"count": 0, "avg": None, "percentiles": {}}
+    return {
+        "total_companies": companies,
+        "total_salaries": stats["count"] or 0,
+        "average_salary": stats["avg"],
+        "median_salary": stats["percentiles"].get("p50"),
+    }
+
+
+def get_summary(db):
+    """Cached summary, computing it on the first call after a write"""
+    global _cached
+    version = data_version()
+    cached_version, summary = _cached
+    if cached_version == version:
+        return summary
+    summary = compute_summary(db)
+    with _lock:
+        # A write during compute_summary bumps the version; the result is
+        # then cached under the old version and recomputed next time
+        _cached = (version, summary)
+    return summary
@@ -0,0 +1,289 @@
+"""Bulk loading of salary records.
+
+Records are dicts naming their company, role (with level) and city
+rather than referencing ids, as read from a CSV or NDJSON file. Names are
+resolved against in-memory maps of the dimension tables, loaded once;
+names not seen before are created with one INSERT per dimension per
+batch. Salary rows are then streamed into the table with `COPY` on
+Postgres (psycopg2) or a single executemany everywhere else, and the
+rollups are rebuilt once at the end.
+"""
+import csv
+import io
+import json
+import sys
+import time
+from collections import Counter
+from itertools import islice
+from sqlalchemy import select, insert
+from src.models.company import Company
+from src.models.location import Location
+from src.models.role import Role
+from src.models.salary import Salary
+from src.cache.dimensions import normalize_name
+from src.database.rollups import rebuild_rollups
+
+DEFAULT_BATCH_SIZE = 50000
+
+DIMENSIONS = ("company", "role", "location")
+
+# Column order of the rows handed to COPY / executemany
+SALARY_COLUMNS = (
+    "company_id", "role_id", "location_id",
+    "base_salary", "bonus", "stock_options", "total_compensation",
+    "years_of_experience", "years_at_company",
+    "employment_type", "is_remote", "currency", "source", "is_verified",
+)
+
+# Errors kept in the report; the rest are only counted
+MAX_REPORTED_ERRORS = 20
+
+
+class MalformedRecord(dict):
+    """Stand-in for an input line that did not parse; skipped by bulk_load"""
+
+    def __init__(self, error):
+        super().__init__()
+        self.error = error
+
+
+def read_records(path, fmt=None):
+    """Yield records from a CSV or NDJSON file ("-" for stdin).
+
+    An NDJSON line that is not a JSON object yields a MalformedRecord
+    instead of ending the import.
+    """
+    if fmt is None:
+        fmt = "csv" if str(path).lower().endswith(".csv") else "ndjson"
+    if path == "-":
+        stream = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+    else:
+        stream = open(path, newline="", encoding="utf-8")
+    with stream:
+        if fmt == "csv":
+            yield from csv.DictReader(stream)
+        else:
+            for number, line in enumerate(stream, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield MalformedRecord(f"line {number}: invalid JSON ({e})")
+                    continue
+                if isinstance(record, dict):
+                    yield record
+                else:
+                    yield MalformedRecord(f"line {number}: not a JSON object")
+
+
+def _number(record, name, cast, default=None):
+    value = record.get(name)
+    if value is None or value == "":
+        if default is None:
+            raise ValueError(f"missing {name}")
+        return default
+    return cast(float(value))
+
+
+def _optional_int(record, name):
+    value = record.get(name)
+    return None if value is None or value == "" else int(float(value))
+
+
+def _flag(value):
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "y", "t")
+    return bool(value)
+
+
+def salary_values(record, source=None):
+    """Salary columns of a record (after the three ids), validated"""
+    base = _number(record, "base_salary", float)
+    bonus = _number(record, "bonus", float, 0.0)
+    stock = _number(record, "stock_options", float, 0.0)
+    total = _number(record, "total_compensation", float, base + bonus + stock)
+    experience = _number(record, "years_of_experience", int)
+    if base <= 0 or total <= 0 or bonus < 0 or stock < 0 or experience < 0:
+        raise ValueError("negative or zero amount")
+    return (
+        base, bonus, stock, total, experience,
+        _optional_int(record, "years_at_company"),
+        record.get("employment_type") or "Full-time",
+        _flag(record.get("is_remote", False)),
+        record.get("currency") or "INR",
+        record.get("source") or source,
+        _flag(record.get("is_verified", False)),
+    )
+
+
+class DimensionMaps:
+    """Normalized name -> id maps of the company, role and location tables"""
+
+    def __init__(self, db):
+        self.companies = {
+            normalize_name(name): id for id, name in db.execute(select(Company.id, Company.name))
+        }
+        self.roles = {
+            normalize_name(title): (id, level)
+            for id, title, level in db.execute(select(Role.id, Role.title, Role.level))
+        }
+        # Locations are matched on city alone, like the import scripts did
+        self.locations = {}
+        for id, city in db.execute(select(Location.id, Location.city).order_by(Location.id)):
+            self.locations.setdefault(normalize_name(city), id)
+        self.created = Counter()
+        self._keys = {}
+
+    def key(self, name):
+        """normalize_name, memoized: input files repeat the same few names"""
+        key = self._keys.get(name)
+        if key is None:
+            key = self._keys[name] = normalize_name(name or "")
+        return key
+
+    def create_missing(self, db, records, dimensions=DIMENSIONS):
+        """Insert, in one statement per dimension, names not yet known"""
+        companies, roles, locations = {}, {}, {}
+        for record in records:
+            company, role, city = record.get("company"), record.get("role"), record.get("city")
+            if company and self.key(company) not in self.companies:
+                companies.setdefault(self.key(company), {
+                    "name": company.strip(), "industry": record.get("industry") or None
+                })
+            if role and self.key(role) not in self.roles:
+                roles.setdefault(self.key(role), {
+                    "title": role.strip(),
+                    "level": record.get("level") or None,
+                    "category": record.get("category") or "Engineering"
+                })
+            if city and record.get("state") and self.key(city) not in self.locations:
+                locations.setdefault(self.key(city), {
+                    "city": city.strip(), "state": record["state"].strip()
+                })
+
+        if "company" in dimensions and companies:
+            for id, name in db.execute(
+                insert(Company).returning(Company.id, Company.name), list(companies.values())
+            ):
+                self.companies[normalize_name(name)] = id
+            self.created["company"] += len(companies)
+        if "role" in dimensions and roles:
+            for id, title, level in db.execute(
+                insert(Role).returning(Role.id, Role.title, Role.level), list(roles.values())
+            ):
+                self.roles[normalize_name(title)] = (id, level)
+            self.created["role"] += len(roles)
+        if "location" in dimensions and locations:
+            for id, city in db.execute(
+                insert(Location).returning(Location.id, Location.city), list(locations.values())
+            ):
+                self.locations[normalize_name(city)] = id
+            self.created["location"] += len(locations)
+
+    def ids(self, record):
+        """(company_id, role_id, location_id); raises ValueError if unknown"""
+        company = self.companies.get(self.key(record.get("company")))
+        if company is None:
+            raise ValueError(f"Company '{record.get('company')}' not found")
+        role = self.roles.get(self.key(record.get("role")))
+        if role is None:
+            raise ValueError(f"Role '{record.get('role')}' not found")
+        location = self.locations.get(self.key(record.get("city")))
+        if location is None:
+            raise ValueError(f"Location '{record.get('city')}' not found")
+        return company, role[0], location
+
+
+def _uses_copy(db):
+    dialect = db.get_bind().dialect
+    return dialect.name == "postgresql" and dialect.driver == "psycopg2"
+
+
+def copy_salaries(db, rows):
+    """Stream rows into salaries with COPY ... FROM STDIN (psycopg2)"""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {Salary.__tablename__} ({', '.join(SALARY_COLUMNS)}) "
+            "FROM STDIN WITH (FORMAT csv)",
+            buffer
+        )
+    finally:
+        cursor.close()
+
+
+def insert_salaries(db, rows):
+    """executemany fallback for databases without COPY"""
+    connection = db.connection()
+    placeholder = {"qmark": "?", "format": "%s"}.get(connection.dialect.paramstyle)
+    if placeholder is None:
+        db.execute(insert(Salary.__table__), [dict(zip(SALARY_COLUMNS, row)) for row in rows])
+        return
+    # Straight to the driver's executemany: no per-row parameter processing
+    connection.exec_driver_sql(
+        f"INSERT INTO {Salary.__tablename__} ({', '.join(SALARY_COLUMNS)}) "
+        f"VALUES ({', '.join([placeholder] * len(SALARY_COLUMNS))})",
+        rows
+    )
+
+
+def write_salaries(db, rows):
+    """Write rows (in SALARY_COLUMNS order) with COPY when available"""
+    if _uses_copy(db):
+        copy_salaries(db, rows)
+    else:
+        insert_salaries(db, rows)
+
+
+def bulk_load(db, records, batch_size=DEFAULT_BATCH_SIZE, create_missing=DIMENSIONS,
+              source=None, rebuild=True, progress=None):
+    """Load salary records in one transaction and return a report dict.
+
+    `create_missing` lists the dimensions ("company", "role", "location")
+    whose unknown names are created; records naming any other unknown
+    dimension value are skipped. `progress(loaded)` is called per batch.
+    """
+    start = time.perf_counter()
+    maps = DimensionMaps(db)
+    records = iter(records)
+    loaded = 0
+    skipped = 0
+    errors = []
+
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            break
+        maps.create_missing(db, batch, create_missing)
+        rows = []
+        for record in batch:
+            try:
+                if isinstance(record, MalformedRecord):
+                    raise ValueError(record.error)
+                rows.append(maps.ids(record) + salary_values(record, source))
+            except (ValueError, TypeError) as e:
+                skipped += 1
+                if len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append(str(e))
+        if rows:
+            write_salaries(db, rows)
+            loaded += len(rows)
+        if progress:
+            progress(loaded)
+
+    db.commit()
+    seconds = time.perf_counter() - start
+    groups = rebuild_rollups(db) if rebuild and loaded else None
+    return {
+        "loaded": loaded,
+        "skipped": skipped,
+        "errors": errors,
+        "created": dict(maps.created),
+        "seconds": round(seconds, 3),
+        "rows_per_second": round(loaded / seconds) if seconds else None,
+        "rollup_groups": groups,
+    }
@@ -1,14 +1,48 @@
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
 import os
 from dotenv import load_dotenv
+from src.monitoring.pool import PoolMetrics, instrumented_pool, track_connections
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://localhost:5432/techsalary")
 
-engine = create_engine(DATABASE_URL)
+# Serve the API through an AsyncEngine (asyncpg / aiosqlite) instead of the
+# threadpool. Scripts always use the synchronous engine below.
+USE_ASYNC_DB = os.getenv("USE_ASYNC_DB", "false").lower() in ("1", "true", "yes")
+
+# Connection pool settings (ignored for SQLite, which uses its own pools).
+# Pre-ping and recycle keep connections that the server or a proxy closed
+# while idle from surfacing as errors on the next request.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+
+pool_metrics = PoolMetrics()
+async_pool_metrics = PoolMetrics()
+
+
+def engine_options(url, metrics, pool_class=QueuePool):
+    """create_engine keyword arguments for the configured pool"""
+    if url.startswith("sqlite"):
+        return {}
+    return {
+        "poolclass": instrumented_pool(pool_class, metrics),
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL, pool_metrics))
+track_connections(engine, pool_metrics)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -19,4 +53,38 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def async_database_url(url):
+    """Rewrite a sync DATABASE_URL to its asyncio driver"""
+    scheme, sep, rest = url.partition("://")
+    driver = scheme.split("+")[0]
+    if driver in ("postgres", "postgresql"):
+        return f"postgresql+asyncpg{sep}{rest}"
+    if driver == "sqlite":
+        return f"sqlite+aiosqlite{sep}{rest}"
+    return url
+
+
+async_engine = None
+AsyncSessionLocal = None
+
+if USE_ASYNC_DB:
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    async_url = async_database_url(DATABASE_URL)
+    async_engine = create_async_engine(
+        async_url,
+        **engine_options(async_url, async_pool_metrics, AsyncAdaptedQueuePool)
+    )
+    track_connections(async_engine.sync_engine, async_pool_metrics)
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+
+
+# Async dependency for FastAPI
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""Alembic schema migrations.
+
+The scripts live in migrations/versions. Apply them with
+
+    alembic upgrade head
+    alembic -x concurrently=true upgrade head    # live Postgres database
+
+or `upgrade_database()` from Python. With `concurrently` set, Postgres
+indexes are built and dropped with CREATE/DROP INDEX CONCURRENTLY outside
+the migration transaction, so writes to the table are not blocked while a
+large index builds. Other dialects ignore the flag.
+
+Migrations are written to be safe on databases created earlier with
+`Base.metadata.create_all`: tables and indexes that already exist are
+skipped, so `upgrade head` brings such a database under version control.
+
+Index helpers for migration scripts are defined here so every migration
+handles the concurrent case the same way.
+"""
+import os
+from alembic import command, context, op
+from alembic.config import Config
+from sqlalchemy import text
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def alembic_config(url=None, concurrently=False):
+    """Config for the repo's alembic.ini, optionally for another database"""
+    config = Config(os.path.join(ROOT, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(ROOT, "migrations"))
+    if url:
+        config.attributes["url"] = url
+    config.attributes["concurrently"] = concurrently
+    return config
+
+
+def upgrade_database(url=None, revision="head", concurrently=False):
+    """Apply migrations up to `revision`"""
+    command.upgrade(alembic_config(url, concurrently), revision)
+
+
+# ==================== HELPERS FOR MIGRATION SCRIPTS ====================
+
+def concurrently():
+    """Whether this run builds Postgres indexes concurrently"""
+    if op.get_context().dialect.name != "postgresql":
+        return False
+    flag = context.config.attributes.get("concurrently") or \
+        context.get_x_argument(as_dictionary=True).get("concurrently", "")
+    return str(flag).lower() in ("1", "true", "yes")
+
+
+def _drop_invalid_index(name):
+    """Drop an index left INVALID by an interrupted concurrent build"""
+    if context.is_offline_mode():
+        return
+    invalid = op.get_bind().execute(text(
+        "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+        "WHERE c.relname = :name AND NOT i.indisvalid"
+    ), {"name": name}).first()
+    if invalid:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def create_index(name, table, columns, **kw):
+    """op.create_index that skips existing indexes and honours `concurrently`"""
+    if not concurrently():
+        op.create_index(name, table, columns, if_not_exists=True, **kw)
+        return
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        _drop_invalid_index(name)
+        op.create_index(name, table, columns, if_not_exists=True,
+                        postgresql_concurrently=True, **kw)
+
+
+def drop_index(name, table):
+    """op.drop_index that skips missing indexes and honours `concurrently`"""
+    if not concurrently():
+        op.drop_index(name, table_name=table, if_exists=True)
+        return
+    with op.get_context().autocommit_block():
+        op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
@@ -0,0 +1,452 @@
+"""Maintenance and querying of the salary_rollups aggregate table.
+
+Each rollup row holds count, sum, sum of squares, min, max and a quantile
+sketch of total compensation for one company x role x city group. Rows
+are updated incrementally as salaries are submitted and rebuilt in bulk
+after imports, so aggregate questions are answered in O(groups) instead
+of O(salaries).
+
+salary_experience_rollups keeps a count, sum and sketch per group and
+year of experience in the same way, for the experience curve.
+"""
+import json
+import math
+from types import SimpleNamespace
+from sqlalchemy import select, delete, insert, update, bindparam, and_, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from src.models.company import Company
+from src.models.location import Location
+from src.models.role import Role
+from src.models.salary import Salary
+from src.models.salary_rollup import SalaryRollup
+from src.models.salary_experience_rollup import SalaryExperienceRollup
+from src.database.search_index import text_filter
+
+ROLLUP_PERCENTILES = (0.10, 0.25, 0.50, 0.75, 0.90)
+
+
+class QuantileSketch:
+    """Mergeable log-bucket sketch with bounded relative error.
+
+    Positive values land in bucket ceil(log_gamma(v)) with
+    gamma = (1 + alpha) / (1 - alpha), so every quantile estimate is
+    within `alpha` of a true sample value. Salaries spanning 1L to 10Cr
+    need only a few hundred buckets at 1% accuracy.
+    """
+
+    def __init__(self, alpha=0.01, buckets=None, zeros=0):
+        self.alpha = alpha
+        self.gamma = (1 + alpha) / (1 - alpha)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets = buckets if buckets is not None else {}
+        self.zeros = zeros
+
+    @property
+    def count(self):
+        return self.zeros + sum(self.buckets.values())
+
+    def add(self, value, count=1):
+        if value <= 0:
+            self.zeros += count
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def merge(self, other):
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.zeros += other.zeros
+        return self
+
+    def _value_at(self, rank):
+        """Estimate of the value at 0-based `rank` in sorted order"""
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                return 2 * self.gamma ** index / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+    def quantile(self, q):
+        """Estimate of the q-quantile, or None for an empty sketch.
+
+        Interpolates between the two nearest ranks like `percentile_cont`,
+        so small groups agree with the SQL statistics endpoints.
+        """
+        total = self.count
+        if not total:
+            return None
+        rank = q * (total - 1)
+        lower = math.floor(rank)
+        low = self._value_at(lower)
+        if rank == lower:
+            return low
+        return low + (rank - lower) * (self._value_at(lower + 1) - low)
+
+    def to_json(self):
+        return json.dumps(
+            {"a": self.alpha, "z": self.zeros, "b": self.buckets},
+            separators=(",", ":")
+        )
+
+    @classmethod
+    def from_json(cls, data):
+        if not data or data == "{}":
+            return cls()
+        raw = json.loads(data)
+        buckets = {int(index): count for index, count in raw.get("b", {}).items()}
+        return cls(alpha=raw.get("a", 0.01), buckets=buckets, zeros=raw.get("z", 0))
+
+
+# Group key columns of each rollup table
+ROLLUP_KEY = ("company_id", "role_id", "location_id")
+EXPERIENCE_KEY = ROLLUP_KEY + ("years_of_experience",)
+
+
+def record_salaries(db, salaries):
+    """Fold new salaries into their rollup rows in the current transaction.
+
+    `salaries` is an iterable of (company_id, role_id, location_id, level,
+    years_of_experience, total_compensation). Both the salary_rollups and
+    the salary_experience_rollups rows are updated. The caller commits.
+    """
+    groups = {}
+    experience_groups = {}
+    for company_id, role_id, location_id, level, years, value in salaries:
+        groups.setdefault((company_id, role_id, location_id), (level, []))[1].append(value)
+        experience_groups.setdefault(
+            (company_id, role_id, location_id, years), (level, [])
+        )[1].append(value)
+    if not groups:
+        return
+
+    _fold_into(db, SalaryRollup, ROLLUP_KEY, groups, _fold, lambda level: {
+        "level": level, "count": 0, "sum_compensation": 0, "sum_squares": 0, "sketch": "{}",
+    })
+    _fold_into(db, SalaryExperienceRollup, EXPERIENCE_KEY, experience_groups, _fold_experience, lambda level: {
+        "level": level, "count": 0, "sum_compensation": 0, "sketch": "{}",
+    })
+
+
+def _fold_into(db, model, key_columns, groups, fold, defaults):
+    """Apply `fold(rollup, values)` to the row of every group key.
+
+    `groups` maps key tuples to (level, values). Existing rows are locked
+    with one statement and written back with one executemany UPDATE;
+    missing ones are folded from `defaults(level)` and inserted together
+    in one more. The statement count does not grow with the groups.
+    """
+    table = model.__table__
+    group_key = tuple_(*(table.c[column] for column in key_columns))
+    rollups = {
+        tuple(row[column] for column in key_columns): SimpleNamespace(**row)
+        for row in db.execute(
+            select(table).where(group_key.in_(list(groups))).with_for_update()
+        ).mappings()
+    }
+
+    updated = []
+    new_rows = {}
+    for key, (level, values) in groups.items():
+        rollup = rollups.get(key)
+        if rollup is not None:
+            fold(rollup, values)
+            updated.append(rollup)
+            continue
+        # Folded on a transient instance, then inserted as a plain row
+        rollup = model(**dict(zip(key_columns, key)), **defaults(level))
+        fold(rollup, values)
+        new_rows[key] = {
+            column.key: getattr(rollup, column.key)
+            for column in table.columns if column.key not in ("id", "updated_at")
+        }
+
+    if new_rows:
+        for key in _insert_new_groups(db, model, key_columns, new_rows):
+            # Another transaction created the group since the locking select
+            row = db.execute(
+                select(table).filter_by(**dict(zip(key_columns, key))).with_for_update()
+            ).mappings().one()
+            rollup = SimpleNamespace(**row)
+            fold(rollup, groups[key][1])
+            updated.append(rollup)
+
+    if updated:
+        aggregates = [
+            column.key for column in table.columns
+            if column.key not in ("id", "updated_at", *key_columns)
+        ]
+        # Core executemany: the ORM would send one UPDATE per row on
+        # drivers without reliable executemany rowcounts (SQLite)
+        db.execute(
+            update(table).where(table.c.id == bindparam("rollup_id")),
+            [
+                {"rollup_id": rollup.id, **{column: getattr(rollup, column) for column in aggregates}}
+                for rollup in updated
+            ]
+        )
+
+
+def _insert_new_groups(db, model, key_columns, rows):
+    """Insert `rows` (key -> column values); return the keys that already existed"""
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        upsert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = (
+            upsert(model)
+            .on_conflict_do_nothing(index_elements=list(key_columns))
+            .returning(*(getattr(model, column) for column in key_columns))
+        )
+        inserted = {tuple(row) for row in db.execute(stmt, list(rows.values()))}
+        return [key for key in rows if key not in inserted]
+
+    try:
+        with db.begin_nested():
+            db.execute(insert(model), list(rows.values()))
+        return []
+    except IntegrityError:
+        # Lost a race on at least one group: retry them one at a time
+        existing = []
+        for key, row in rows.items():
+            try:
+                with db.begin_nested():
+                    db.execute(insert(model), [row])
+            except IntegrityError:
+                existing.append(key)
+        return existing
+
+
+def record_salary(db, salary, level):
+    """Fold one new Salary into its rollup rows (caller commits)"""
+    record_salaries(db, [(
+        salary.company_id, salary.role_id, salary.location_id,
+        level, salary.years_of_experience, salary.total_compensation
+    )])
+
+
+def _fold(rollup, values):
+    sketch = QuantileSketch.from_json(rollup.sketch)
+    for value in values:
+        sketch.add(value)
+    rollup.count += len(values)
+    rollup.sum_compensation += sum(values)
+    rollup.sum_squares += sum(v * v for v in values)
+    low, high = min(values), max(values)
+    rollup.min_compensation = low if rollup.min_compensation is None else min(rollup.min_compensation, low)
+    rollup.max_compensation = high if rollup.max_compensation is None else max(rollup.max_compensation, high)
+    rollup.sketch = sketch.to_json()
+
+
+def _fold_experience(rollup, values):
+    sketch = QuantileSketch.from_json(rollup.sketch)
+    for value in values:
+        sketch.add(value)
+    rollup.count += len(values)
+    rollup.sum_compensation += sum(values)
+    rollup.sketch = sketch.to_json()
+
+
+def rebuild_rollups(db, batch_size=10000):
+    """Recompute every rollup row of both tables from salaries and commit.
+
+    Returns the number of company x role x city groups.
+    """
+    groups = {}
+    experience_groups = {}
+    rows = db.execute(
+        select(
+            Salary.company_id,
+            Salary.role_id,
+            Salary.location_id,
+            Role.level,
+            Salary.years_of_experience,
+            Salary.total_compensation,
+        )
+        .join(Role, Salary.role_id == Role.id)
+        .execution_options(yield_per=batch_size)
+    )
+    for company_id, role_id, location_id, level, years, value in rows:
+        key = (company_id, role_id, location_id)
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {
+                "company_id": company_id,
+                "role_id": role_id,
+                "location_id": location_id,
+                "level": level,
+                "count": 0,
+                "sum_compensation": 0.0,
+                "sum_squares": 0.0,
+                "min_compensation": value,
+                "max_compensation": value,
+                "sketch": QuantileSketch(),
+            }
+        group["count"] += 1
+        group["sum_compensation"] += value
+        group["sum_squares"] += value * value
+        group["min_compensation"] = min(group["min_compensation"], value)
+        group["max_compensation"] = max(group["max_compensation"], value)
+        group["sketch"].add(value)
+
+        key = (company_id, role_id, location_id, years)
+        group = experience_groups.get(key)
+        if group is None:
+            group = experience_groups[key] = {
+                "company_id": company_id,
+                "role_id": role_id,
+                "location_id": location_id,
+                "years_of_experience": years,
+                "level": level,
+                "count": 0,
+                "sum_compensation": 0.0,
+                "sketch": QuantileSketch(),
+            }
+        group["count"] += 1
+        group["sum_compensation"] += value
+        group["sketch"].add(value)
+
+    for model, built in ((SalaryRollup, groups), (SalaryExperienceRollup, experience_groups)):
+        db.execute(delete(model))
+        records = [{**g, "sketch": g["sketch"].to_json()} for g in built.values()]
+        for start in range(0, len(records), batch_size):
+            db.execute(insert(model), records[start:start + batch_size])
+    db.commit()
+    return len(groups)
+
+
+ROLLUP_GROUP_COLUMNS = {
+    "company": Company.name,
+    "role": Role.title,
+    "city": Location.city,
+    "level": SalaryRollup.level,
+}
+
+
+def rollup_filters(db, company=None, role=None, city=None, level=None, model=SalaryRollup):
+    """WHERE clauses over a rollup table joined to its dimensions"""
+    filters = []
+    if company:
+        filters.append(text_filter(db, "company", company))
+    if role:
+        filters.append(text_filter(db, "role", role))
+    if city:
+        filters.append(text_filter(db, "city", city))
+    if level:
+        filters.append(model.level == level)
+    return filters
+
+
+def rollup_stats(db, filters, group_by=None, percentiles=ROLLUP_PERCENTILES):
+    """Merge matching rollup rows into per-group aggregates"""
+    group = ROLLUP_GROUP_COLUMNS[group_by] if group_by else None
+    stmt = (
+        select(
+            *([group.label("group")] if group is not None else []),
+            SalaryRollup.count,
+            SalaryRollup.sum_compensation,
+            SalaryRollup.sum_squares,
+            SalaryRollup.min_compensation,
+            SalaryRollup.max_compensation,
+            SalaryRollup.sketch,
+        )
+        .join(Company, SalaryRollup.company_id == Company.id)
+        .join(Role, SalaryRollup.role_id == Role.id)
+        .join(Location, SalaryRollup.location_id == Location.id)
+    )
+    if filters:
+        stmt = stmt.where(and_(*filters))
+
+    merged = {}
+    for row in db.execute(stmt):
+        key = row.group if group is not None else None
+        acc = merged.get(key)
+        if acc is None:
+            acc = merged[key] = {
+                "count": 0, "sum": 0.0, "sum_squares": 0.0,
+                "min": None, "max": None, "sketch": QuantileSketch(),
+            }
+        acc["count"] += row.count
+        acc["sum"] += row.sum_compensation
+        acc["sum_squares"] += row.sum_squares
+        acc["min"] = row.min_compensation if acc["min"] is None else min(acc["min"], row.min_compensation)
+        acc["max"] = row.max_compensation if acc["max"] is None else max(acc["max"], row.max_compensation)
+        acc["sketch"].merge(QuantileSketch.from_json(row.sketch))
+
+    results = []
+    for key in sorted(merged, key=lambda k: (k is None, k)):
+        acc = merged[key]
+        count = acc["count"]
+        mean = acc["sum"] / count if count else None
+        variance = max(acc["sum_squares"] / count - mean * mean, 0) if count else None
+        results.append({
+            "group": key,
+            "count": count,
+            "min": acc["min"],
+            "max": acc["max"],
+            "avg": mean,
+            "stddev": math.sqrt(variance) if variance is not None else None,
+            "percentiles": {
+                f"p{round(p * 100)}": acc["sketch"].quantile(p) for p in percentiles
+            },
+        })
+    return results
+
+
+CURVE_PERCENTILES = (0.25, 0.50, 0.75)
+
+
+def experience_curve(db, filters, percentiles=CURVE_PERCENTILES):
+    """Percentiles of total compensation per year of experience.
+
+    Merges the matching salary_experience_rollups rows, so the cost
+    grows with the number of groups x years, not salaries.
+    """
+    stmt = (
+        select(
+            SalaryExperienceRollup.years_of_experience,
+            SalaryExperienceRollup.count,
+            SalaryExperienceRollup.sum_compensation,
+            SalaryExperienceRollup.sketch,
+        )
+        .join(Company, SalaryExperienceRollup.company_id == Company.id)
+        .join(Role, SalaryExperienceRollup.role_id == Role.id)
+        .join(Location, SalaryExperienceRollup.location_id == Location.id)
+    )
+    if filters:
+        stmt = stmt.where(and_(*filters))
+
+    # Bucket counts are summed on the serialized (string) keys and turned
+    # into one sketch per year, rather than parsing a sketch per row
+    merged = {}
+    for row in db.execute(stmt):
+        acc = merged.get(row.years_of_experience)
+        if acc is None:
+            acc = merged[row.years_of_experience] = {"count": 0, "sum": 0.0, "zeros": 0, "buckets": {}}
+        acc["count"] += row.count
+        acc["sum"] += row.sum_compensation
+        raw = json.loads(row.sketch)
+        acc["zeros"] += raw.get("z", 0)
+        buckets = acc["buckets"]
+        for index, count in raw.get("b", {}).items():
+            buckets[index] = buckets.get(index, 0) + count
+    for acc in merged.values():
+        acc["sketch"] = QuantileSketch(
+            buckets={int(index): count for index, count in acc["buckets"].items()},
+            zeros=acc["zeros"],
+        )
+
+    return [
+        {
+            "years_of_experience": years,
+            "count": merged[years]["count"],
+            "avg": merged[years]["sum"] / merged[years]["count"],
+            "percentiles": {
+                f"p{round(p * 100)}": merged[years]["sketch"].quantile(p) for p in percentiles
+            },
+        }
+        for years in sorted(merged)
+        if merged[years]["count"]
+    ]
@@ -0,0 +1,191 @@
+"""Indexed substring search over company names, role titles and cities.
+
+`ilike('%x%')` cannot use the B-tree indexes on the dimension tables, so
+every text filter used to be a sequential scan. This module creates and
+uses a dialect-specific index instead:
+
+- Postgres: pg_trgm GIN indexes. `ILIKE '%x%'` is answered from the
+  index and the `%` similarity operator (pg_trgm.similarity_threshold,
+  0.3 by default) makes matching typo tolerant.
+- SQLite with FTS5: an external-content FTS5 table per column using the
+  trigram tokenizer, kept in sync by triggers. `LIKE '%x%'` against it is
+  served by the trigram index.
+- SQLite without FTS5: an index on `lower(column)` and a prefix match.
+
+If `ensure_search_indexes` has never run against the database, filters
+fall back to the plain `ilike` scan.
+"""
+import logging
+from sqlalchemy import text, select, func, or_, case, table, column
+from src.models.company import Company
+from src.models.location import Location
+from src.models.role import Role
+
+logger = logging.getLogger(__name__)
+
+# kind -> (model, column)
+SEARCH_FIELDS = {
+    "company": (Company, Company.name),
+    "role": (Role, Role.title),
+    "city": (Location, Location.city),
+}
+
+_backends = {}
+
+
+def _backend_key(bind):
+    """Cache key shared by the sync and async engines of one database"""
+    return str(bind.url.set(drivername=bind.dialect.name))
+
+
+def _names(kind):
+    model, col = SEARCH_FIELDS[kind]
+    tablename = model.__tablename__
+    return tablename, col.key, f"{tablename}_{col.key}"
+
+
+def ensure_search_indexes(engine):
+    """Create the search indexes for this engine's dialect (idempotent)"""
+    dialect = engine.dialect.name
+    with engine.begin() as conn:
+        if dialect == "postgresql":
+            try:
+                with conn.begin_nested():
+                    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            except Exception as e:
+                logger.warning("pg_trgm unavailable, text filters will scan: %s", e)
+                _backends.pop(_backend_key(engine), None)
+                return
+            for kind in SEARCH_FIELDS:
+                tablename, col, prefix = _names(kind)
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS ix_{prefix}_trgm "
+                    f"ON {tablename} USING gin ({col} gin_trgm_ops)"
+                ))
+        elif dialect == "sqlite":
+            if _sqlite_has_fts5(conn):
+                for kind in SEARCH_FIELDS:
+                    _create_fts_table(conn, *_names(kind))
+            else:
+                for kind in SEARCH_FIELDS:
+                    tablename, col, prefix = _names(kind)
+                    conn.execute(text(
+                        f"CREATE INDEX IF NOT EXISTS ix_{prefix}_lower "
+                        f"ON {tablename} (lower({col}))"
+                    ))
+    # Detect now rather than on the first filtered request
+    _backends[_backend_key(engine)] = _detect_backend(engine)
+
+
+def _sqlite_has_fts5(conn):
+    options = conn.execute(text("PRAGMA compile_options")).scalars().all()
+    return "ENABLE_FTS5" in options
+
+
+def _create_fts_table(conn, tablename, col, prefix):
+    fts = f"{prefix}_fts"
+    exists = conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": fts}
+    ).first()
+    if exists:
+        return
+    conn.execute(text(
+        f"CREATE VIRTUAL TABLE {fts} USING fts5("
+        f"{col}, content='{tablename}', content_rowid='id', tokenize='trigram')"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {tablename} BEGIN "
+        f"INSERT INTO {fts}(rowid, {col}) VALUES (new.id, new.{col}); END"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {tablename} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {col}) VALUES ('delete', old.id, old.{col}); END"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {col} ON {tablename} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {col}) VALUES ('delete', old.id, old.{col}); "
+        f"INSERT INTO {fts}(rowid, {col}) VALUES (new.id, new.{col}); END"
+    ))
+    conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+
+
+def search_backend(bind):
+    """Which index backs text search on `bind`: trigram, fts5, prefix or scan"""
+    key = _backend_key(bind)
+    if key not in _backends:
+        _backends[key] = _detect_backend(bind)
+    return _backends[key]
+
+
+def _detect_backend(bind):
+    with bind.connect() as conn:
+        if bind.dialect.name == "postgresql":
+            installed = conn.execute(
+                text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            ).first()
+            return "trigram" if installed else "scan"
+        if bind.dialect.name == "sqlite":
+            tablename, col, prefix = _names("company")
+            # Both can exist after a backend change: FTS5 wins
+            found = conn.execute(
+                text("SELECT name FROM sqlite_master WHERE name IN (:fts, :lower) "
+                     "ORDER BY name = :fts DESC"),
+                {"fts": f"{prefix}_fts", "lower": f"ix_{prefix}_lower"}
+            ).scalar()
+            if found == f"{prefix}_fts":
+                return "fts5"
+            if found:
+                return "prefix"
+    return "scan"
+
+
+def text_filter(db, kind, q):
+    """WHERE clause matching `kind` rows whose name contains `q`"""
+    model, col = SEARCH_FIELDS[kind]
+    backend = search_backend(db.get_bind())
+
+    if backend == "trigram":
+        return or_(col.ilike(f"%{q}%"), col.op("%")(q))
+    if backend == "fts5":
+        tablename, colname, prefix = _names(kind)
+        fts = table(f"{prefix}_fts", column("rowid"), column(colname))
+        return model.id.in_(
+            select(fts.c.rowid).where(fts.c[colname].like(f"%{q}%"))
+        )
+    if backend == "prefix":
+        lowered = q.lower()
+        return _prefix_range(func.lower(col), lowered)
+    return col.ilike(f"%{q}%")
+
+
+def _prefix_range(expr, prefix):
+    """Index-friendly `expr LIKE 'prefix%'` as a half-open range"""
+    return (expr >= prefix) & (expr < prefix + "\uffff")
+
+
+def similarity_rank(db, kind, q):
+    """ORDER BY clauses putting the closest names to `q` first"""
+    model, col = SEARCH_FIELDS[kind]
+    if search_backend(db.get_bind()) == "trigram":
+        return [func.similarity(col, q).desc(), func.length(col)]
+    lowered = q.lower()
+    return [
+        case(
+            (func.lower(col) == lowered, 0),
+            (func.lower(col).like(f"{lowered}%"), 1),
+            else_=2
+        ),
+        func.length(col),
+    ]
+
+
+def best_match(db, kind, q):
+    """The single best matching dimension row for `q`, or None"""
+    model, col = SEARCH_FIELDS[kind]
+    return db.execute(
+        select(model)
+        .where(text_filter(db, kind, q))
+        .order_by(*similarity_rank(db, kind, q))
+        .limit(1)
+    ).scalar()
@@ -1,16 +1,30 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Boolean, Index, text
 from sqlalchemy.sql import func
 from src.database.database import Base
 
 class Salary(Base):
     __tablename__ = "salaries"
+    # Composite indexes for the search filters and keyset sorts. Each foreign
+    # key leads one of them, so none needs a single-column index.
+    # Changes here need a migration in migrations/versions.
+    __table_args__ = (
+        Index("ix_salaries_role_location_compensation",
+              "role_id", "location_id", "total_compensation"),
+        Index("ix_salaries_company_experience", "company_id", "years_of_experience",
+              postgresql_include=["total_compensation"]),
+        Index("ix_salaries_location_compensation", "location_id", "total_compensation"),
+        Index("ix_salaries_compensation_id", "total_compensation", "id"),
+        Index("ix_salaries_experience_id", "years_of_experience", "id"),
+        Index("ix_salaries_remote_compensation", "total_compensation", "id",
+              postgresql_where=text("is_remote"), sqlite_where=text("is_remote = 1")),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
     # Foreign Keys
-    company_id = Column(Integer, ForeignKey("companies.id"), nullable=False, index=True)
-    role_id = Column(Integer, ForeignKey("roles.id"), nullable=False, index=True)
-    location_id = Column(Integer, ForeignKey("locations.id"), nullable=False, index=True)
+    company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
+    role_id = Column(Integer, ForeignKey("roles.id"), nullable=False)
+    location_id = Column(Integer, ForeignKey("locations.id"), nullable=False)
     
     # Salary Details
     base_salary = Column(Float, nullable=False)
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Integer, String, Float, Text, ForeignKey, DateTime, UniqueConstraint, Index
+from sqlalchemy.sql import func
+from src.database.database import Base
+
+class SalaryExperienceRollup(Base):
+    """Total compensation sketch per company x role x city x years of experience"""
+    __tablename__ = "salary_experience_rollups"
+    __table_args__ = (
+        UniqueConstraint("company_id", "role_id", "location_id", "years_of_experience",
+                         name="uq_salary_experience_rollups_group"),
+        Index("ix_salary_experience_rollups_role_location", "role_id", "location_id"),
+        Index("ix_salary_experience_rollups_location", "location_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Group key (level is denormalised from the role for filtering)
+    company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
+    role_id = Column(Integer, ForeignKey("roles.id"), nullable=False)
+    location_id = Column(Integer, ForeignKey("locations.id"), nullable=False)
+    years_of_experience = Column(Integer, nullable=False)
+    level = Column(String(50), index=True)
+
+    # Aggregates
+    count = Column(Integer, nullable=False, default=0)
+    sum_compensation = Column(Float, nullable=False, default=0)
+    sketch = Column(Text, nullable=False, default="{}")
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return (f"<SalaryExperienceRollup {self.company_id}/{self.role_id}/{self.location_id}"
+                f" {self.years_of_experience}y n={self.count}>")
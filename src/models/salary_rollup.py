@@ -0,0 +1,31 @@
+from sqlalchemy import Column, Integer, String, Float, Text, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+from src.database.database import Base
+
+class SalaryRollup(Base):
+    """Running aggregates of total compensation per company x role x city"""
+    __tablename__ = "salary_rollups"
+    __table_args__ = (
+        UniqueConstraint("company_id", "role_id", "location_id", name="uq_salary_rollups_group"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Group key (level is denormalised from the role for filtering)
+    company_id = Column(Integer, ForeignKey("companies.id"), nullable=False, index=True)
+    role_id = Column(Integer, ForeignKey("roles.id"), nullable=False, index=True)
+    location_id = Column(Integer, ForeignKey("locations.id"), nullable=False, index=True)
+    level = Column(String(50), index=True)
+
+    # Aggregates
+    count = Column(Integer, nullable=False, default=0)
+    sum_compensation = Column(Float, nullable=False, default=0)
+    sum_squares = Column(Float, nullable=False, default=0)
+    min_compensation = Column(Float)
+    max_compensation = Column(Float)
+    sketch = Column(Text, nullable=False, default="{}")
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<SalaryRollup {self.company_id}/{self.role_id}/{self.location_id} n={self.count}>"
@@ -0,0 +1,43 @@
+"""Fixed-bucket histogram shared by the pool and request metrics."""
+import threading
+from bisect import bisect_left
+
+# Upper bounds in milliseconds
+LATENCY_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def cumulative(self):
+        """[(upper bound, observations <= bound)], ending with +Inf"""
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float("inf"),), self._counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": {
+                ("+Inf" if bound == float("inf") else str(bound)): total
+                for bound, total in self.cumulative()
+            },
+        }
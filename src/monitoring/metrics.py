@@ -0,0 +1,220 @@
+"""Per-request latency and SQL instrumentation.
+
+`track_requests` (HTTP middleware) times every request into a histogram
+per method, route template and status, and opens a `RequestStats` in a
+context variable. Engine hooks installed by `instrument_engine` add each
+statement's count and duration to the current request's stats, so DB time
+and N+1 patterns are attributed to the route that caused them. Totals
+are exposed in Prometheus text format by `render_metrics`, and each
+response carries a `Server-Timing` header with app and DB time.
+"""
+import threading
+import time
+from contextvars import ContextVar
+from fastapi import Request
+from starlette.routing import Match
+from sqlalchemy import event
+from src.monitoring.histogram import Histogram, LATENCY_BUCKETS_MS
+
+# Buckets for statements per request: anything past ~10 is worth a look
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RequestStats:
+    """SQL work done while serving one request"""
+
+    __slots__ = ("statements", "db_ms", "statement_log")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_ms = 0.0
+        self.statement_log = []
+
+
+# Mutable stats object: statements run in worker threads and greenlets see
+# a copy of the context, but the same object
+_current = ContextVar("request_stats", default=None)
+
+
+def current_request_stats():
+    """Stats of the request being served, or None outside a request"""
+    return _current.get()
+
+
+class RouteMetrics:
+    """Latency and SQL histograms per (method, route, status)"""
+
+    def __init__(self):
+        self.latency_ms = {}
+        self.statements = {}
+        self.db_ms = {}
+        self._lock = threading.Lock()
+
+    def observe(self, key, elapsed_ms, stats):
+        if key not in self.latency_ms:
+            with self._lock:
+                if key not in self.latency_ms:
+                    self.statements[key] = Histogram(STATEMENT_BUCKETS)
+                    self.db_ms[key] = Histogram(LATENCY_BUCKETS_MS)
+                    self.latency_ms[key] = Histogram(LATENCY_BUCKETS_MS)
+        self.latency_ms[key].observe(elapsed_ms)
+        self.statements[key].observe(stats.statements)
+        self.db_ms[key].observe(stats.db_ms)
+
+
+route_metrics = RouteMetrics()
+
+
+def instrument_engine(engine):
+    """Attribute every statement run on `engine` to the current request"""
+
+    def _record(statement, start):
+        stats = _current.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.statement_log.append(statement)
+            stats.db_ms += (time.perf_counter() - start) * 1000
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append((context, time.perf_counter()))
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        _, start = conn.info["query_start"].pop()
+        _record(statement, start)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        # A failed statement never reaches after_cursor_execute: drop its
+        # start time, unless it failed before before_cursor_execute ran
+        conn = exception_context.connection
+        pending = conn.info.get("query_start") if conn is not None else None
+        if pending and pending[-1][0] is exception_context.execution_context:
+            _, start = pending.pop()
+            _record(exception_context.statement, start)
+
+
+def matched_route(request):
+    """The app route serving `request`, or None.
+
+    Matched again here rather than read from the scope, since responses
+    such as a 304 from the conditional GET middleware never reach the router.
+    """
+    if "matched_route" not in request.scope:
+        request.scope["matched_route"] = None
+        for route in request.app.router.routes:
+            match, _ = route.matches(request.scope)
+            if match == Match.FULL:
+                request.scope["matched_route"] = route
+                break
+    return request.scope["matched_route"]
+
+
+def _route_template(request):
+    """Path template label, bounding label cardinality"""
+    route = matched_route(request)
+    return route.path if route is not None else UNMATCHED_ROUTE
+
+
+async def track_requests(request: Request, call_next):
+    """Middleware timing requests and adding a Server-Timing header.
+
+    For streamed responses the time runs until the response starts.
+    """
+    stats = RequestStats()
+    token = _current.set(stats)
+    start = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        _current.reset(token)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    route_metrics.observe(
+        (request.method, _route_template(request), str(response.status_code)),
+        elapsed_ms,
+        stats
+    )
+    response.headers["Server-Timing"] = (
+        f'app;dur={elapsed_ms:.1f}, '
+        f'db;dur={stats.db_ms:.1f};desc="{stats.statements} queries"'
+    )
+    return response
+
+
+# ==================== PROMETHEUS EXPOSITION ====================
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _histogram_lines(name, histogram, labels, scale=1.0):
+    """Sample lines of one histogram; `scale` converts units (ms -> s)"""
+    lines = []
+    for bound, total in histogram.cumulative():
+        le = "+Inf" if bound == float("inf") else f"{bound * scale:g}"
+        lines.append(f"{name}_bucket{_labels(**labels, le=le)} {total}")
+    lines.append(f"{name}_sum{_labels(**labels)} {histogram.sum * scale}")
+    lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+    return lines
+
+
+def _family(name, kind, help_text, lines):
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"] + lines
+
+
+def render_metrics(pools=()):
+    """Prometheus text exposition of request, SQL and pool metrics.
+
+    `pools` is an iterable of (label, engine, PoolMetrics).
+    """
+    latency, statements, db_time = [], [], []
+    for key in sorted(route_metrics.latency_ms):
+        method, route, status = key
+        labels = {"method": method, "route": route, "status": status}
+        latency += _histogram_lines(
+            "http_request_duration_seconds", route_metrics.latency_ms[key], labels, 0.001
+        )
+        statements += _histogram_lines(
+            "http_request_db_statements", route_metrics.statements[key], labels
+        )
+        db_time += _histogram_lines(
+            "http_request_db_duration_seconds", route_metrics.db_ms[key], labels, 0.001
+        )
+
+    output = (
+        _family("http_request_duration_seconds", "histogram",
+                "Time to respond to HTTP requests", latency)
+        + _family("http_request_db_statements", "histogram",
+                  "SQL statements executed per HTTP request", statements)
+        + _family("http_request_db_duration_seconds", "histogram",
+                  "Time spent in SQL statements per HTTP request", db_time)
+    )
+
+    checked_out, overflow, waits, timeouts = [], [], [], []
+    for label, engine, metrics in pools:
+        pool = engine.pool
+        labels = {"pool": label}
+        if hasattr(pool, "checkedout"):
+            checked_out.append(f"db_pool_checked_out{_labels(**labels)} {pool.checkedout()}")
+            overflow.append(f"db_pool_overflow{_labels(**labels)} {pool.overflow()}")
+        waits += _histogram_lines("db_pool_checkout_wait_seconds", metrics.wait_ms, labels, 0.001)
+        timeouts.append(f"db_pool_timeouts_total{_labels(**labels)} {metrics.timeouts}")
+
+    output += (
+        _family("db_pool_checked_out", "gauge", "Connections checked out of the pool", checked_out)
+        + _family("db_pool_overflow", "gauge", "Connections open beyond the pool size", overflow)
+        + _family("db_pool_checkout_wait_seconds", "histogram",
+                  "Time waiting for a pooled connection", waits)
+        + _family("db_pool_timeouts_total", "counter", "Pool checkout timeouts", timeouts)
+    )
+    return "\n".join(output) + "\n"
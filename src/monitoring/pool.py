@@ -0,0 +1,79 @@
+"""Connection pool instrumentation.
+
+`instrumented_pool(base)` returns a subclass of a SQLAlchemy queue pool
+that times every checkout (how long a request waited for a connection)
+and counts checkout timeouts into a `PoolMetrics`. `pool_status` reports
+those together with the pool's own occupancy counters.
+"""
+import time
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from src.monitoring.histogram import Histogram
+
+
+class PoolMetrics:
+    """Checkout wait times and connection lifecycle counters for one pool"""
+
+    def __init__(self):
+        self.wait_ms = Histogram()
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+
+    def snapshot(self):
+        return {
+            "wait_ms": self.wait_ms.snapshot(),
+            "timeouts": self.timeouts,
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+        }
+
+
+def instrumented_pool(base, metrics):
+    """Subclass of pool class `base` recording into `metrics`"""
+
+    class InstrumentedPool(base):
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                return super()._do_get()
+            except PoolTimeoutError:
+                metrics.timeouts += 1
+                raise
+            finally:
+                metrics.wait_ms.observe((time.perf_counter() - start) * 1000)
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    return InstrumentedPool
+
+
+def track_connections(engine, metrics):
+    """Count new DBAPI connections and invalidations (stale/pre-ping failures)"""
+
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_connection, record):
+        metrics.connects += 1
+
+    @event.listens_for(engine, "invalidate")
+    def _invalidate(dbapi_connection, record, exception):
+        metrics.invalidations += 1
+
+
+def pool_status(engine, metrics):
+    """Occupancy of `engine`'s pool plus the recorded metrics"""
+    pool = engine.pool
+    status = {"class": type(pool).__name__}
+    for name in ("size", "checkedout", "checkedin", "overflow"):
+        counter = getattr(pool, name, None)
+        if counter is not None:
+            status[name] = counter()
+    max_overflow = getattr(pool, "_max_overflow", None)
+    if max_overflow is not None:
+        status["max_overflow"] = max_overflow
+    timeout = getattr(pool, "_timeout", None)
+    if timeout is not None:
+        status["timeout"] = timeout
+    status["recycle"] = pool._recycle
+    status["pre_ping"] = pool._pre_ping
+    status.update(metrics.snapshot())
+    return status
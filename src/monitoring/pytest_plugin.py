@@ -0,0 +1,32 @@
+"""pytest fixtures for SQL statement budgets.
+
+Load with `pytest -p src.monitoring.pytest_plugin` or
+`pytest_plugins = ["src.monitoring.pytest_plugin"]` in a conftest.py.
+
+    def test_salaries_list(client, query_budget):
+        with query_budget(2):
+            client.get("/api/salaries")
+
+    def test_every_route(client, enforce_statement_budgets):
+        # Any request over its endpoint's @statement_budget now gets a 500
+        assert client.get("/api/companies").status_code == 200
+"""
+import pytest
+from src.monitoring import query_guard
+from src.monitoring.query_guard import QueryGuard, DEFAULT_MAX_REPEATS
+
+
+@pytest.fixture
+def query_budget():
+    """Factory of QueryGuard blocks that fail the test when exceeded"""
+
+    def guard(budget=None, max_repeats=DEFAULT_MAX_REPEATS, engine=None):
+        return QueryGuard(budget, max_repeats, engine=engine, mode="raise")
+
+    return guard
+
+
+@pytest.fixture
+def enforce_statement_budgets(monkeypatch):
+    """Make declared endpoint budgets fail requests instead of logging"""
+    monkeypatch.setattr(query_guard, "QUERY_GUARD", "raise")
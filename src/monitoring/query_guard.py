@@ -0,0 +1,160 @@
+"""Statement budgets and N+1 detection.
+
+Two ways to use it:
+
+* `QueryGuard` is a context manager that records every statement run on
+  the engine inside the block and fails (or logs) when there are more
+  than `budget` of them or one statement shape repeats more than
+  `max_repeats` times, which is what a per-row lookup loop looks like.
+
+      with QueryGuard(budget=2):
+          client.get("/api/salaries")
+
+* Endpoints declare their ceiling with `@statement_budget(n)`. The
+  `enforce_budgets` middleware checks every request against it using the
+  per-request stats collected by `src.monitoring.metrics`. QUERY_GUARD
+  selects what a violation does: "log" (default), "raise" (respond 500
+  with the report, for tests and development) or "off".
+
+The pytest fixtures live in `src.monitoring.pytest_plugin`.
+"""
+import logging
+import os
+import re
+from collections import Counter
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from sqlalchemy import event
+from src.monitoring.metrics import current_request_stats, matched_route
+
+logger = logging.getLogger(__name__)
+
+QUERY_GUARD = os.getenv("QUERY_GUARD", "log").lower()
+
+# The same statement this many times in one request is treated as N+1
+DEFAULT_MAX_REPEATS = 3
+
+
+class QueryBudgetExceeded(AssertionError):
+    """More statements than budgeted, or an N+1 pattern"""
+
+
+# A bind parameter in any DBAPI paramstyle, and a list of them
+_PARAM = r"(?:\?|%s|%\(\w+\)s|:\w+)"
+_PARAM_LIST = re.compile(rf"\(\s*{_PARAM}(?:\s*,\s*{_PARAM})+\s*\)")
+
+
+def statement_shape(statement):
+    """Statement text with expanded IN lists and literals collapsed"""
+    shape = " ".join(statement.split())
+    shape = _PARAM_LIST.sub("(?)", shape)
+    return re.sub(r"\b\d+\b", "N", shape)
+
+
+def check_statements(label, statements, budget=None, max_repeats=DEFAULT_MAX_REPEATS):
+    """Violation messages for a list of executed statement strings"""
+    problems = []
+    if budget is not None and len(statements) > budget:
+        problems.append(f"{label}: {len(statements)} SQL statements, budget is {budget}")
+    if max_repeats is not None:
+        for shape, count in Counter(map(statement_shape, statements)).most_common():
+            if count <= max_repeats:
+                break
+            problems.append(f"{label}: same statement run {count} times (N+1?): {shape[:200]}")
+    return problems
+
+
+def _report(problems, mode):
+    message = "\n".join(problems)
+    if mode == "raise":
+        raise QueryBudgetExceeded(message)
+    if mode == "log":
+        logger.warning(message)
+
+
+class QueryGuard:
+    """Record statements run on `engine` and enforce a budget on exit"""
+
+    def __init__(self, budget=None, max_repeats=DEFAULT_MAX_REPEATS,
+                 engine=None, mode="raise", label="block"):
+        if engine is None:
+            from src.database.database import engine
+        self.engine = engine
+        self.budget = budget
+        self.max_repeats = max_repeats
+        self.mode = mode
+        self.label = label
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+        if exc_type is None:
+            problems = check_statements(self.label, self.statements, self.budget, self.max_repeats)
+            if problems:
+                _report(problems, self.mode)
+        return False
+
+
+def statement_budget(limit, max_repeats=DEFAULT_MAX_REPEATS):
+    """Declare the most SQL statements an endpoint may run per request"""
+
+    def decorate(endpoint):
+        endpoint.statement_budget = (limit, max_repeats)
+        return endpoint
+
+    return decorate
+
+
+async def _checked_after_body(body, label, stats, limit, max_repeats, checked):
+    """Pass a response body through, then check statements it ran itself.
+
+    A streamed body (`stream_rows`) queries while it is being sent, after
+    the status line is out: a violation can no longer become a 500, so in
+    "raise" mode it aborts the response instead.
+    """
+    async for chunk in body:
+        yield chunk
+    if len(stats.statement_log) > checked:
+        problems = check_statements(label, stats.statement_log, limit, max_repeats)
+        if problems:
+            _report(problems, QUERY_GUARD)
+
+
+async def enforce_budgets(request: Request, call_next):
+    """Middleware checking each request against its endpoint's budget.
+
+    Must run inside `track_requests`, whose per-request stats it reads.
+    Statements run while the body is sent are checked once it is done.
+    """
+    response = await call_next(request)
+    stats = current_request_stats()
+    if QUERY_GUARD == "off" or stats is None:
+        return response
+    route = matched_route(request)
+    declared = getattr(getattr(route, "endpoint", None), "statement_budget", None)
+    if declared is None:
+        return response
+
+    limit, max_repeats = declared
+    label = f"{request.method} {request.url.path}"
+    problems = check_statements(label, stats.statement_log, limit, max_repeats)
+    if problems:
+        try:
+            _report(problems, QUERY_GUARD)
+        except QueryBudgetExceeded as e:
+            return JSONResponse({"error": "Query budget exceeded", "detail": str(e)}, status_code=500)
+    response.body_iterator = _checked_after_body(
+        response.body_iterator, label, stats, limit, max_repeats, len(stats.statement_log)
+    )
+    return response
@@ -23,12 +23,14 @@ class SalaryDataGenerator:
         print("📊 Adding companies...")
         added = 0
         
+        existing = {
+            row[0] for row in self.db.query(Company.name).filter(
+                Company.name.in_(self.gen.COMPANIES)
+            )
+        }
+        
         for company_name in self.gen.COMPANIES:
-            existing = self.db.query(Company).filter(
-                Company.name == company_name
-            ).first()
-            
-            if not existing:
+            if company_name not in existing:
                 company = Company(
                     name=company_name,
                     industry="Technology",
@@ -47,12 +49,14 @@ class SalaryDataGenerator:
         print("📍 Adding locations...")
         added = 0
         
+        existing = {
+            row[0] for row in self.db.query(Location.city).filter(
+                Location.city.in_(self.gen.CITIES)
+            )
+        }
+        
         for city in self.gen.CITIES:
-            existing = self.db.query(Location).filter(
-                Location.city == city
-            ).first()
-            
-            if not existing:
+            if city not in existing:
                 location = Location(
                     city=city,
                     state="India",
@@ -70,12 +74,14 @@ class SalaryDataGenerator:
         print("💼 Adding roles...")
         added = 0
         
+        existing = {
+            row[0] for row in self.db.query(Role.title).filter(
+                Role.title.in_(self.gen.ROLES)
+            )
+        }
+        
         for role_title in self.gen.ROLES:
-            existing = self.db.query(Role).filter(
-                Role.title == role_title
-            ).first()
-            
-            if not existing:
+            if role_title not in existing:
                 # Determine level
                 if "Senior" in role_title or "Lead" in role_title:
                     level = "Senior"
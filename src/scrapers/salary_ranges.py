@@ -0,0 +1,189 @@
+"""Salary ranges per company and level, plus bonus/stock mixes.
+
+Ranges are base salary in INR, compiled from AmbitionBox, Glassdoor
+public data and PayScale (2024-25). Shared by the import scripts and the
+synthetic data generators.
+"""
+
+# CORRECT SALARY RANGES (Based on AmbitionBox, Glassdoor public data, PayScale)
+COMPANY_SALARY_RANGES = {
+    # TIER 1: FAANG + Top Product (Google, Meta, Amazon, Microsoft, Apple)
+    "Google India": {
+        "Entry": (1500000, 2500000),    # 15-25 LPA
+        "Mid": (2500000, 5000000),      # 25-50 LPA
+        "Senior": (5000000, 12000000),  # 50-120 LPA
+    },
+    "Amazon India": {
+        "Entry": (1400000, 2200000),    # 14-22 LPA
+        "Mid": (2200000, 4500000),      # 22-45 LPA
+        "Senior": (4500000, 10000000),  # 45-100 LPA
+    },
+    "Microsoft India": {
+        "Entry": (1500000, 2400000),    # 15-24 LPA
+        "Mid": (2400000, 4800000),      # 24-48 LPA
+        "Senior": (4800000, 11000000),  # 48-110 LPA
+    },
+    "Meta India": {
+        "Entry": (1600000, 2600000),    # 16-26 LPA
+        "Mid": (2600000, 5200000),      # 26-52 LPA
+        "Senior": (5200000, 12000000),  # 52-120 LPA
+    },
+    "Apple India": {
+        "Entry": (1400000, 2300000),    # 14-23 LPA
+        "Mid": (2300000, 4600000),      # 23-46 LPA
+        "Senior": (4600000, 10000000),  # 46-100 LPA
+    },
+    
+    # TIER 2: Good Startups/Product (Flipkart, Swiggy, Razorpay, etc)
+    "Flipkart": {
+        "Entry": (900000, 1500000),     # 9-15 LPA
+        "Mid": (1500000, 2800000),      # 15-28 LPA
+        "Senior": (2800000, 5500000),   # 28-55 LPA
+    },
+    "Swiggy": {
+        "Entry": (1000000, 1600000),    # 10-16 LPA
+        "Mid": (1600000, 3000000),      # 16-30 LPA
+        "Senior": (3000000, 6000000),   # 30-60 LPA
+    },
+    "Zomato": {
+        "Entry": (950000, 1550000),     # 9.5-15.5 LPA
+        "Mid": (1550000, 2900000),      # 15.5-29 LPA
+        "Senior": (2900000, 5800000),   # 29-58 LPA
+    },
+    "PhonePe": {
+        "Entry": (1100000, 1700000),    # 11-17 LPA
+        "Mid": (1700000, 3200000),      # 17-32 LPA
+        "Senior": (3200000, 6500000),   # 32-65 LPA
+    },
+    "Razorpay": {
+        "Entry": (1000000, 1650000),    # 10-16.5 LPA
+        "Mid": (1650000, 3100000),      # 16.5-31 LPA
+        "Senior": (3100000, 6200000),   # 31-62 LPA
+    },
+    "CRED": {
+        "Entry": (1200000, 1800000),    # 12-18 LPA
+        "Mid": (1800000, 3500000),      # 18-35 LPA
+        "Senior": (3500000, 7000000),   # 35-70 LPA
+    },
+    "Ola": {
+        "Entry": (850000, 1400000),     # 8.5-14 LPA
+        "Mid": (1400000, 2600000),      # 14-26 LPA
+        "Senior": (2600000, 5200000),   # 26-52 LPA
+    },
+    "Paytm": {
+        "Entry": (800000, 1350000),     # 8-13.5 LPA
+        "Mid": (1350000, 2500000),      # 13.5-25 LPA
+        "Senior": (2500000, 5000000),   # 25-50 LPA
+    },
+    
+    # TIER 3: Mid-level Product/SaaS
+    "Adobe India": {
+        "Entry": (1200000, 2000000),    # 12-20 LPA
+        "Mid": (2000000, 3800000),      # 20-38 LPA
+        "Senior": (3800000, 7500000),   # 38-75 LPA
+    },
+    "Salesforce India": {
+        "Entry": (1100000, 1900000),    # 11-19 LPA
+        "Mid": (1900000, 3600000),      # 19-36 LPA
+        "Senior": (3600000, 7200000),   # 36-72 LPA
+    },
+    "VMware India": {
+        "Entry": (1000000, 1700000),    # 10-17 LPA
+        "Mid": (1700000, 3200000),      # 17-32 LPA
+        "Senior": (3200000, 6500000),   # 32-65 LPA
+    },
+    
+    # TIER 4: Service Companies (TCS, Infosys, Wipro, Capgemini, etc)
+    "TCS": {
+        "Entry": (320000, 450000),      # 3.2-4.5 LPA
+        "Mid": (650000, 1200000),       # 6.5-12 LPA
+        "Senior": (1200000, 2200000),   # 12-22 LPA
+    },
+    "Infosys": {
+        "Entry": (380000, 500000),      # 3.8-5 LPA
+        "Mid": (700000, 1300000),       # 7-13 LPA
+        "Senior": (1300000, 2400000),   # 13-24 LPA
+    },
+    "Wipro": {
+        "Entry": (350000, 480000),      # 3.5-4.8 LPA
+        "Mid": (680000, 1250000),       # 6.8-12.5 LPA
+        "Senior": (1250000, 2300000),   # 12.5-23 LPA
+    },
+    "HCL Technologies": {
+        "Entry": (340000, 470000),      # 3.4-4.7 LPA
+        "Mid": (670000, 1230000),       # 6.7-12.3 LPA
+        "Senior": (1230000, 2250000),   # 12.3-22.5 LPA
+    },
+    "Tech Mahindra": {
+        "Entry": (360000, 490000),      # 3.6-4.9 LPA
+        "Mid": (690000, 1270000),       # 6.9-12.7 LPA
+        "Senior": (1270000, 2350000),   # 12.7-23.5 LPA
+    },
+    "Capgemini": {
+        "Entry": (400000, 550000),      # 4-5.5 LPA ✅ CORRECT NOW!
+        "Mid": (750000, 1350000),       # 7.5-13.5 LPA
+        "Senior": (1350000, 2500000),   # 13.5-25 LPA (NOT 72L!)
+    },
+    "Cognizant": {
+        "Entry": (380000, 520000),      # 3.8-5.2 LPA
+        "Mid": (720000, 1320000),       # 7.2-13.2 LPA
+        "Senior": (1320000, 2450000),   # 13.2-24.5 LPA
+    },
+    "Accenture India": {
+        "Entry": (450000, 600000),      # 4.5-6 LPA
+        "Mid": (800000, 1450000),       # 8-14.5 LPA
+        "Senior": (1450000, 2700000),   # 14.5-27 LPA
+    },
+    "LTI Mindtree": {
+        "Entry": (370000, 510000),      # 3.7-5.1 LPA
+        "Mid": (710000, 1300000),       # 7.1-13 LPA
+        "Senior": (1300000, 2400000),   # 13-24 LPA
+    },
+}
+
+# Used for companies not listed above
+DEFAULT_LEVEL_RANGES = {
+    "Entry": (400000, 600000),
+    "Mid": (800000, 1500000),
+    "Senior": (1500000, 2800000),
+}
+
+# Used for levels missing from a company's ranges
+FALLBACK_RANGE = (500000, 1000000)
+
+FAANG_COMPANIES = ("Google India", "Amazon India", "Microsoft India", "Meta India", "Apple India")
+STARTUP_COMPANIES = ("Flipkart", "Swiggy", "Zomato", "PhonePe", "Razorpay", "CRED")
+SERVICE_COMPANIES = (
+    "TCS", "Infosys", "Wipro", "HCL Technologies", "Capgemini", "Cognizant", "Accenture India"
+)
+
+# (bonus fraction range, stock fraction range) of base salary
+COMPONENT_RANGES = {
+    "faang": ((0.15, 0.25), (0.30, 0.50)),
+    "startup": ((0.10, 0.20), (0.20, 0.35)),
+    "service": ((0.05, 0.12), (0.00, 0.05)),  # Minimal/no stock
+    "other": ((0.10, 0.15), (0.10, 0.20)),
+}
+
+
+def get_salary_range(company_name, level):
+    """Get correct salary range for company and level"""
+    if company_name in COMPANY_SALARY_RANGES:
+        return COMPANY_SALARY_RANGES[company_name].get(level, FALLBACK_RANGE)
+    return DEFAULT_LEVEL_RANGES.get(level, FALLBACK_RANGE)
+
+
+def company_type(company_name):
+    """faang, startup, service or other"""
+    if company_name in FAANG_COMPANIES:
+        return "faang"
+    if company_name in STARTUP_COMPANIES:
+        return "startup"
+    if company_name in SERVICE_COMPANIES:
+        return "service"
+    return "other"
+
+
+def component_ranges(company_name):
+    """(bonus, stock) fraction-of-base ranges for a company"""
+    return COMPONENT_RANGES[company_type(company_name)]
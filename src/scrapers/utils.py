@@ -21,24 +21,27 @@ class DataGenerator:
         "Frontend Developer", "Backend Developer", "Full Stack Developer"
     ]
     
-    @staticmethod
-    def random_salary(level):
+    # Base salary and years of experience per level
+    SALARY_RANGES = {
+        "Entry": (600000, 1500000),
+        "Mid": (1500000, 3500000),
+        "Senior": (3500000, 7000000)
+    }
+    
+    EXPERIENCE_RANGES = {
+        "Entry": (0, 2),
+        "Mid": (3, 7),
+        "Senior": (8, 15)
+    }
+    
+    @classmethod
+    def random_salary(cls, level):
         """Generate random salary based on level"""
-        ranges = {
-            "Entry": (600000, 1500000),
-            "Mid": (1500000, 3500000),
-            "Senior": (3500000, 7000000)
-        }
-        return random.randint(*ranges[level])
+        return random.randint(*cls.SALARY_RANGES[level])
     
-    @staticmethod
-    def random_experience(level):
+    @classmethod
+    def random_experience(cls, level):
         """Generate random experience"""
-        ranges = {
-            "Entry": (0, 2),
-            "Mid": (3, 7),
-            "Senior": (8, 15)
-        }
-        return random.randint(*ranges[level])
+        return random.randint(*cls.EXPERIENCE_RANGES[level])
 
 print("✅ Utils module created")
@@ -0,0 +1,175 @@
+"""Generate large synthetic salary datasets with NumPy.
+
+Salaries are drawn as column arrays, a chunk at a time, from a seeded
+generator: company, role and city popularity follow a Zipf-like law so a
+few groups are hot and most are in the long tail, base salary comes from
+the per-company/level ranges in `salary_ranges` (or the generic
+`DataGenerator` ranges for other companies), and bonus/stock follow the
+company type. Chunks are written through the bulk loader, so fixtures of
+millions of rows take seconds to minutes rather than hours.
+
+    python src/scrapers/vectorized_generator.py --count 10000000 --seed 42
+"""
+import sys
+sys.path.append('.')
+
+import argparse
+import time
+import numpy as np
+from sqlalchemy import select
+from src.database.database import SessionLocal
+from src.database.bulk_load import write_salaries
+from src.database.rollups import rebuild_rollups
+from src.models.company import Company
+from src.models.location import Location
+from src.models.role import Role
+from src.scrapers.salary_ranges import COMPANY_SALARY_RANGES, component_ranges
+from src.scrapers.utils import DataGenerator
+
+LEVELS = ("Entry", "Mid", "Senior")
+DEFAULT_LEVEL = "Mid"
+DEFAULT_CHUNK_SIZE = 200000
+
+# Zipf exponents: 0 is uniform, larger values concentrate on fewer groups
+COMPANY_SKEW = 1.1
+ROLE_SKEW = 0.8
+LOCATION_SKEW = 1.0
+
+REMOTE_SHARE = 0.25
+
+
+def popularity(n, skew, rng):
+    """Zipf weights 1 / rank**skew over n items, ranks in random order"""
+    weights = 1.0 / np.arange(1, n + 1) ** skew
+    rng.shuffle(weights)
+    return weights / weights.sum()
+
+
+class VectorizedSalaryGenerator:
+    """Draw salaries as NumPy column arrays and bulk-write them"""
+
+    def __init__(self, db, seed=None, company_skew=COMPANY_SKEW,
+                 role_skew=ROLE_SKEW, location_skew=LOCATION_SKEW):
+        self.db = db
+        self.rng = np.random.default_rng(seed)
+
+        companies = db.execute(select(Company.id, Company.name).order_by(Company.id)).all()
+        roles = db.execute(select(Role.id, Role.level).order_by(Role.id)).all()
+        locations = db.execute(select(Location.id).order_by(Location.id)).scalars().all()
+        if not companies or not roles or not locations:
+            raise ValueError("Add companies, locations and roles first")
+
+        self.company_ids = np.array([id for id, _ in companies])
+        self.role_ids = np.array([id for id, _ in roles])
+        self.location_ids = np.array(locations)
+        self.role_levels = np.array([
+            LEVELS.index(level if level in LEVELS else DEFAULT_LEVEL) for _, level in roles
+        ])
+
+        # Lookup tables indexed [company, level] and [company]
+        self.base_low = np.empty((len(companies), len(LEVELS)))
+        self.base_high = np.empty((len(companies), len(LEVELS)))
+        for c, (_, name) in enumerate(companies):
+            ranges = COMPANY_SALARY_RANGES.get(name, DataGenerator.SALARY_RANGES)
+            for l, level in enumerate(LEVELS):
+                self.base_low[c, l], self.base_high[c, l] = ranges.get(
+                    level, DataGenerator.SALARY_RANGES[level]
+                )
+        components = [component_ranges(name) for _, name in companies]
+        self.bonus_range = np.array([bonus for bonus, _ in components])
+        self.stock_range = np.array([stock for _, stock in components])
+        self.experience_range = np.array([DataGenerator.EXPERIENCE_RANGES[l] for l in LEVELS])
+
+        self.company_p = popularity(len(companies), company_skew, self.rng)
+        self.role_p = popularity(len(roles), role_skew, self.rng)
+        self.location_p = popularity(len(locations), location_skew, self.rng)
+
+    def columns(self, n):
+        """n salaries as a dict of column arrays"""
+        rng = self.rng
+        company = rng.choice(len(self.company_ids), size=n, p=self.company_p)
+        role = rng.choice(len(self.role_ids), size=n, p=self.role_p)
+        location = rng.choice(len(self.location_ids), size=n, p=self.location_p)
+        level = self.role_levels[role]
+
+        base = np.floor(rng.uniform(self.base_low[company, level], self.base_high[company, level] + 1))
+        bonus_range = self.bonus_range[company]
+        stock_range = self.stock_range[company]
+        bonus = np.floor(base * rng.uniform(bonus_range[:, 0], bonus_range[:, 1]))
+        stock = np.floor(base * rng.uniform(stock_range[:, 0], stock_range[:, 1]))
+
+        experience_range = self.experience_range[level]
+        experience = rng.integers(experience_range[:, 0], experience_range[:, 1] + 1)
+        years_at_company = rng.integers(0, np.minimum(experience, 5) + 1)
+
+        return {
+            "company_id": self.company_ids[company],
+            "role_id": self.role_ids[role],
+            "location_id": self.location_ids[location],
+            "base_salary": base,
+            "bonus": bonus,
+            "stock_options": stock,
+            "total_compensation": base + bonus + stock,
+            "years_of_experience": experience,
+            "years_at_company": years_at_company,
+            "is_remote": rng.random(n) < REMOTE_SHARE,
+        }
+
+    def rows(self, n, source="synthetic_benchmark"):
+        """n salaries as tuples in bulk_load.SALARY_COLUMNS order"""
+        c = self.columns(n)
+        return list(zip(
+            c["company_id"].tolist(), c["role_id"].tolist(), c["location_id"].tolist(),
+            c["base_salary"].tolist(), c["bonus"].tolist(), c["stock_options"].tolist(),
+            c["total_compensation"].tolist(),
+            c["years_of_experience"].tolist(), c["years_at_company"].tolist(),
+            ["Full-time"] * n, c["is_remote"].tolist(), ["INR"] * n, [source] * n, [False] * n,
+        ))
+
+    def generate(self, count, chunk_size=DEFAULT_CHUNK_SIZE, rebuild=True):
+        """Write `count` salaries in one transaction; returns rows/sec"""
+        start = time.perf_counter()
+        written = 0
+        while written < count:
+            n = min(chunk_size, count - written)
+            write_salaries(self.db, self.rows(n))
+            written += n
+            print(f"  ✓ Generated {written} entries...")
+        self.db.commit()
+        seconds = time.perf_counter() - start
+        rate = written / seconds if seconds else 0
+        print(f"✅ Added {written} salary entries in {seconds:.1f}s ({rate:,.0f} rows/sec)")
+        if rebuild:
+            print(f"✅ Rebuilt {rebuild_rollups(self.db)} salary rollup groups")
+        return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic salaries in bulk")
+    parser.add_argument("--count", type=int, default=1000000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--no-rollups", action="store_true", help="Skip the rollup rebuild")
+    parser.add_argument("--with-dimensions", action="store_true",
+                        help="Add the standard companies, locations and roles first")
+    args = parser.parse_args()
+
+    if args.with_dimensions:
+        from src.scrapers.data_generator import SalaryDataGenerator
+        dimensions = SalaryDataGenerator()
+        dimensions.add_companies()
+        dimensions.add_locations()
+        dimensions.add_roles()
+        dimensions.close()
+
+    db = SessionLocal()
+    try:
+        VectorizedSalaryGenerator(db, seed=args.seed).generate(
+            args.count, chunk_size=args.chunk_size, rebuild=not args.no_rollups
+        )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
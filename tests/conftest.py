@@ -0,0 +1,77 @@
+"""Shared fixtures: a small seeded SQLite database and a client for the app."""
+import os
+import random
+import tempfile
+
+# The engines bind to DATABASE_URL when src.database.database is imported
+_workdir = tempfile.mkdtemp(prefix="techsalary-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_workdir, 'test.db')}"
+os.environ["USE_ASYNC_DB"] = "false"
+os.environ["COLUMNAR_STATS"] = "false"
+
+import pytest
+from fastapi.testclient import TestClient
+from src.database.database import Base, engine, SessionLocal
+from src.database.rollups import rebuild_rollups
+from src.models.company import Company
+from src.models.location import Location
+from src.models.role import Role
+from src.models.salary import Salary
+from src.models.salary_rollup import SalaryRollup  # noqa: F401 - registers the table
+from src.models.salary_experience_rollup import SalaryExperienceRollup  # noqa: F401
+
+COMPANIES = ["Google India", "Amazon India", "Flipkart", "Infosys"]
+LOCATIONS = [("Bangalore", "Karnataka"), ("Hyderabad", "Telangana"), ("Pune", "Maharashtra")]
+ROLES = [("Software Engineer", "Entry"), ("SDE-2", "Mid"), ("Senior Software Engineer", "Senior")]
+SALARY_COUNT = 120
+
+
+def seed(db):
+    """Dimension rows plus SALARY_COUNT random salaries, rollups built"""
+    db.add_all([Company(name=name) for name in COMPANIES])
+    db.add_all([Location(city=city, state=state) for city, state in LOCATIONS])
+    db.add_all([Role(title=title, level=level) for title, level in ROLES])
+    db.flush()
+
+    rng = random.Random(42)
+    for _ in range(SALARY_COUNT):
+        base = rng.randint(500000, 5000000)
+        bonus = rng.choice([0, 100000, 250000])
+        db.add(Salary(
+            company_id=rng.randint(1, len(COMPANIES)),
+            role_id=rng.randint(1, len(ROLES)),
+            location_id=rng.randint(1, len(LOCATIONS)),
+            base_salary=base,
+            bonus=bonus,
+            stock_options=0,
+            total_compensation=base + bonus,
+            years_of_experience=rng.randint(0, 12),
+            employment_type="Full-time",
+        ))
+    db.commit()
+    rebuild_rollups(db)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """TestClient with startup hooks run against the seeded database"""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        seed(db)
+    finally:
+        db.close()
+
+    from src.api.main import app
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def db(client):
+    """Session on the seeded database, closed after the test"""
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
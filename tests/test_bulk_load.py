@@ -0,0 +1,18 @@
+from src.database.bulk_load import MalformedRecord, read_records
+
+
+def test_malformed_ndjson_lines_do_not_stop_the_read(tmp_path):
+    path = tmp_path / "salaries.ndjson"
+    path.write_text(
+        '{"company": "Infosys", "base_salary": 900000}\n'
+        '{"company": "Flipkart", "base_salary": \n'
+        "\n"
+        "[1, 2]\n"
+        '{"company": "Google India", "base_salary": 2500000}\n',
+        encoding="utf-8"
+    )
+    records = list(read_records(path))
+    assert [type(r) for r in records] == [dict, MalformedRecord, MalformedRecord, dict]
+    assert records[1].error.startswith("line 2: invalid JSON")
+    assert records[2].error == "line 4: not a JSON object"
+    assert records[3]["company"] == "Google India"
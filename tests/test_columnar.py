@@ -0,0 +1,25 @@
+from sqlalchemy import update
+from src.cache.columnar import ColumnStore
+from src.cache.data_version import data_version
+from src.cache.results import stats_cache
+from src.models.salary import Salary
+
+
+def test_reload_bumps_the_version_only_when_rows_change(client, db):
+    store = ColumnStore()
+    store.load(db)
+    version = data_version()
+    store.load(db)
+    assert data_version() == version
+
+    salary_id, total = db.query(Salary.id, Salary.total_compensation).first()
+    stats_cache.set("key", {"cached": True})
+    db.execute(update(Salary).where(Salary.id == salary_id).values(total_compensation=total + 1))
+    db.commit()
+    try:
+        store.load(db)
+        assert data_version() == version + 1
+        assert stats_cache.get("key") is None
+    finally:
+        db.execute(update(Salary).where(Salary.id == salary_id).values(total_compensation=total))
+        db.commit()
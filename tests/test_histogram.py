@@ -0,0 +1,30 @@
+from types import SimpleNamespace
+from sqlalchemy.dialects import postgresql
+from src.api.stats import salary_histogram, MAX_HISTOGRAM_BINS
+
+
+def test_tiny_bin_width_is_rejected(client):
+    response = client.get("/api/stats/histogram", params={"bin_width": 0.001})
+    assert response.status_code == 200
+    assert "error" in response.json()
+
+    response = client.get("/api/stats/histogram", params={"bin_width": 500000})
+    body = response.json()
+    assert body["total"] > 0
+    assert len(body["counts"]) <= MAX_HISTOGRAM_BINS
+
+
+def test_postgres_casts_bin_numbers_after_the_clamp():
+    # An unclamped bin number can exceed int4 and fail the query on Postgres
+    class Capture:
+        def get_bind(self):
+            return SimpleNamespace(dialect=postgresql.dialect())
+
+        def execute(self, stmt):
+            self.sql = str(stmt.compile(dialect=postgresql.dialect()))
+            return SimpleNamespace(all=lambda: [])
+
+    db = Capture()
+    salary_histogram(db, [], bin_width=0.001)
+    # Every integer cast is of the clamped CASE expression
+    assert db.sql.count("AS INTEGER)") == db.sql.count("CAST(floor(CASE") > 0
@@ -0,0 +1,20 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from src.monitoring import metrics
+
+
+def test_failed_statement_does_not_leak_its_timer():
+    engine = create_engine("sqlite://")
+    metrics.instrument_engine(engine)
+    stats = metrics.RequestStats()
+    token = metrics._current.set(stats)
+    try:
+        with engine.connect() as conn:
+            with pytest.raises(OperationalError):
+                conn.execute(text("SELECT * FROM missing_table"))
+            conn.execute(text("SELECT 1"))
+            assert conn.info["query_start"] == []
+    finally:
+        metrics._current.reset(token)
+    assert stats.statements == 2
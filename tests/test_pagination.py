@@ -0,0 +1,38 @@
+import pytest
+from src.api.pagination import InvalidCursor, decode_cursor, encode_cursor
+
+SORTED = {"sort": "total_compensation", "order": "desc", "limit": 10}
+
+
+def test_cursor_pages_do_not_overlap(client):
+    first = client.get("/api/search/salaries", params=SORTED).json()
+    second = client.get(
+        "/api/search/salaries", params={**SORTED, "after": first["next_cursor"]}
+    ).json()
+    assert len(second["data"]) == 10
+    assert not {row["id"] for row in first["data"]} & {row["id"] for row in second["data"]}
+    assert first["data"][-1]["total_compensation"] >= second["data"][0]["total_compensation"]
+
+
+@pytest.mark.parametrize("sort, value, last_id", [
+    ("total_compensation", "9999999", 10),
+    ("total_compensation", True, 10),
+    ("total_compensation", None, 10),
+    ("years_of_experience", 2.5, 10),
+    ("years_of_experience", [3], 10),
+    ("id", 10, True),
+    ("id", "10", 10),
+])
+def test_tampered_cursor_is_rejected(client, sort, value, last_id):
+    token = encode_cursor(sort, value, last_id)
+    with pytest.raises(InvalidCursor):
+        decode_cursor(token, sort)
+
+    response = client.get("/api/search/salaries", params={"sort": sort, "after": token})
+    assert response.status_code == 200
+    assert "error" in response.json()
+
+
+def test_cursor_for_another_sort_is_rejected():
+    with pytest.raises(InvalidCursor, match="sort order"):
+        decode_cursor(encode_cursor("id", 10, 10), "total_compensation")
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from src.database.rollups import QuantileSketch, ROLLUP_PERCENTILES
+from tests.conftest import COMPANIES
+
+
+@pytest.mark.parametrize("values", [
+    [1200000],
+    [666901, 4533099],
+    [900000, 2000000, 4100000],
+])
+def test_small_sketch_matches_percentile_cont(values):
+    sketch = QuantileSketch()
+    for value in values:
+        sketch.add(value)
+    for q in ROLLUP_PERCENTILES:
+        # np.percentile's default "linear" method is percentile_cont
+        assert sketch.quantile(q) == pytest.approx(np.percentile(values, q * 100), rel=sketch.alpha)
+
+
+def test_empty_sketch():
+    assert QuantileSketch().quantile(0.5) is None
+
+
+def test_experience_curve_of_a_small_year_group(client):
+    # Year 25 is outside the seeded 0-12, so these three are the whole group
+    values = [900000, 2000000, 4100000]
+    for value in values:
+        response = client.post("/api/salaries/submit", json={
+            "company_id": 2, "role_id": 2, "location_id": 2,
+            "base_salary": value, "total_compensation": value, "years_of_experience": 25,
+        })
+        assert response.status_code == 200
+
+    response = client.get("/api/stats/experience-curve", params={"company": COMPANIES[1]})
+    point, = [p for p in response.json()["data"] if p["years_of_experience"] == 25]
+    assert point["count"] == 3
+    assert point["p25"] == pytest.approx(1450000, rel=0.01)
+    assert point["p50"] == pytest.approx(2000000, rel=0.01)
+    assert point["p75"] == pytest.approx(3050000, rel=0.01)
@@ -0,0 +1,93 @@
+"""Requests stay within their endpoints' declared statement budgets."""
+import json
+import pytest
+from src.api import main
+from src.api.main import stream_salaries
+from src.api.streaming import stream_rows
+from src.monitoring.query_guard import QueryBudgetExceeded
+from tests.conftest import COMPANIES, SALARY_COUNT
+
+
+def salary(company_id=1, role_id=1, location_id=1, base=1200000):
+    return {
+        "company_id": company_id,
+        "role_id": role_id,
+        "location_id": location_id,
+        "base_salary": base,
+        "total_compensation": base,
+        "years_of_experience": 3,
+    }
+
+
+def test_salary_list(client, enforce_statement_budgets, query_budget):
+    with query_budget(1):
+        response = client.get("/api/salaries")
+    assert response.status_code == 200
+    assert response.json()["total"] >= SALARY_COUNT
+
+    with query_budget(2):
+        response = client.get("/api/salaries", params={"limit": 10})
+    assert len(response.json()["data"]) == 10
+
+
+@pytest.mark.parametrize("params", [
+    {"company": "Flipkart", "limit": 20},
+    {"city": "Pune", "min_experience": 2, "sort": "total_compensation", "order": "desc"},
+    {"role": "SDE", "total": "estimate"},
+    {"min_salary": 1000000, "facets": "true"},
+])
+def test_search(client, enforce_statement_budgets, params):
+    response = client.get("/api/search/salaries", params=params)
+    assert response.status_code == 200
+    assert "error" not in response.json()
+
+
+@pytest.mark.parametrize("params", [{}, {"limit": 5}])
+def test_by_company(client, enforce_statement_budgets, params):
+    response = client.get(f"/api/salaries/by-company/{COMPANIES[0]}", params=params)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["company"] == COMPANIES[0]
+    assert body["data"]
+
+
+def test_submit(client, enforce_statement_budgets):
+    # A new rollup group (years of experience 40) and an existing one
+    for years in (40, 40):
+        response = client.post("/api/salaries/submit", json={**salary(), "years_of_experience": years})
+        assert response.status_code == 200
+        assert response.json()["id"]
+
+
+@pytest.mark.parametrize("size", [1, 200])
+def test_submit_batch(client, enforce_statement_budgets, size):
+    items = [salary(i % 4 + 1, i % 3 + 1, i % 3 + 1, 1000000 + i) for i in range(size)]
+    response = client.post("/api/salaries/submit/batch", json=items)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["created"] == size
+    assert len({result["id"] for result in body["results"]}) == size
+
+
+@pytest.mark.parametrize("fmt", ["ndjson", "json"])
+def test_stream(client, enforce_statement_budgets, fmt):
+    response = client.get("/api/salaries/stream", params={"format": fmt})
+    assert response.status_code == 200
+    if fmt == "json":
+        rows = json.loads(response.text)
+    else:
+        rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) >= SALARY_COUNT
+
+
+def test_stream_budget_is_checked_after_the_body(client, enforce_statement_budgets, monkeypatch):
+    # The stream's query can race the check on the response; an empty first
+    # chunk holds it back until the body is being sent
+    def deferred_stream_rows(*args):
+        yield ""
+        yield from stream_rows(*args)
+
+    monkeypatch.setattr(main, "stream_rows", deferred_stream_rows)
+    monkeypatch.setattr(stream_salaries, "statement_budget", (0, 3))
+    with pytest.raises(QueryBudgetExceeded):
+        client.get("/api/salaries/stream")
@@ -0,0 +1,30 @@
+from src.cache.data_version import bump_data_version
+from src.database.rollups import rebuild_rollups
+from src.models.salary_rollup import SalaryRollup
+from tests.conftest import COMPANIES
+
+
+def test_summary_within_budget(client, enforce_statement_budgets):
+    response = client.get("/api/stats/summary")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total_companies"] == len(COMPANIES)
+    assert body["total_salaries"] > 0
+    assert body["median_salary"] is not None
+
+
+def test_summary_with_empty_rollups(client, db, enforce_statement_budgets):
+    # A fresh migration leaves the rollup table empty until it is rebuilt
+    db.query(SalaryRollup).delete()
+    db.commit()
+    bump_data_version()
+    try:
+        response = client.get("/api/stats/summary")
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total_companies"] == len(COMPANIES)
+        assert body["total_salaries"] == 0
+        assert body["median_salary"] is None
+    finally:
+        rebuild_rollups(db)
+        bump_data_version()